@@ -0,0 +1,332 @@
+"""
+Algorithm: Content-Defined Chunking (Rabin fingerprint, LBFS style)
+Time Complexity: O(n) - one rolling hash update per byte
+Space Complexity: O(block_size + max_size)
+Category: Compression & Encoding
+
+Description:
+    Deduplicating backups split files into chunks and store each distinct
+    chunk once, keyed by a strong digest. Fixed-size chunks break down as
+    soon as a byte is inserted: every later chunk boundary shifts and
+    nothing dedupes any more.
+
+    Content-defined chunking places boundaries where the *content* says so.
+    A Rabin-Karp rolling hash (fingerprint) of the last `window` bytes is
+    computed at every position, and a chunk ends wherever
+
+        fingerprint & mask == 0        (mask = avg_size - 1)
+
+    An insertion only moves the boundaries next to it; further on, the same
+    windows produce the same fingerprints and the chunks line up again.
+    min_size stops tiny chunks (all-zero data would otherwise cut at every
+    byte), max_size caps chunks on content that happens not to match.
+
+    Because min_size >= window, the window at any allowed cut lies inside
+    the current chunk, so fingerprints can be computed for a whole buffer at
+    once and cuts picked afterwards. That is the vectorized fast path: NumPy
+    computes every window fingerprint with the doubling trick
+    H2L[i] = HL[i] * base^L + HL[i+L], and only candidate cuts reach Python.
+
+    Expected chunk length is about min_size + avg_size.
+
+Use Cases:
+    - Deduplicating backup tools (restic, borg, LBFS)
+    - rsync-like delta transfer, content-addressed storage
+    - Detecting shared regions between file versions
+"""
+
+import hashlib
+import mmap
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:   # optional: the pure Python rolling loop is used instead
+    np = None
+
+PRIME = (1 << 31) - 1   # products of two residues fit in uint64 for the NumPy path
+BASE = 69_069           # odd multiplier; a power of two would only rotate bits mod 2^31 - 1
+
+
+class ContentDefinedChunker:
+    def __init__(self, min_size=2048, avg_size=8192, max_size=65536, window=48,
+                 digest="sha256", block_size=1 << 22, use_numpy=True):
+        """
+        Args:
+            min_size: No cut before this many bytes (must be >= window)
+            avg_size: Power of two, cut probability per position is 1 / avg_size
+            max_size: Forced cut after this many bytes
+            window: Bytes covered by the rolling fingerprint
+            digest: hashlib algorithm name for the strong chunk digest
+            block_size: Bytes read / fingerprinted per step
+            use_numpy: Use the vectorized fingerprint path when NumPy is installed
+        """
+        if avg_size & (avg_size - 1):
+            raise ValueError(f"avg_size must be a power of two, got {avg_size}")
+        if not window <= min_size <= max_size:
+            raise ValueError("need window <= min_size <= max_size")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.mask = avg_size - 1
+        self.window = window
+        self.digest = digest
+        self.block_size = max(block_size, max_size)
+        self.use_numpy = use_numpy and np is not None
+
+    def chunks(self, source):
+        """
+        Split a byte stream into content-defined chunks
+
+        Args:
+            source: bytes-like / mmap, a binary file object, or an iterable of bytes chunks
+
+        Yields:
+            (offset, length, digest bytes) per chunk, covering the stream in order
+
+        Time: O(n)
+        Space: O(block_size + max_size)
+        """
+        offset = 0
+        leftover = b""   # bytes after the last cut, not yet emitted
+        blocks = self._blocks(source)
+        eof = False
+        while not eof:
+            block = next(blocks, None)
+            eof = block is None
+            buffer = leftover + bytes(block) if block is not None else leftover
+            if not buffer:
+                break
+            start = 0
+            for end in self._cuts(buffer, eof):
+                yield offset, end - start, hashlib.new(self.digest, buffer[start:end]).digest()
+                offset += end - start
+                start = end
+            leftover = buffer[start:]
+
+    def _cuts(self, buffer, eof):
+        """
+        Chunk ends in buffer (which starts at a chunk start), in order
+
+        Without eof the trailing partial chunk is left for the next buffer.
+        """
+        candidates = self._candidates(buffer)
+        n, start = len(buffer), 0
+        while True:
+            i = bisect_left(candidates, start + self.min_size)
+            end = candidates[i] if i < len(candidates) else n + 1
+            end = min(end, start + self.max_size)
+            if end > n:
+                if eof and start < n:
+                    yield n
+                return
+            yield end
+            start = end
+
+    def _candidates(self, buffer):
+        """Sorted ends e with fingerprint(buffer[e-window:e]) & mask == 0"""
+        w = self.window
+        if len(buffer) < w:
+            return []
+        if self.use_numpy:
+            fingerprints = _window_fingerprints(buffer, w)
+            return (np.flatnonzero((fingerprints & np.uint64(self.mask)) == 0) + w).tolist()
+
+        mask, h = self.mask, pow(BASE, w - 1, PRIME)
+        fingerprint = 0
+        for i in range(w):
+            fingerprint = (fingerprint * BASE + buffer[i]) % PRIME
+        result = [w] if not fingerprint & mask else []
+        for i in range(w, len(buffer)):
+            fingerprint = ((fingerprint - buffer[i - w] * h) * BASE + buffer[i]) % PRIME
+            if not fingerprint & mask:
+                result.append(i + 1)
+        return result
+
+    def _blocks(self, source):
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            view = memoryview(source)
+            for i in range(0, len(view), self.block_size):
+                yield view[i:i + self.block_size]
+        elif hasattr(source, "read"):
+            while True:
+                block = source.read(self.block_size)
+                if not block:
+                    return
+                yield block
+        else:
+            # coalesce small writes: each block costs a copy of the carried tail
+            pending, size = [], 0
+            for piece in source:
+                pending.append(piece)
+                size += len(piece)
+                if size >= self.block_size:
+                    yield b"".join(pending)
+                    pending, size = [], 0
+            if pending:
+                yield b"".join(pending)
+
+
+def _window_fingerprints(buffer, w):
+    """
+    Fingerprint of every length-w window of buffer, vectorized
+
+    Blocks of length 1, 2, 4, ... by doubling, chained per bit of w
+    (same scheme as window_hashes in the Rabin-Karp module).
+    """
+    codes = np.frombuffer(buffer, dtype=np.uint8).astype(np.uint64)
+    n, modulus = len(codes), np.uint64(PRIME)
+
+    def combine(left, left_len, right, right_len):
+        count = n - (left_len + right_len) + 1
+        out = left[:count] * np.uint64(pow(BASE, right_len, PRIME))
+        out += right[left_len:left_len + count]
+        return np.remainder(out, modulus, out=out)
+
+    block, block_len = codes, 1
+    result, result_len = None, 0
+    while True:
+        if w & 1:
+            if result is None:
+                result, result_len = block, block_len
+            else:
+                result = combine(result, result_len, block, block_len)
+                result_len += block_len
+        w >>= 1
+        if not w:
+            return result
+        block = combine(block, block_len, block, block_len)
+        block_len *= 2
+
+
+def dedupe_ratio(chunk_lists):
+    """
+    Stored bytes / input bytes when every distinct digest is stored once
+
+    Args:
+        chunk_lists: iterables of (offset, length, digest), e.g. one per file version
+    """
+    total, stored, seen = 0, 0, set()
+    for chunks in chunk_lists:
+        for _, length, digest in chunks:
+            total += length
+            if digest not in seen:
+                seen.add(digest)
+                stored += length
+    return stored / total if total else 1.0
+
+
+def benchmark(size_mb=32, python_mb=4, seed=5):
+    """
+    Throughput (MB/s) of the NumPy vs pure Python fingerprint path, and
+    dedupe ratio of CDC vs fixed-size chunks on a file with small edits
+    """
+    import os
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(seed)
+    data = rng.randbytes(size_mb * 2**20)
+    path = os.path.join(tempfile.mkdtemp(), "data.bin")
+    with open(path, "wb") as f:
+        f.write(data)
+
+    print(f"\nBenchmark: chunking a {size_mb} MB file (avg 8 KiB chunks, sha256 included)")
+    runs = [("pure Python", False, python_mb)]   # only a prefix: ~2 MB/s
+    if np is not None:
+        runs.append(("numpy", True, size_mb))
+    for name, use_numpy, mb in runs:
+        chunker = ContentDefinedChunker(use_numpy=use_numpy)
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            count = sum(1 for _ in chunker.chunks(f.read(mb * 2**20) if mb != size_mb else f))
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<12} {mb / elapsed:>8.1f} MB/s  ({count:,} chunks over {mb} MB, "
+              f"mean {mb * 2**20 / count:,.0f} B)")
+    os.remove(path)
+
+    # version 2 = version 1 with 20 small insertions and deletions
+    v1 = bytearray(data[:4 * 2**20])
+    v2 = bytearray(v1)
+    for _ in range(20):
+        at = rng.randrange(len(v2))
+        if rng.random() < 0.5:
+            v2[at:at] = rng.randbytes(rng.randint(1, 100))
+        else:
+            del v2[at:at + rng.randint(1, 100)]
+    chunker = ContentDefinedChunker()
+    fixed = lambda buf: [(i, len(buf[i:i + 8192]), hashlib.sha256(buf[i:i + 8192]).digest())
+                         for i in range(0, len(buf), 8192)]
+    print("  dedupe ratio of two 4 MB versions with 20 edits (stored / input, 0.5 = perfect):")
+    print(f"    fixed 8 KiB chunks:  {dedupe_ratio([fixed(v1), fixed(v2)]):.3f}")
+    print(f"    content-defined:     {dedupe_ratio([chunker.chunks(bytes(v1)), chunker.chunks(bytes(v2))]):.3f}")
+
+
+if __name__ == "__main__":
+    import io
+    import random
+
+    rng = random.Random(0)
+
+    def check(chunks, data, chunker):
+        assert b"".join(data[o:o + n] for o, n, _ in chunks) == data
+        assert [o for o, _, _ in chunks] == [sum(n for _, n, _ in chunks[:i]) for i in range(len(chunks))]
+        for i, (o, n, d) in enumerate(chunks):
+            assert d == hashlib.sha256(data[o:o + n]).digest()
+            assert n <= chunker.max_size
+            assert n >= chunker.min_size or i == len(chunks) - 1
+
+    # Test 1: Chunks tile the input, respect min / max, digests are correct
+    print("Test 1: Chunks cover the stream and respect min/max")
+    chunker = ContentDefinedChunker(min_size=64, avg_size=256, max_size=1024, window=16, block_size=1)
+    for size in (0, 1, 63, 64, 1000, 50_000):
+        data = rng.randbytes(size)
+        check(list(chunker.chunks(data)), data, chunker)
+    zeros = bytes(10_000)   # every window fingerprints to 0: a cut at each min_size
+    check(list(chunker.chunks(zeros)), zeros, chunker)
+    print("✓ Passed")
+
+    # Test 2: Same cuts whatever the source or block boundaries
+    print("\nTest 2: Cuts independent of source type and block size")
+    data = rng.randbytes(200_000)
+    expected = list(ContentDefinedChunker(min_size=512, avg_size=1024, max_size=8192).chunks(data))
+    for block_size in (1, 777, 65536):
+        chunker = ContentDefinedChunker(min_size=512, avg_size=1024, max_size=8192, block_size=block_size)
+        assert list(chunker.chunks(io.BytesIO(data))) == expected
+        pieces = [data[i:i + 3001] for i in range(0, len(data), 3001)]
+        assert list(chunker.chunks(pieces)) == expected
+    chunker = ContentDefinedChunker(min_size=512, avg_size=1024, max_size=8192, block_size=65536)
+    tiny = [data[i:i + 7] for i in range(0, len(data), 7)]
+    assert list(chunker.chunks(iter(tiny))) == expected
+    blocks = list(chunker._blocks(iter(tiny)))   # small writes are coalesced into full blocks
+    assert b"".join(blocks) == data and all(len(b) >= chunker.block_size for b in blocks[:-1])
+    print("✓ Passed")
+
+    # Test 3: Pure Python and NumPy fingerprints agree
+    print("\nTest 3: Pure Python path matches the vectorized path")
+    slow = ContentDefinedChunker(min_size=512, avg_size=1024, max_size=8192, use_numpy=False)
+    assert list(slow.chunks(data)) == expected
+    print("✓ Passed")
+
+    # Test 4: An insertion only disturbs nearby chunks
+    print("\nTest 4: Insertion resynchronises")
+    chunker = ContentDefinedChunker(min_size=512, avg_size=1024, max_size=8192)
+    edited = data[:100_000] + b"inserted!" + data[100_000:]
+    before = {d for _, _, d in chunker.chunks(data)}
+    after = [d for _, _, d in chunker.chunks(edited)]
+    changed = sum(d not in before for d in after)
+    assert 1 <= changed <= 3, changed
+    print(f"✓ Passed ({changed} of {len(after)} chunks changed)")
+
+    # Test 5: Bad parameters
+    print("\nTest 5: Parameter validation")
+    for kwargs in ({"avg_size": 1000}, {"min_size": 16, "window": 48}, {"min_size": 9000, "max_size": 8192}):
+        try:
+            ContentDefinedChunker(**kwargs)
+            assert False, kwargs
+        except ValueError:
+            pass
+    print("✓ Passed")
+
+    print("\nAll tests passed!")
+    benchmark()
@@ -0,0 +1,357 @@
+"""
+Algorithm: Aho-Corasick (multi-pattern streaming matcher)
+Time Complexity:
+    - Build: O(total pattern length x alphabet) for the compiled table,
+      O(total pattern length) for failure links
+    - Match: O(n + z) where n = text length, z = number of matches
+    - Space: O(total pattern length) nodes, O(states x alphabet) compiled
+Category: String Algorithms / Pattern Matching
+
+Description:
+    A Trie of all patterns plus two extra links per node:
+
+    - fail: longest proper suffix of the node's string that is also a
+      prefix in the trie (KMP failure function generalised to a trie)
+    - output_link: nearest node on the fail chain where a pattern ends,
+      so reporting all matches at a position skips non-matching states
+
+    Failure links are set with BFS: a node's fail target is found by
+    following the parent's fail chain until a node has the same edge.
+
+    The scanner keeps one state between calls, so text can be fed one
+    character or one chunk at a time (log streams, #1032 Stream of
+    Characters) and matches that straddle chunks are still reported with
+    their absolute offset.
+
+    compile() turns the automaton into a DFA: every (state, char) transition
+    is precomputed into a flat array, so the scan loop has no failure-link
+    walking at all - one table lookup per character.
+
+    patterns: "he", "she", "his", "hers"
+
+        root ─h─ 1 ─e─ 2* ─r─ 8 ─s─ 9*
+          │      └─i─ 6 ─s─ 7*
+          └─s─ 3 ─h─ 4 ─e─ 5*      fail(5) = 2 ("he"), so "she" also reports "he"
+
+Use Cases:
+    - Scanning logs for thousands of keywords at once
+    - Intrusion detection signatures (Snort-style)
+    - Content filtering / dictionary-based tokenizers
+    - DNA motif search
+
+LeetCode Problems:
+    - Problem #1032: Stream of Characters
+    - Problem #1408: String Matching in an Array
+    - Problem #616: Add Bold Tag in String
+"""
+
+from array import array
+from collections import deque
+
+from trie import Trie, TrieNode
+
+
+class ACNode(TrieNode):
+    def __init__(self):
+        super().__init__()
+        self.pattern = None      # pattern ending exactly here
+        self.fail = None
+        self.output_link = None  # nearest fail-chain node with a pattern
+
+
+class AhoCorasick(Trie):
+    def __init__(self, patterns=()):
+        self.root = ACNode()
+        self._built = False
+        self.position = 0        # characters consumed by feed()
+        self._state = self.root
+        for pattern in patterns:
+            self.insert(pattern)
+
+    def insert(self, word):
+        """
+        Add a pattern (iterative, so long patterns are fine)
+
+        Time: O(m)
+        """
+        if not word:
+            raise ValueError("empty pattern")
+        path = [self.root]
+        for ch in word:
+            if ch not in path[-1].children:
+                path[-1].children[ch] = ACNode()
+            path.append(path[-1].children[ch])
+        node = path[-1]
+        if not node.is_end_of_word:
+            for path_node in path:
+                path_node.word_count += 1
+        node.is_end_of_word = True
+        node.pattern = word
+        self._built = False
+
+    def build(self):
+        """
+        Set fail and output links with BFS from the root
+
+        Time: O(total pattern length x fail chain steps)
+        """
+        root = self.root
+        root.fail = root
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            child.output_link = None
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in node.children.items():
+                fail = node.fail
+                while fail is not root and ch not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children[ch] if ch in fail.children else root
+                child.output_link = child.fail if child.fail.pattern is not None else child.fail.output_link
+                queue.append(child)
+
+        self._built = True
+        self.reset()
+
+    def reset(self):
+        """Forget stream state (start matching a new stream)"""
+        self._state = self.root
+        self.position = 0
+
+    def feed(self, chunk):
+        """
+        Consume the next chunk of the stream
+
+        Args:
+            chunk: str of any length (a single character works too)
+
+        Yields:
+            (pattern, offset) for every match ending inside this chunk,
+            offset = absolute start index in the stream
+
+        Time: O(len(chunk) + matches)
+        """
+        if not self._built:
+            self.build()
+        root = self.root
+        node = self._state
+        pos = self.position
+        for ch in chunk:
+            while node is not root and ch not in node.children:
+                node = node.fail
+            node = node.children.get(ch, root)
+            pos += 1
+
+            out = node if node.pattern is not None else node.output_link
+            while out is not None:
+                yield out.pattern, pos - len(out.pattern)
+                out = out.output_link
+            # save progress per character so a partially consumed generator stays consistent
+            self._state = node
+            self.position = pos
+
+    def find_all(self, text):
+        """
+        All (pattern, offset) matches in text, one linear pass
+
+        Does not disturb the feed() stream state.
+        """
+        state, position = self._state, self.position
+        self.reset()
+        try:
+            return list(self.feed(text))
+        finally:
+            self._state, self.position = state, position
+
+    def compile(self):
+        """
+        Flatten the automaton into a DFA transition table
+
+        Returns: CompiledAhoCorasick
+        """
+        if not self._built:
+            self.build()
+
+        # BFS numbering, state 0 = root
+        states = [self.root]
+        index = {id(self.root): 0}
+        alphabet = set()
+        for node in states:
+            for ch, child in node.children.items():
+                alphabet.add(ch)
+                index[id(child)] = len(states)
+                states.append(child)
+
+        # column 0 = any character that appears in no pattern (always -> root)
+        columns = {ch: col for col, ch in enumerate(sorted(alphabet), start=1)}
+        width = len(columns) + 1
+        table = array('l', [0]) * (len(states) * width)
+
+        # children of a state are numbered after it, so BFS order lets every
+        # state copy its fail state's (already complete) row
+        outputs = []
+        for s, node in enumerate(states):
+            row = s * width
+            if s:
+                fail_row = index[id(node.fail)] * width
+                table[row:row + width] = table[fail_row:fail_row + width]
+            for ch, child in node.children.items():
+                table[row + columns[ch]] = index[id(child)]
+
+            patterns = []
+            out = node if node.pattern is not None else node.output_link
+            while out is not None:
+                patterns.append(out.pattern)
+                out = out.output_link
+            outputs.append(tuple(patterns))
+
+        return CompiledAhoCorasick(table, width, columns, outputs)
+
+
+class CompiledAhoCorasick:
+    """
+    DFA form of an AhoCorasick automaton: one array lookup per character
+    """
+    def __init__(self, table, width, columns, outputs):
+        self.table = table
+        self.width = width
+        self.columns = columns
+        self.outputs = outputs
+        self.reset()
+
+    def reset(self):
+        self.state = 0
+        self.position = 0
+
+    def feed(self, chunk):
+        """
+        Same contract as AhoCorasick.feed: yields (pattern, absolute offset)
+        """
+        table, width, outputs = self.table, self.width, self.outputs
+        column = self.columns.get
+        state, pos = self.state, self.position
+        for ch in chunk:
+            state = table[state * width + column(ch, 0)]
+            pos += 1
+            if outputs[state]:
+                self.state, self.position = state, pos
+                for pattern in outputs[state]:
+                    yield pattern, pos - len(pattern)
+        self.state, self.position = state, pos
+
+    def find_all(self, text):
+        state, position = self.state, self.position
+        self.reset()
+        try:
+            return list(self.feed(text))
+        finally:
+            self.state, self.position = state, position
+
+
+def benchmark(num_patterns=2000, text_len=500_000, seed=11):
+    """
+    N str.find passes vs one Aho-Corasick pass (node walk and compiled DFA)
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    alphabet = 'abcdefghij '
+    patterns = list({''.join(rng.choices(alphabet[:-1], k=rng.randint(4, 8))) for _ in range(num_patterns)})
+    text = ''.join(rng.choices(alphabet, k=text_len))
+
+    def naive():
+        matches = []
+        for p in patterns:
+            i = text.find(p)
+            while i != -1:
+                matches.append((p, i))
+                i = text.find(p, i + 1)
+        return matches
+
+    ac = AhoCorasick(patterns)
+    ac.build()
+    compiled = ac.compile()
+
+    print(f"\nBenchmark: {len(patterns):,} patterns over {text_len:,} chars")
+    results = {}
+    for name, fn in (("N x str.find", naive), ("AhoCorasick", lambda: ac.find_all(text)),
+                     ("compiled DFA", lambda: compiled.find_all(text))):
+        start = time.perf_counter()
+        results[name] = sorted(fn())
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<13} {elapsed * 1000:>9.1f} ms  {text_len / elapsed / 1e6:>6.2f} M chars/s")
+    assert results["AhoCorasick"] == results["compiled DFA"] == results["N x str.find"]
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    def brute_force(patterns, text):
+        return sorted((p, i) for p in set(patterns) for i in range(len(text) - len(p) + 1)
+                      if text.startswith(p, i))
+
+    # Test 1: Classic example
+    print("Test 1: he / she / his / hers")
+    patterns = ["he", "she", "his", "hers"]
+    ac = AhoCorasick(patterns)
+    expected = [("he", 2), ("hers", 2), ("she", 1)]
+    assert sorted(ac.find_all("ushers")) == expected
+    assert sorted(ac.compile().find_all("ushers")) == expected
+    print("✓ Passed")
+
+    # Test 2: Streaming one character at a time (#1032)
+    print("\nTest 2: Stream of characters")
+    ac = AhoCorasick(["cd", "f", "kl"])
+    stream = "abcdefghijkl"
+    hits = [bool(list(ac.feed(ch))) for ch in stream]
+    assert hits == [False, False, False, True, False, True, False, False, False, False, False, True]
+    print("✓ Passed")
+
+    # Test 3: Matches that straddle chunk boundaries
+    print("\nTest 3: Chunked stream")
+    patterns = ["error", "err", "timeout", "or"]
+    text = "xx error yy timeout error"
+    for matcher in (AhoCorasick(patterns), AhoCorasick(patterns).compile()):
+        got = []
+        for i in range(0, len(text), 3):
+            got.extend(matcher.feed(text[i:i + 3]))
+        assert sorted(got) == brute_force(patterns, text)
+    print("✓ Passed")
+
+    # Test 4: Still a Trie
+    print("\nTest 4: Trie API")
+    ac = AhoCorasick(["apple", "app"])
+    assert ac.search("app") == True
+    assert ac.search("appl") == False
+    assert ac.starts_with("appl") == True
+    ac.insert("app")
+    assert ac.count_prefix("ap") == 2
+    print("✓ Passed")
+
+    # Test 5: Adding patterns after matching rebuilds
+    print("\nTest 5: Insert after build")
+    ac = AhoCorasick(["ab"])
+    assert ac.find_all("abc") == [("ab", 0)]
+    ac.insert("bc")
+    assert sorted(ac.find_all("abc")) == [("ab", 0), ("bc", 1)]
+    print("✓ Passed")
+
+    # Test 6: Randomized against brute force
+    print("\nTest 6: Randomized against brute force")
+    rng = random.Random(5)
+    for _ in range(200):
+        patterns = [''.join(rng.choices('ab', k=rng.randint(1, 5))) for _ in range(rng.randint(1, 8))]
+        text = ''.join(rng.choices('abc', k=rng.randint(0, 40)))
+        ac = AhoCorasick(patterns)
+        assert sorted(ac.find_all(text)) == brute_force(patterns, text)
+        assert sorted(ac.compile().find_all(text)) == brute_force(patterns, text)
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
@@ -0,0 +1,250 @@
+"""
+Algorithm: Autocomplete Trie (Top-K cached completions)
+Time Complexity:
+    - Insert / weight change: O(m x K) where m = length of word, K = cache size
+      (O(m x children x K) when a weight decreases and the path is rebuilt)
+    - Complete(prefix, k): O(p + k) where p = length of prefix
+    - Space: O(nodes x K)
+Category: Tree Data Structures / String Algorithms
+
+Description:
+    Trie where every node caches the K highest-weighted words in its subtree,
+    sorted by (-weight, word). Answering complete(prefix, k) is just walking
+    to the prefix node and slicing its cached list, so the cost does not depend
+    on how many words share the prefix ("a" is as cheap as "zyx").
+
+    The cache is maintained incrementally on the insert path:
+
+    - New word / weight increase: the word can only move up, so each node on
+      the path just re-inserts (weight, word) into its list and truncates to K.
+    - Weight decrease: the word may drop out of a node's top K and another
+      word from a sibling subtree has to take its place. Rebuild the lists
+      bottom-up along the path from the node's own word + its children's
+      lists (a child's list already holds the best K of its subtree).
+
+Use Cases:
+    - Search box type-ahead ranked by popularity
+    - Command palettes / IDE completion
+    - Query suggestions with live click counts
+
+LeetCode Problems:
+    - Problem #642: Design Search Autocomplete System
+    - Problem #1268: Search Suggestions System
+"""
+
+import bisect
+import heapq
+
+from trie import Trie, TrieNode
+
+
+class AutocompleteNode(TrieNode):
+    def __init__(self):
+        super().__init__()
+        self.top = []  # up to K (-weight, word) pairs, best first
+
+
+class AutocompleteTrie(Trie):
+    def __init__(self, top_k=10):
+        """
+        Args:
+            top_k: Number of completions cached per node (max k for complete)
+        """
+        self.root = AutocompleteNode()
+        self.top_k = top_k
+
+    def insert(self, word, weight=1):
+        """
+        Insert word with weight, or change the weight of an existing word
+
+        Time: O(m x K), O(m x children x K) if the weight decreased
+        """
+        path = [self.root]
+        node = self.root
+        for ch in word:
+            if ch not in node.children:
+                node.children[ch] = AutocompleteNode()
+            node = node.children[ch]
+            path.append(node)
+
+        # node.value holds the weight, so count_prefix / sum_prefix keep working
+        old_weight = node.value if node.is_end_of_word else None
+        count_delta = 0 if old_weight is not None else 1
+        value_delta = weight - (old_weight or 0)
+        for path_node in path:
+            path_node.word_count += count_delta
+            path_node.value_sum += value_delta
+        node.is_end_of_word = True
+        node.value = weight
+
+        if old_weight is None or weight >= old_weight:
+            self._promote(path, word, old_weight, weight)
+        else:
+            self._rebuild(path, word)
+
+    def increment(self, word, delta=1):
+        """Add delta to word's weight (inserting it with weight delta if missing)"""
+        node = self._find_node(word)
+        current = node.value if node is not None and node.is_end_of_word else 0
+        self.insert(word, current + delta)
+
+    def _promote(self, path, word, old_weight, weight):
+        """
+        Weight went up: re-insert the entry into every list on the path
+        """
+        new_entry = (-weight, word)
+        old_entry = (-old_weight, word) if old_weight is not None else None
+        for node in path:
+            top = node.top
+            if old_entry is not None:
+                i = bisect.bisect_left(top, old_entry)
+                if i < len(top) and top[i] == old_entry:
+                    top.pop(i)
+            bisect.insort(top, new_entry)
+            if len(top) > self.top_k:
+                top.pop()
+
+    def _rebuild(self, path, word):
+        """
+        Weight went down: recompute each list on the path from its children
+
+        Must go bottom-up so every parent merges already-updated child lists.
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            candidates = [child.top for child in node.children.values()]
+            if node.is_end_of_word:
+                candidates.append([(-node.value, word[:depth])])
+            node.top = list(heapq.merge(*candidates))[:self.top_k]
+
+    def weight(self, word):
+        node = self._find_node(word)
+        return node.value if node is not None and node.is_end_of_word else None
+
+    def complete(self, prefix, k=None):
+        """
+        Highest-weighted words starting with prefix
+
+        Args:
+            prefix: Prefix to complete
+            k: Number of results, at most top_k (defaults to top_k)
+
+        Returns:
+            List of words, best first (ties broken alphabetically)
+
+        Time: O(len(prefix) + k)
+        """
+        k = self.top_k if k is None else k
+        if k > self.top_k:
+            raise ValueError(f"k={k} exceeds cached top_k={self.top_k}")
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+        return [word for _, word in node.top[:k]]
+
+
+def benchmark(num_words=2_000_000, num_queries=20_000, seed=7):
+    """
+    p50 / p99 latency of complete() for 1-3 character prefixes
+
+    Weights are Zipf-like (rank^-1) so the cached lists look like real
+    popularity data. `python autocomplete_trie.py [num_words]` runs it
+    after the tests (2M words: ~3 min build, ~2.4 GB RSS).
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    trie = AutocompleteTrie(top_k=10)
+
+    start = time.perf_counter()
+    for rank in range(1, num_words + 1):
+        word = ''.join(rng.choices(alphabet, k=rng.randint(3, 10)))
+        trie.insert(word, num_words // rank)
+    build = time.perf_counter() - start
+    print(f"\nBenchmark: {num_words:,} words built in {build:.1f}s")
+
+    print(f"{'prefix len':>10} {'p50 us':>8} {'p99 us':>8}")
+    for length in (1, 2, 3):
+        prefixes = [''.join(rng.choices(alphabet, k=length)) for _ in range(num_queries)]
+        latencies = []
+        for prefix in prefixes:
+            t0 = time.perf_counter_ns()
+            trie.complete(prefix, 10)
+            latencies.append(time.perf_counter_ns() - t0)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] / 1000
+        p99 = latencies[int(len(latencies) * 0.99)] / 1000
+        print(f"{length:>10} {p50:>8.2f} {p99:>8.2f}")
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    # Test 1: Ranked completions
+    print("Test 1: Ranked completions")
+    trie = AutocompleteTrie(top_k=3)
+    for word, weight in [("apple", 5), ("app", 3), ("application", 8), ("apt", 1), ("banana", 10)]:
+        trie.insert(word, weight)
+    assert trie.complete("ap") == ["application", "apple", "app"]
+    assert trie.complete("ap", 1) == ["application"]
+    assert trie.complete("") == ["banana", "application", "apple"]
+    assert trie.complete("c") == []
+    print("✓ Passed")
+
+    # Test 2: Base Trie API still works
+    print("\nTest 2: search / starts_with")
+    assert trie.search("apple") == True
+    assert trie.search("appl") == False
+    assert trie.starts_with("appl") == True
+    print("✓ Passed")
+
+    # Test 3: Weight increase moves a word up
+    print("\nTest 3: Weight increase")
+    trie.insert("apt", 20)
+    assert trie.complete("ap") == ["apt", "application", "apple"]
+    trie.increment("app", 10)
+    assert trie.weight("app") == 13
+    assert trie.complete("ap") == ["apt", "app", "application"]
+    print("✓ Passed")
+
+    # Test 4: Weight decrease lets a word from another subtree back in
+    print("\nTest 4: Weight decrease")
+    trie.insert("apt", 0)
+    assert trie.complete("ap") == ["app", "application", "apple"]
+    assert trie.complete("apt") == ["apt"]
+    assert trie.count_prefix("ap") == 4
+    assert trie.sum_prefix("ap") == 13 + 8 + 5 + 0
+    print("✓ Passed")
+
+    # Test 5: k larger than the cache
+    print("\nTest 5: k > top_k")
+    try:
+        trie.complete("a", 4)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("✓ Passed")
+
+    # Test 6: Randomized against brute force
+    print("\nTest 6: Randomized against brute force")
+    rng = random.Random(1)
+    trie = AutocompleteTrie(top_k=5)
+    weights = {}
+    for _ in range(3000):
+        word = ''.join(rng.choices('abc', k=rng.randint(1, 6)))
+        weight = rng.randint(0, 50)
+        weights[word] = weight
+        trie.insert(word, weight)
+    for _ in range(300):
+        prefix = ''.join(rng.choices('abc', k=rng.randint(0, 4)))
+        expected = sorted((-w, word) for word, w in weights.items() if word.startswith(prefix))[:5]
+        assert trie.complete(prefix) == [word for _, word in expected]
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    import sys
+    benchmark(num_words=int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
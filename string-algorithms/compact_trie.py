@@ -0,0 +1,318 @@
+"""
+Algorithm: Compact Trie (Radix Tree on flat parallel arrays)
+Time Complexity:
+    - Insert: O(m + d) where m = length of word, d = siblings scanned
+    - Search: O(m + d)
+    - StartsWith: O(m + d)
+    - Space: O(N) nodes (at most 2 x number of words) + O(total unique chars)
+Category: Tree Data Structures / String Algorithms
+
+Description:
+    Same insert / search / starts_with API as Trie, but:
+
+    1. Path compression (radix tree): a chain of single-child nodes is merged
+       into one edge labelled with a whole substring, so node count is bounded
+       by 2 x words instead of total characters.
+    2. No per-node objects: every node is an index into parallel arrays
+       (left-child / right-sibling layout). Edge labels are (start, length)
+       ranges into one shared code point pool.
+    3. Iterative traversal, so long keys never hit the recursion limit.
+
+    Node i is described by:
+        label_start[i], label_len[i] -> edge label = pool[start:start+len]
+        first_char[i]                -> first code point of the label
+        first_child[i]               -> index of first child, -1 if leaf
+        next_sibling[i]              -> index of next sibling, -1 if last
+        is_end[i]                    -> 1 if a word ends here
+
+    Splitting an edge is done "in place": the existing node keeps its index
+    (so its parent's child list never has to be relinked) and a new node takes
+    over the remainder of the label, the children and the end flag.
+
+    insert "test", "team", "tea":
+
+        root
+         └── "te"
+              ├── "am"   (end)
+              │   (after "tea": "a" (end) -> "m" (end))
+              └── "st"   (end)
+
+Use Cases:
+    - Large autocomplete dictionaries (millions of words)
+    - Spell checkers where memory per word matters
+    - Any Trie workload with long keys
+
+LeetCode Problems:
+    - Problem #208: Implement Trie
+    - Problem #1268: Search Suggestions System
+"""
+
+from array import array
+
+
+class CompactTrie:
+    def __init__(self):
+        self.pool = array('I')          # code points of all edge labels
+        self.label_start = array('q')
+        self.label_len = array('l')
+        self.first_char = array('l')
+        self.first_child = array('l')
+        self.next_sibling = array('l')
+        self.is_end = bytearray()
+
+        self.root = self._new_node(0, 0, -1)
+
+    def _new_node(self, start, length, char):
+        """
+        Append a node to every parallel array and return its index
+
+        Time: O(1) amortized
+        """
+        self.label_start.append(start)
+        self.label_len.append(length)
+        self.first_char.append(char)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.is_end.append(0)
+        return len(self.is_end) - 1
+
+    @staticmethod
+    def _encode(word):
+        """Convert word to an array of code points (one C-level pass)"""
+        codes = array('I')
+        codes.frombytes(word.encode('utf-32-le'))
+        return codes
+
+    def _find_child(self, node, char):
+        """
+        Scan the sibling list of node for the edge starting with char
+
+        Returns: child index, -1 if no such edge
+        """
+        child = self.first_child[node]
+        first_char = self.first_char
+        next_sibling = self.next_sibling
+        while child != -1 and first_char[child] != char:
+            child = next_sibling[child]
+        return child
+
+    def _split(self, node, j):
+        """
+        Split the edge into node after j characters
+
+        node keeps the first j characters, a new node gets the rest of the
+        label together with node's children and end flag.
+        """
+        start = self.label_start[node]
+        rest = self._new_node(start + j, self.label_len[node] - j, self.pool[start + j])
+        self.first_child[rest] = self.first_child[node]
+        self.is_end[rest] = self.is_end[node]
+
+        self.label_len[node] = j
+        self.first_child[node] = rest
+        self.is_end[node] = 0
+
+    def _match_len(self, node, codes, i):
+        """
+        Number of characters of node's edge label matching codes[i:]
+
+        Time: O(label length)
+        """
+        start, length = self.label_start[node], self.label_len[node]
+        length = min(length, len(codes) - i)
+        pool = self.pool
+        # fast path: whole label matches (C-level slice compare)
+        if pool[start:start + length] == codes[i:i + length]:
+            return length
+        j = 0
+        while pool[start + j] == codes[i + j]:
+            j += 1
+        return j
+
+    def insert(self, word):
+        codes = self._encode(word)
+        node, i, m = self.root, 0, len(codes)
+
+        while i < m:
+            child = self._find_child(node, codes[i])
+            if child == -1:
+                # no edge starts with this char -> one new leaf for the rest of word
+                start = len(self.pool)
+                self.pool.extend(codes[i:])
+                leaf = self._new_node(start, m - i, codes[i])
+                self.next_sibling[leaf] = self.first_child[node]
+                self.first_child[node] = leaf
+                node, i = leaf, m
+                break
+
+            j = self._match_len(child, codes, i)
+            if j < self.label_len[child]:
+                self._split(child, j)
+            node, i = child, i + j
+
+        self.is_end[node] = 1
+
+    def _walk(self, codes):
+        """
+        Follow codes from the root
+
+        Returns:
+            (node, exact) where node is the deepest node reached (-1 if the
+            path does not exist) and exact is True when codes end exactly on
+            a node boundary rather than in the middle of an edge
+        """
+        node, i, m = self.root, 0, len(codes)
+        first_child, next_sibling, first_char = self.first_child, self.next_sibling, self.first_char
+        while i < m:
+            # inlined _find_child: this loop is the hot path of every lookup
+            char = codes[i]
+            child = first_child[node]
+            while child != -1 and first_char[child] != char:
+                child = next_sibling[child]
+            if child == -1:
+                return -1, False
+            j = self._match_len(child, codes, i)
+            if i + j == m:
+                return child, j == self.label_len[child]
+            if j < self.label_len[child]:
+                return -1, False
+            node, i = child, i + j
+        return node, True
+
+    def search(self, word):
+        node, exact = self._walk(self._encode(word))
+        return node != -1 and exact and self.is_end[node] == 1
+
+    def starts_with(self, prefix):
+        node, _ = self._walk(self._encode(prefix))
+        return node != -1
+
+    def node_count(self):
+        return len(self.is_end)
+
+
+def benchmark(num_words=100_000, seed=42):
+    """
+    Compare memory and throughput of Trie vs CompactTrie on a random word list
+
+    Memory is the tracemalloc peak while building. Words are drawn with
+    shared prefixes (like a real dictionary) so both structures get to
+    share nodes.
+    """
+    import random
+    import time
+    import tracemalloc
+    from trie import Trie
+
+    rng = random.Random(seed)
+    stems = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(2, 5)))
+             for _ in range(num_words // 20 + 1)]
+    words = [rng.choice(stems) + ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(1, 8)))
+             for _ in range(num_words)]
+    queries = words[::2] + [w + 'zz' for w in words[1::2]]
+
+    def build(cls):
+        trie = cls()
+        for w in words:
+            trie.insert(w)
+        return trie
+
+    print(f"\nBenchmark: {num_words:,} words")
+    print(f"{'backend':<12} {'memory MB':>10} {'insert/s':>12} {'search/s':>12}")
+    for cls in (Trie, CompactTrie):
+        # memory and timing measured on separate builds: tracemalloc slows allocation
+        tracemalloc.start()
+        build(cls)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        trie = build(cls)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for q in queries:
+            trie.search(q)
+        search_time = time.perf_counter() - start
+
+        print(f"{cls.__name__:<12} {peak / 2**20:>10.1f} "
+              f"{len(words) / insert_time:>12,.0f} {len(queries) / search_time:>12,.0f}")
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+    import sys
+
+    # Test 1: Basic operations
+    print("Test 1: Basic insert and search")
+    trie = CompactTrie()
+    trie.insert("apple")
+    assert trie.search("apple") == True
+    assert trie.search("app") == False
+    assert trie.starts_with("app") == True
+    print("✓ Passed")
+
+    # Test 2: Edge split in the middle of a label
+    print("\nTest 2: Overlapping words (edge split)")
+    trie = CompactTrie()
+    for word in ["test", "team", "tea", "te"]:
+        trie.insert(word)
+    assert all(trie.search(w) for w in ["test", "team", "tea", "te"])
+    assert trie.search("t") == False
+    assert trie.search("teams") == False
+    assert trie.starts_with("tes") == True
+    assert trie.starts_with("tex") == False
+    print("✓ Passed")
+
+    # Test 3: Empty string and duplicates
+    print("\nTest 3: Empty string and duplicate insertions")
+    trie = CompactTrie()
+    assert trie.search("") == False
+    assert trie.starts_with("") == True
+    trie.insert("")
+    trie.insert("dup")
+    trie.insert("dup")
+    assert trie.search("") == True
+    assert trie.search("dup") == True
+    print("✓ Passed")
+
+    # Test 4: Long key (recursive Trie would hit the recursion limit)
+    print("\nTest 4: Long key")
+    trie = CompactTrie()
+    long_word = "a" * (sys.getrecursionlimit() * 5)
+    trie.insert(long_word)
+    assert trie.search(long_word) == True
+    assert trie.search(long_word[:-1]) == False
+    assert trie.starts_with(long_word[:-1]) == True
+    print("✓ Passed")
+
+    # Test 5: Unicode
+    print("\nTest 5: Unicode")
+    trie = CompactTrie()
+    trie.insert("naïve")
+    trie.insert("日本語")
+    assert trie.search("naïve") == True
+    assert trie.search("naive") == False
+    assert trie.starts_with("日本") == True
+    print("✓ Passed")
+
+    # Test 6: Randomized comparison against a set
+    print("\nTest 6: Randomized against set")
+    rng = random.Random(0)
+    trie = CompactTrie()
+    words = set()
+    for _ in range(5000):
+        w = ''.join(rng.choices('abc', k=rng.randint(0, 8)))
+        words.add(w)
+        trie.insert(w)
+    for _ in range(5000):
+        q = ''.join(rng.choices('abc', k=rng.randint(0, 9)))
+        assert trie.search(q) == (q in words)
+        assert trie.starts_with(q) == any(w.startswith(q) for w in words)
+    assert trie.node_count() <= 2 * len(words) + 1
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
@@ -0,0 +1,304 @@
+"""
+Algorithm: Concurrent Trie (copy-on-write paths, lock-free readers)
+Time Complexity:
+    - Insert: O(m x fanout) - copies the m nodes on the word's path
+    - Search / StartsWith: O(m), never blocks
+    - Snapshot: O(1)
+    - Space: O(total characters) + garbage of replaced paths until readers drop them
+Category: Tree Data Structures / String Algorithms / Concurrency
+
+Description:
+    Published nodes are never modified. A writer builds a new version by
+    copying only the nodes on the path of the word it inserts (path copying,
+    like a persistent data structure); every other subtree is shared with
+    the previous version. The new root is then published with one reference
+    assignment, which is atomic in CPython.
+
+        v1 root ── a ── n ── t*            insert "and":
+                                           v2 root' ── a' ── n' ── t*   (shared)
+                                                                 └── d*  (new)
+
+    Readers load the root reference once and walk from it, so:
+    - they never take a lock and are never blocked by writers
+    - each read sees one consistent version (snapshot isolation); a word
+      inserted halfway through a read is either fully visible or not at all
+
+    Writers serialize among themselves with a lock. insert_many publishes a
+    whole batch as a single version and mutates nodes it created itself in
+    place (they are not visible to anyone yet), so bulk loads copy each
+    shared node once per batch instead of once per word.
+
+Use Cases:
+    - Dictionaries updated while many request threads query them
+    - Config / routing tables with rare writes and constant reads
+    - Point-in-time consistent views for long-running readers
+
+LeetCode Problems:
+    - Problem #208: Implement Trie
+    - Problem #1804: Implement Trie II
+"""
+
+import threading
+
+
+class PersistentNode:
+    __slots__ = ("children", "is_end_of_word")
+
+    def __init__(self, children=None, is_end_of_word=False):
+        self.children = children if children is not None else {}
+        self.is_end_of_word = is_end_of_word
+
+
+class TrieSnapshot:
+    """
+    Read-only view of one published version
+    """
+    def __init__(self, root, version, size):
+        self.root = root
+        self.version = version
+        self.size = size
+
+    def _find_node(self, prefix):
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def search(self, word):
+        node = self._find_node(word)
+        return node is not None and node.is_end_of_word
+
+    def starts_with(self, prefix):
+        return self._find_node(prefix) is not None
+
+    def __len__(self):
+        return self.size
+
+
+class ConcurrentTrie:
+    def __init__(self):
+        self._write_lock = threading.Lock()
+        # root, version and size are published together as one immutable snapshot
+        self._current = TrieSnapshot(PersistentNode(), 0, 0)
+
+    def snapshot(self):
+        """
+        Consistent read-only view of the latest version
+
+        Time: O(1)
+        """
+        return self._current
+
+    def search(self, word):
+        return self._current.search(word)
+
+    def starts_with(self, prefix):
+        return self._current.starts_with(prefix)
+
+    def __len__(self):
+        return self._current.size
+
+    def insert(self, word):
+        self.insert_many((word,))
+
+    def insert_many(self, words):
+        """
+        Insert a batch of words and publish them as one new version
+
+        Time: O(total characters x fanout)
+        """
+        with self._write_lock:
+            current = self._current
+            root = current.root
+            fresh = set()     # ids of nodes created by this batch (safe to mutate)
+            added = 0
+            for word in words:
+                root, new_word = self._insert_copy(root, word, fresh)
+                added += new_word
+            if root is not current.root:
+                self._current = TrieSnapshot(root, current.version + 1, current.size + added)
+
+    @staticmethod
+    def _insert_copy(root, word, fresh):
+        """
+        Path-copying insert
+
+        Returns:
+            (root of the new version, 1 if word was not present before else 0)
+        """
+        # old nodes along the path (None past the end of the existing path)
+        path = [root]
+        node = root
+        for ch in word:
+            node = node.children.get(ch) if node is not None else None
+            path.append(node)
+        if path[-1] is not None and path[-1].is_end_of_word:
+            return root, 0
+
+        def own(old):
+            """Writable version of old: itself if fresh, else a shallow copy"""
+            if old is not None and id(old) in fresh:
+                return old
+            new = PersistentNode(dict(old.children), old.is_end_of_word) if old is not None else PersistentNode()
+            fresh.add(id(new))
+            return new
+
+        # rebuild bottom-up so a node is linked into its parent only when complete
+        child = own(path[-1])
+        child.is_end_of_word = True
+        for depth in range(len(word) - 1, -1, -1):
+            parent = own(path[depth])
+            parent.children[word[depth]] = child
+            child = parent
+        return child, 1
+
+
+class LockedTrie:
+    """
+    Baseline: the plain Trie behind one global lock
+    """
+    def __init__(self):
+        from trie import Trie
+        self._trie = Trie()
+        self._lock = threading.Lock()
+
+    def insert(self, word):
+        with self._lock:
+            self._trie.insert(word)
+
+    def insert_many(self, words):
+        with self._lock:
+            for word in words:
+                self._trie.insert(word)
+
+    def search(self, word):
+        with self._lock:
+            return self._trie.search(word)
+
+    def starts_with(self, prefix):
+        with self._lock:
+            return self._trie.starts_with(prefix)
+
+
+def stress_test(num_readers=16, duration=2.0, batch=50, seed=21):
+    """
+    Many reader threads + one writer thread, ConcurrentTrie vs LockedTrie
+
+    Reports reads/s. For ConcurrentTrie every reader also checks snapshot
+    consistency: the writer inserts words[0], words[1], ... in order, so a
+    snapshot of size n must contain words[n-1] and not words[n], and the
+    size a reader observes must never go backwards.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    words = [f"{''.join(rng.choices('abcdefghij', k=6))}{i}" for i in range(200_000)]
+    preload = 20_000
+
+    print(f"\nStress test: {num_readers} readers + 1 writer, {duration}s each")
+    for cls in (LockedTrie, ConcurrentTrie):
+        trie = cls()
+        trie.insert_many(words[:preload])
+        go, stop = threading.Event(), threading.Event()
+        reads = [0] * num_readers
+        errors = []
+
+        def reader(idx):
+            local = random.Random(idx)
+            last_size = 0
+            count = 0
+            go.wait()
+            while not stop.is_set():
+                if cls is ConcurrentTrie:
+                    snap = trie.snapshot()
+                    n = len(snap)
+                    if n < last_size or not snap.search(words[n - 1]) or \
+                            (n < len(words) and snap.search(words[n])):
+                        errors.append((idx, n))
+                    last_size = n
+                    target = snap
+                else:
+                    target = trie
+                for _ in range(100):
+                    target.search(words[local.randrange(preload)])
+                count += 100
+            reads[idx] = count
+
+        def writer():
+            i = preload
+            go.wait()
+            while not stop.is_set() and i < len(words):
+                trie.insert_many(words[i:i + batch])
+                i += batch
+                time.sleep(0)
+            writes[0] = i - preload
+
+        writes = [0]
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(num_readers)]
+        threads.append(threading.Thread(target=writer))
+        # start everyone before the clock runs: a busy reader pool can starve Thread.start()
+        for t in threads:
+            t.start()
+        go.set()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        print(f"  {cls.__name__:<15} {sum(reads) / duration:>12,.0f} reads/s "
+              f"{writes[0] / duration:>10,.0f} writes/s  consistency errors: {len(errors)}")
+        assert not errors
+
+
+# Test cases
+if __name__ == "__main__":
+    # Test 1: Basic operations
+    print("Test 1: Basic insert and search")
+    trie = ConcurrentTrie()
+    for word in ["the", "a", "there", "answer", "any", "by", "bye", "their"]:
+        trie.insert(word)
+    assert trie.search("the") == True
+    assert trie.search("these") == False
+    assert trie.starts_with("ther") == True
+    assert trie.search("an") == False
+    assert len(trie) == 8
+    trie.insert("the")
+    assert len(trie) == 8
+    print("✓ Passed")
+
+    # Test 2: Snapshot isolation
+    print("\nTest 2: Old snapshot does not see later writes")
+    snap = trie.snapshot()
+    trie.insert("then")
+    trie.insert_many(["zebra", "zoo"])
+    assert snap.search("then") == False
+    assert snap.starts_with("z") == False
+    assert trie.search("then") == True
+    assert trie.search("zoo") == True
+    assert trie.snapshot().version == snap.version + 2
+    print("✓ Passed")
+
+    # Test 3: Unchanged subtrees are shared, not copied
+    print("\nTest 3: Structural sharing")
+    before = trie.snapshot()
+    trie.insert("byte")
+    after = trie.snapshot()
+    assert before.root is not after.root
+    assert before.root.children["t"] is after.root.children["t"]
+    assert before.root.children["b"] is not after.root.children["b"]
+    print("✓ Passed")
+
+    # Test 4: Empty string
+    print("\nTest 4: Empty string")
+    trie = ConcurrentTrie()
+    assert trie.search("") == False
+    trie.insert("")
+    assert trie.search("") == True
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    stress_test()
@@ -0,0 +1,346 @@
+"""
+Algorithm: IP Route Table (multibit trie, longest-prefix match)
+Time Complexity:
+    - Insert: O(levels + 2^(stride - unused bits)) for controlled prefix expansion
+    - Longest match: O(levels) = O(W / stride), 3 array reads for IPv4 16-8-8
+    - Space: O(nodes x 2^stride) slots, 10 bytes per slot
+Category: Tree Data Structures / String Algorithms
+
+Description:
+    A router forwards a packet using the most specific (longest) prefix that
+    contains the destination address. A binary trie answers this by walking
+    one bit per level - up to 32 (IPv4) or 128 (IPv6) dependent steps.
+
+    A multibit trie consumes `stride` bits per level instead (default
+    16-8-8 for IPv4, like DIR-16-8-8 / Poptrie's first level). Prefixes
+    whose length is not on a level boundary are expanded ("controlled
+    prefix expansion"): a /20 lives at the level covering bits 16-24, and
+    fills the 2^(24-20) = 16 slots it covers.
+
+    Each slot stores:
+        hop[slot]      -> index into next_hops, -1 if none
+        hop_len[slot]  -> prefix length that set hop (longer wins on overlap)
+        child[slot]    -> base index of the next level's node, -1 if none
+
+    All slots of all nodes live in three flat arrays, a node is just the
+    base index of its 2^stride slots. Lookup remembers the last hop seen
+    and stops at the first missing child:
+
+        10.1.2.3  with 10.0.0.0/8 -> A, 10.1.0.0/16 -> B, 10.1.2.0/24 -> C
+        level 0 (bits 0-16):  slot 10.1   hop=B (10/8 expanded over 256 slots, 10.1/16 overrides one)
+        level 1 (bits 16-24): slot 2      hop=C  -> answer C
+
+Use Cases:
+    - Router / firewall forwarding tables (FIB)
+    - GeoIP and ASN lookup
+    - Access control lists keyed by CIDR
+
+LeetCode Problems:
+    - Problem #421: Maximum XOR of Two Numbers (binary trie over bits)
+    - Problem #1707: Maximum XOR With an Element From Array
+"""
+
+import ipaddress
+from array import array
+
+DEFAULT_STRIDES = {
+    4: (16, 8, 8),
+    6: (16,) + (8,) * 14,
+}
+
+
+class RouteTable:
+    def __init__(self, version=4, strides=None):
+        """
+        Args:
+            version: 4 or 6
+            strides: Bits consumed per level, must sum to the address width
+        """
+        self.version = version
+        self.width = 32 if version == 4 else 128
+        self.strides = tuple(strides or DEFAULT_STRIDES[version])
+        if sum(self.strides) != self.width:
+            raise ValueError(f"strides {self.strides} do not sum to {self.width}")
+
+        self.hop = array('i')
+        self.hop_len = array('h')
+        self.child = array('i')
+        self.next_hops = []
+        self._hop_ids = {}
+        self.root = self._new_node(self.strides[0])
+
+    def _new_node(self, stride):
+        """Append 2^stride empty slots, return the node's base index"""
+        base = len(self.hop)
+        size = 1 << stride
+        self.hop.extend(array('i', [-1]) * size)
+        self.hop_len.extend(array('h', [-1]) * size)
+        self.child.extend(array('i', [-1]) * size)
+        return base
+
+    def _parse_prefix(self, prefix):
+        """(int network address, prefix length) from str / ip_network / tuple"""
+        if isinstance(prefix, tuple):
+            addr, length = prefix
+            return self._to_int(addr) & self._mask(length), length
+        net = ipaddress.ip_network(prefix, strict=False)
+        if net.version != self.version:
+            raise ValueError(f"IPv{net.version} prefix in IPv{self.version} table")
+        return int(net.network_address), net.prefixlen
+
+    def _mask(self, length):
+        return ((1 << length) - 1) << (self.width - length)
+
+    def _to_int(self, addr):
+        """Address as int from int / packed bytes / str / ip_address"""
+        if isinstance(addr, int):
+            return addr
+        if isinstance(addr, (bytes, bytearray, memoryview)):
+            return int.from_bytes(addr, 'big')
+        if isinstance(addr, str):
+            return int(ipaddress.ip_address(addr))
+        return int(addr)
+
+    def insert(self, prefix, next_hop):
+        """
+        Add (or replace) a route
+
+        Args:
+            prefix: "10.0.0.0/8", ipaddress network, or (address, length)
+            next_hop: Any value returned by longest_match
+
+        Time: O(levels + 2^(level end - prefix length))
+        """
+        addr, length = self._parse_prefix(prefix)
+        if next_hop not in self._hop_ids:
+            self._hop_ids[next_hop] = len(self.next_hops)
+            self.next_hops.append(next_hop)
+        hop_id = self._hop_ids[next_hop]
+
+        base, end_bit = self.root, 0
+        for level, stride in enumerate(self.strides):
+            end_bit += stride
+            index = (addr >> (self.width - end_bit)) & ((1 << stride) - 1)
+            if length <= end_bit:
+                # expand over every slot the prefix covers at this level;
+                # a longer prefix already there wins
+                span = 1 << (end_bit - length)
+                first = base + (index & ~(span - 1))
+                hop, hop_len = self.hop, self.hop_len
+                for slot in range(first, first + span):
+                    if hop_len[slot] <= length:
+                        hop[slot] = hop_id
+                        hop_len[slot] = length
+                return
+            slot = base + index
+            if self.child[slot] == -1:
+                self.child[slot] = self._new_node(self.strides[level + 1])
+            base = self.child[slot]
+
+    def longest_match(self, addr):
+        """
+        Next hop of the longest prefix containing addr
+
+        Args:
+            addr: int, packed bytes, str or ipaddress address
+
+        Returns:
+            next_hop, or None if no route matches
+
+        Time: O(levels)
+        """
+        addr = self._to_int(addr)
+        hop, child = self.hop, self.child
+        base, best, shift = self.root, -1, self.width
+        for stride in self.strides:
+            shift -= stride
+            slot = base + ((addr >> shift) & ((1 << stride) - 1))
+            if hop[slot] != -1:
+                best = hop[slot]
+            base = child[slot]
+            if base == -1:
+                break
+        return self.next_hops[best] if best != -1 else None
+
+    def longest_match_many(self, addrs):
+        """
+        longest_match for a batch of addresses
+
+        Same walk with everything hoisted into locals once per batch
+        (masks/shifts precomputed per level).
+
+        Returns: list of next hops (None where nothing matches)
+        """
+        hop, child, next_hops, to_int = self.hop, self.child, self.next_hops, self._to_int
+        levels = []
+        shift = self.width
+        for stride in self.strides:
+            shift -= stride
+            levels.append((shift, (1 << stride) - 1))
+
+        results = []
+        append = results.append
+        for addr in addrs:
+            if not isinstance(addr, int):
+                addr = to_int(addr)
+            base, best = self.root, -1
+            for shift, mask in levels:
+                slot = base + ((addr >> shift) & mask)
+                if hop[slot] != -1:
+                    best = hop[slot]
+                base = child[slot]
+                if base == -1:
+                    break
+            append(next_hops[best] if best != -1 else None)
+        return results
+
+    def slot_count(self):
+        return len(self.hop)
+
+
+def synthetic_bgp_table(num_prefixes, seed=0):
+    """
+    IPv4 table with a BGP-like length mix (~60% /24, rest mostly /16-/23)
+
+    Prefixes cluster in a limited set of /8s and /16s like real allocations.
+    """
+    import random
+    rng = random.Random(seed)
+    lengths = [24] * 60 + [23, 22, 22, 21, 20, 20, 19, 18, 17, 16, 16, 16] * 3 + [8, 10, 12, 13, 14, 15]
+    slash16s = [rng.randrange(1, 224) << 8 | rng.randrange(256) for _ in range(num_prefixes // 40 + 1)]
+    table = []
+    for _ in range(num_prefixes):
+        length = rng.choice(lengths)
+        addr = rng.choice(slash16s) << 16 | rng.getrandbits(16)
+        mask = ((1 << length) - 1) << (32 - length)
+        table.append(((addr & mask, length), rng.randrange(1024)))
+    return table
+
+
+def benchmark(num_prefixes=1_000_000, num_lookups=200_000, seed=1):
+    """
+    Replay a synthetic BGP-sized table, then random lookups
+
+    Baseline: one dict per prefix length, probed from longest to shortest
+    (the usual hash-based LPM).
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    table = synthetic_bgp_table(num_prefixes, seed)
+    addrs = [rng.getrandbits(32) for _ in range(num_lookups // 2)]
+    addrs += [prefix[0] | rng.getrandbits(32 - prefix[1]) for prefix, _ in rng.sample(table, num_lookups // 2)]
+
+    start = time.perf_counter()
+    routes = RouteTable()
+    for prefix, next_hop in table:
+        routes.insert(prefix, next_hop)
+    build = time.perf_counter() - start
+
+    by_length = {}
+    for (addr, length), next_hop in table:
+        by_length.setdefault(length, {})[addr] = next_hop
+    probe = sorted(by_length, reverse=True)
+
+    def dict_lpm(addr):
+        for length in probe:
+            hit = by_length[length].get(addr & (((1 << length) - 1) << (32 - length)))
+            if hit is not None:
+                return hit
+        return None
+
+    print(f"\nBenchmark: {num_prefixes:,} prefixes, {num_lookups:,} lookups")
+    print(f"  build: {build:.1f}s, {routes.slot_count():,} slots "
+          f"({routes.slot_count() * 10 / 2**20:.0f} MB)")
+
+    start = time.perf_counter()
+    expected = [dict_lpm(a) for a in addrs]
+    elapsed = time.perf_counter() - start
+    print(f"  dict per length    {num_lookups / elapsed:>12,.0f} lookups/s")
+
+    start = time.perf_counter()
+    single = [routes.longest_match(a) for a in addrs]
+    elapsed = time.perf_counter() - start
+    print(f"  longest_match      {num_lookups / elapsed:>12,.0f} lookups/s")
+
+    start = time.perf_counter()
+    batch = routes.longest_match_many(addrs)
+    elapsed = time.perf_counter() - start
+    print(f"  longest_match_many {num_lookups / elapsed:>12,.0f} lookups/s")
+    assert expected == single == batch
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    # Test 1: Nested prefixes
+    print("Test 1: Longest prefix wins")
+    routes = RouteTable()
+    routes.insert("10.0.0.0/8", "A")
+    routes.insert("10.1.0.0/16", "B")
+    routes.insert("10.1.2.0/24", "C")
+    routes.insert("10.1.2.128/25", "D")
+    assert routes.longest_match("10.1.2.3") == "C"
+    assert routes.longest_match("10.1.2.200") == "D"
+    assert routes.longest_match("10.1.3.3") == "B"
+    assert routes.longest_match("10.9.9.9") == "A"
+    assert routes.longest_match("11.0.0.1") is None
+    print("✓ Passed")
+
+    # Test 2: Insertion order does not matter for expansion
+    print("\nTest 2: Short prefix inserted after long one")
+    routes = RouteTable()
+    routes.insert("192.168.1.0/24", "lan")
+    routes.insert("192.168.0.0/20", "site")
+    routes.insert("0.0.0.0/0", "default")
+    assert routes.longest_match("192.168.1.7") == "lan"
+    assert routes.longest_match("192.168.2.7") == "site"
+    assert routes.longest_match("8.8.8.8") == "default"
+    routes.insert("192.168.0.0/20", "site2")   # replace
+    assert routes.longest_match("192.168.2.7") == "site2"
+    print("✓ Passed")
+
+    # Test 3: Input types
+    print("\nTest 3: int / bytes / ipaddress input")
+    addr = ipaddress.ip_address("192.168.1.7")
+    assert routes.longest_match(int(addr)) == "lan"
+    assert routes.longest_match(addr.packed) == "lan"
+    assert routes.longest_match(addr) == "lan"
+    assert routes.longest_match_many([int(addr), "8.8.8.8", b"\xc0\xa8\x02\x01"]) == ["lan", "default", "site2"]
+    print("✓ Passed")
+
+    # Test 4: IPv6
+    print("\nTest 4: IPv6")
+    routes6 = RouteTable(version=6)
+    routes6.insert("2001:db8::/32", "doc")
+    routes6.insert("2001:db8:abcd::/48", "site")
+    routes6.insert("2001:db8:abcd:12::/64", "subnet")
+    assert routes6.longest_match("2001:db8:abcd:12::1") == "subnet"
+    assert routes6.longest_match("2001:db8:abcd:13::1") == "site"
+    assert routes6.longest_match("2001:db8:1::1") == "doc"
+    assert routes6.longest_match("2001:db9::1") is None
+    print("✓ Passed")
+
+    # Test 5: Randomized against brute force, custom strides
+    print("\nTest 5: Randomized against brute force")
+    rng = random.Random(3)
+    for strides in [(16, 8, 8), (8, 8, 8, 8), (4,) * 8]:
+        routes = RouteTable(strides=strides)
+        table = {}
+        for _ in range(300):
+            length = rng.randint(0, 32)
+            addr = rng.getrandbits(32) & (((1 << length) - 1) << (32 - length)) & 0xF0FFFFFF
+            table[(addr, length)] = rng.randrange(50)
+            routes.insert((addr, length), table[(addr, length)])
+        for _ in range(2000):
+            a = rng.getrandbits(32) & 0xF0FFFFFF
+            matches = [(l, h) for (p, l), h in table.items() if (a >> (32 - l) if l else 0) == (p >> (32 - l) if l else 0)]
+            expected = max(matches)[1] if matches else None
+            assert routes.longest_match(a) == expected, (strides, a)
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark(num_prefixes=200_000)
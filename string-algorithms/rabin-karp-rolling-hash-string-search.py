@@ -1,6 +1,6 @@
 """
 Algorithm: Rabin-Karp String Matching
-Time Complexity: O(n+m) average, O(nm) worst case
+Time Complexity: O(n+m) average, O(nm) worst case (many hash collisions)
 Space Complexity: O(1) excluding output
 Category: String Algorithms
 
@@ -28,10 +28,155 @@ LeetCode Problems:
     - Problem #1044: Longest Duplicate Substring
 """
 
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:   # optional: window_hashes() / search() fall back to pure Python
+    np = None
+
+MERSENNE_61 = (1 << 61) - 1   # 2^61 - 1 is prime: collisions ~ 1 / 2.3e18 per window
+SECOND_PRIME = (1 << 31) - 1  # 2^31 - 1, modulus of the independent second hash
+SECOND_BASE = 131
+NUMPY_MAX_PRIME = 1 << 32     # (prime - 1)^2 + prime - 1 must fit in uint64
+INDEX_PRIME = 4_294_967_291   # largest prime < 2^32, second half of RollingHashIndex keys
+
+
+def _code_points(data):
+    """str -> code points (same values as ord()), bytes-like -> byte values"""
+    if isinstance(data, str):
+        return np.frombuffer(data.encode("utf-32-le"), dtype="<u4").astype(np.uint64)
+    if isinstance(data, np.ndarray):
+        return data.astype(np.uint64, copy=False)
+    return np.frombuffer(data, dtype=np.uint8).astype(np.uint64)
+
+
+def _code_list(data):
+    """str -> list of code points, bytes-like -> its byte values (no NumPy)"""
+    return [ord(c) for c in data] if isinstance(data, str) else [int(x) for x in data]
+
+
+def window_hashes(data, m, base=256, prime=SECOND_PRIME):
+    """
+    Polynomial hash of every length-m window of data, all at once
+
+    Args:
+        data: str, bytes-like or integer NumPy array (e.g. uint8)
+        m: Window length
+        base, prime: Same meaning as in RabinKarp; prime must be < 2^32
+                     so products of two residues fit in uint64
+
+    Returns:
+        uint64 array of len(data) - m + 1 hashes (a list without NumPy);
+        entry i equals RabinKarp's rolling hash of data[i:i+m]
+
+    Hashes of length-2L windows are built from two length-L ones:
+    H2L[i] = HL[i] * base^L + HL[i+L], so blocks of length 1, 2, 4, ...
+    are formed by doubling and the blocks in m's binary expansion are
+    chained the same way. Each step is one vectorized multiply-add-mod.
+
+    Time: O(n log m) in NumPy (O(n) in the fallback)
+    Space: O(n)
+    """
+    if prime >= NUMPY_MAX_PRIME:
+        raise ValueError(f"prime must be < 2^32 for uint64 arithmetic, got {prime}")
+    if np is None:
+        return _window_hashes_python(data, m, base, prime)
+    codes = _code_points(data)
+    n = len(codes)
+    if m <= 0 or m > n:
+        return np.zeros(0, dtype=np.uint64)
+
+    modulus = np.uint64(prime)
+
+    def combine(left, left_len, right, right_len):
+        # hash(left window + right window), with one temporary per step
+        count = n - (left_len + right_len) + 1
+        out = left[:count] * np.uint64(pow(base, right_len, prime))
+        out += right[left_len:left_len + count]
+        return np.remainder(out, modulus, out=out)
+
+    block, block_len = codes % modulus, 1   # hashes of all length-1 windows
+    result, result_len = None, 0
+    remaining = m
+    while True:
+        if remaining & 1:
+            if result is None:
+                result, result_len = block, block_len
+            else:
+                result = combine(result, result_len, block, block_len)
+                result_len += block_len
+        remaining >>= 1
+        if not remaining:
+            return result
+        block = combine(block, block_len, block, block_len)
+        block_len *= 2
+
+
+def _window_hashes_python(data, m, base, prime):
+    """Plain rolling-hash loop, the reference for window_hashes()"""
+    codes = _code_list(data)
+    n = len(codes)
+    if m <= 0 or m > n:
+        return []
+    h = pow(base, m - 1, prime)
+    window_hash = 0
+    for i in range(m):
+        window_hash = (window_hash * base + codes[i]) % prime
+    hashes = [window_hash]
+    for i in range(n - m):
+        window_hash = ((window_hash - codes[i] * h) * base + codes[i + m]) % prime
+        hashes.append(window_hash)
+    return hashes
+
+
 class RabinKarp:
-    def __init__(self, base=256, prime=101):
+    def __init__(self, base=256, prime=101, second_base=None, second_prime=None):
         self.base = base # radix of our polynomial hash function (ie base our our number system. we have 256 unique digits/symbols)
         self.prime = prime
+        # optional second, independent hash: a window must match both before we verify
+        self.second_base = second_base
+        self.second_prime = second_prime
+        self.reset_stats()
+
+    @classmethod
+    def mersenne61(cls, base=256):
+        """
+        Single hash modulo the Mersenne prime 2^61 - 1
+
+        Python ints don't overflow, so a 61-bit modulus costs about the same
+        as 101 but makes a spurious hash hit practically impossible.
+        """
+        return cls(base=base, prime=MERSENNE_61)
+
+    @classmethod
+    def double_hash(cls, base=256, prime=MERSENNE_61):
+        """
+        Two independent hashes (different base and modulus) per window
+        """
+        return cls(base=base, prime=prime, second_base=SECOND_BASE, second_prime=SECOND_PRIME)
+
+    def reset_stats(self):
+        self.hash_hits = 0         # windows whose hash(es) matched the pattern
+        self.verified_matches = 0  # of those, windows that really were the pattern
+
+    def stats(self):
+        """
+        Collision instrumentation accumulated over all search() calls
+
+        Returns:
+            dict with hash_hits, verified_matches, false_positives and
+            verification_rate (verified / hits, 1.0 = no wasted compares)
+        """
+        hits = self.hash_hits
+        return {
+            "hash_hits": hits,
+            "verified_matches": self.verified_matches,
+            "false_positives": hits - self.verified_matches,
+            "verification_rate": self.verified_matches / hits if hits else 1.0,
+        }
 
     def search(self, text, pattern):
         """
@@ -42,20 +187,25 @@ class RabinKarp:
         Returns:
         list of starting indices where pattern occurs
 
-        Time: O(?)
-        Space: O(?)
+        Time: O(n + m) expected, O(nm) if most windows collide (small prime)
+        Space: O(1) excluding output
         """
+        if self.second_prime is not None:
+            return self._search_double(text, pattern)
         if not pattern or len(pattern) > len(text):
             return []
+        if np is not None and self.prime < NUMPY_MAX_PRIME:
+            return self._search_numpy(text, pattern)
         
         m, n = len(text), len(pattern)
         result = []
+        codes, pattern_codes = _code_list(text), _code_list(pattern)
 
         pattern_hash, window_hash = 0,0
         # compute initial hashes
         for i in range(n):
-          pattern_hash = (pattern_hash * self.base + ord(pattern[i])) % self.prime
-          window_hash = (window_hash * self.base + ord(text[i])) % self.prime
+          pattern_hash = (pattern_hash * self.base + pattern_codes[i]) % self.prime
+          window_hash = (window_hash * self.base + codes[i]) % self.prime
         
         #precompute h = base^(m-1) % prime --> we do this to reuse each window. 
         # this is basically multiplier for left most character 
@@ -68,21 +218,550 @@ class RabinKarp:
           
           # Check if hashes match
           if window_hash == pattern_hash:
+              self.hash_hits += 1
               # Verify actual string match because we can get collisions
               if text[i:i+n] == pattern:
+                  self.verified_matches += 1
                   result.append(i)
           
           #rolling hash
           if i < m - n:
               #remove leftmost
-              window_hash  = (window_hash - ord(text[i]) * h) % self.prime
-              window_hash = (window_hash * self.base + ord(text[i+n])) % self.prime
+              window_hash  = (window_hash - codes[i] * h) % self.prime
+              window_hash = (window_hash * self.base + codes[i+n]) % self.prime
 
               # Handle negative values from modulo
               if window_hash < 0:
                   window_hash += self.prime
         return result
 
+    def _search_numpy(self, text, pattern):
+        """
+        search() with every window hash computed up front by window_hashes()
+
+        Only the (few) hash hits are visited in Python for verification, so
+        hash_hits / verified_matches come out exactly as in the loop above.
+        """
+        n = len(pattern)
+        pattern_hash = int(window_hashes(pattern, n, self.base, self.prime)[0])
+        hashes = window_hashes(text, n, self.base, self.prime)
+        result = []
+        for i in np.flatnonzero(hashes == pattern_hash).tolist():
+            self.hash_hits += 1
+            if text[i:i+n] == pattern:
+                self.verified_matches += 1
+                result.append(i)
+        return result
+
+    def _search_double(self, text, pattern):
+        """
+        search() with two independent rolling hashes per window
+
+        Both hashes have to match before the O(m) string compare runs, so
+        verification is only paid for (almost always) real matches.
+        """
+        if not pattern or len(pattern) > len(text):
+            return []
+
+        m, n = len(text), len(pattern)
+        b1, p1, b2, p2 = self.base, self.prime, self.second_base, self.second_prime
+        result = []
+        codes, pattern_codes = _code_list(text), _code_list(pattern)
+
+        pattern_h1 = pattern_h2 = window_h1 = window_h2 = 0
+        for i in range(n):
+            pattern_h1 = (pattern_h1 * b1 + pattern_codes[i]) % p1
+            pattern_h2 = (pattern_h2 * b2 + pattern_codes[i]) % p2
+            window_h1 = (window_h1 * b1 + codes[i]) % p1
+            window_h2 = (window_h2 * b2 + codes[i]) % p2
+        h1, h2 = pow(b1, n - 1, p1), pow(b2, n - 1, p2)
+
+        for i in range(m - n + 1):
+            if window_h1 == pattern_h1 and window_h2 == pattern_h2:
+                self.hash_hits += 1
+                if text[i:i+n] == pattern:
+                    self.verified_matches += 1
+                    result.append(i)
+            if i < m - n:
+                out_char, in_char = codes[i], codes[i+n]
+                # Python's % is always non-negative, no fix-up needed
+                window_h1 = ((window_h1 - out_char * h1) * b1 + in_char) % p1
+                window_h2 = ((window_h2 - out_char * h2) * b2 + in_char) % p2
+        return result
+
+    def search_stream(self, source, pattern, chunk_size=1 << 20):
+        """
+        Lazily find pattern in a byte stream without loading it whole
+
+        Args:
+            source: bytes / bytearray / memoryview / mmap (scanned in place),
+                    a binary file object (read chunk by chunk into one reused
+                    buffer), or any iterable of bytes-like chunks
+            pattern: bytes (str is encoded as UTF-8)
+            chunk_size: Read size for file objects
+
+        Yields:
+            Absolute byte offsets of matches, in increasing order
+
+        Windows that straddle two chunks are found by scanning a small seam:
+        the last len(pattern) - 1 bytes of the previous chunk + the first
+        len(pattern) - 1 bytes of the new one. Every window ends in exactly
+        one chunk; if it also starts there the chunk scan finds it, otherwise
+        it starts in the carried tail and the seam scan finds it. The seam
+        scan only hashes windows starting in the tail, so stats() counts
+        every window once, exactly as a single-buffer scan would.
+
+        Time: O(total bytes) expected
+        Space: O(chunk_size + len(pattern))
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        n = len(pattern)
+        if not n:
+            return
+
+        pattern_hash = 0
+        for byte in pattern:
+            pattern_hash = (pattern_hash * self.base + byte) % self.prime
+        h = pow(self.base, n - 1, self.prime)
+
+        tail = b""   # last n-1 bytes seen so far
+        pos = 0      # absolute offset of the current chunk
+        for chunk in self._byte_chunks(source, chunk_size):
+            if tail:
+                seam = tail + bytes(chunk[:n - 1])
+                yield from self._scan_bytes(seam, pattern, pattern_hash, h, pos - len(tail),
+                                            starts=len(tail))
+            yield from self._scan_bytes(chunk, pattern, pattern_hash, h, pos)
+
+            if n > 1:
+                if len(chunk) >= n - 1:
+                    tail = bytes(chunk[len(chunk) - (n - 1):])
+                else:
+                    tail = (tail + bytes(chunk))[-(n - 1):]
+            pos += len(chunk)
+
+    @staticmethod
+    def _byte_chunks(source, chunk_size):
+        """Normalise every supported source to a sequence of bytes-like chunks"""
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            yield memoryview(source)
+        elif hasattr(source, "readinto"):
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            while True:
+                read = source.readinto(buffer)
+                if not read:
+                    return
+                yield view[:read]
+        else:
+            for chunk in source:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    def _scan_bytes(self, buf, pattern, pattern_hash, h, offset, starts=None):
+        """
+        Rolling hash over one buffer of bytes (indexing a bytes-like gives ints)
+
+        Args:
+            starts: Only check windows starting before this index (None = all)
+
+        Yields: offset + index of every verified match
+        """
+        n, base, prime = len(pattern), self.base, self.prime
+        m = len(buf)
+        if m < n:
+            return
+        window_hash = 0
+        for i in range(n):
+            window_hash = (window_hash * base + buf[i]) % prime
+
+        last = m - n if starts is None else min(m - n, starts - 1)
+        for i in range(last + 1):
+            if window_hash == pattern_hash:
+                self.hash_hits += 1
+                if buf[i:i+n] == pattern:
+                    self.verified_matches += 1
+                    yield offset + i
+            if i < m - n:
+                window_hash = ((window_hash - buf[i] * h) * base + buf[i+n]) % prime
+
+    def search_parallel(self, text, pattern, workers=None, path=None):
+        """
+        search() split across a process pool
+
+        Args:
+            text: str or bytes to search in (ignored when path is given)
+            pattern: str, or bytes when searching bytes / a file
+            workers: Number of processes (default os.cpu_count())
+            path: File to search instead of text; each worker mmaps it and
+                  scans only its own byte range, nothing big is pickled
+
+        Returns:
+            Sorted list of match offsets (byte offsets for bytes / files)
+
+        The text is cut into `workers` contiguous ranges of window *starts*;
+        segment j is text[start_j : end_j + m - 1], i.e. it overlaps the next
+        one by m - 1 characters so windows crossing a cut are still complete.
+        Every window start belongs to exactly one range, so the per-segment
+        results are already disjoint and sorted - merging is concatenation.
+
+        Time: O((n + m) / workers) expected per process, plus pool start-up
+        Space: O(n / workers) per process for in-memory text, O(m) for files
+        """
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        if path is not None:
+            if isinstance(pattern, str):
+                pattern = pattern.encode("utf-8")
+            total = os.path.getsize(path)
+        else:
+            total = len(text)
+        n = len(pattern)
+        if not n or n > total:
+            return []
+
+        starts = total - n + 1   # number of window start positions
+        workers = max(1, min(workers, starts))
+        if workers == 1 and path is None:
+            return self.search(text, pattern)
+
+        cuts = [starts * j // workers for j in range(workers + 1)]
+        if path is not None:
+            jobs = [(path, cuts[j], cuts[j + 1] + n - 1) for j in range(workers)]
+        else:
+            jobs = [(text[cuts[j]:cuts[j + 1] + n - 1], cuts[j]) for j in range(workers)]
+
+        result = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for offsets, hits, verified in pool.map(self._search_segment, jobs, [pattern] * workers):
+                result.extend(offsets)
+                self.hash_hits += hits
+                self.verified_matches += verified
+        return result
+
+    def _search_segment(self, job, pattern):
+        """
+        Worker body for search_parallel(): one segment, fresh counters
+
+        Runs on a pickled copy of self, so the counters are sent back with
+        the offsets and summed by the parent.
+        """
+        self.reset_stats()
+        if len(job) == 3:
+            path, start, end = job
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    pattern_hash = 0
+                    for byte in pattern:
+                        pattern_hash = (pattern_hash * self.base + byte) % self.prime
+                    h = pow(self.base, len(pattern) - 1, self.prime)
+                    offsets = list(self._scan_bytes(view[start:end], pattern, pattern_hash, h, start))
+                finally:
+                    view.release()   # mmap can't close while a view is exported
+        else:
+            segment, start = job
+            offsets = [start + i for i in self.search(segment, pattern)]
+        return offsets, self.hash_hits, self.verified_matches
+
+
+class RollingHashIndex:
+    """
+    Index a text once, then answer many k-mer / duplicate-substring queries
+
+    Each window of length k gets a 63-bit key: two independent window_hashes()
+    (base 256 mod 2^31 - 1, base 131 mod 2^32 - 5) packed as h1 << 32 | h2.
+    The table for k is two arrays - keys sorted, plus the window start of each
+    key (argsort) - so "hash -> positions" is a contiguous slice found by
+    binary search, 12-16 bytes per window and no per-entry Python objects.
+
+    Tables and query results are cached per k; longest_duplicate() builds
+    O(log n) throwaway key sets instead of caching a table per probed length.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._tables = {}     # k -> (sorted keys, window starts)
+        self._repeated = {}   # k -> repeated(k) result
+        self._longest = None
+
+    def _keys(self, k):
+        """Packed double hash of every length-k window"""
+        h1 = window_hashes(self.text, k, 256, SECOND_PRIME)
+        h2 = window_hashes(self.text, k, SECOND_BASE, INDEX_PRIME)
+        if np is not None:
+            return (h1 << np.uint64(32)) | h2
+        return [a << 32 | b for a, b in zip(h1, h2)]
+
+    def _table(self, k):
+        """(sorted keys, window starts) for length k, built once"""
+        if k not in self._tables:
+            keys = self._keys(k)
+            if np is not None:
+                order = np.argsort(keys, kind="stable")   # stable: starts ascend within a key
+                starts = order.astype(np.uint32 if len(keys) < 2**32 else np.int64)
+                self._tables[k] = (keys[order], starts)
+            else:
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+                self._tables[k] = ([keys[i] for i in order], array("l", order))
+        return self._tables[k]
+
+    def _key(self, pattern):
+        h1 = window_hashes(pattern, len(pattern), 256, SECOND_PRIME)[0]
+        h2 = window_hashes(pattern, len(pattern), SECOND_BASE, INDEX_PRIME)[0]
+        return int(h1) << 32 | int(h2)
+
+    @staticmethod
+    def _runs(sorted_keys):
+        """(start, end) slices of every key that occurs at least twice"""
+        if np is not None:
+            n = len(sorted_keys)
+            bounds = np.concatenate(([0], np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1, [n]))
+            sizes = np.diff(bounds)
+            keep = np.flatnonzero(sizes >= 2)
+            return zip(bounds[keep].tolist(), bounds[keep + 1].tolist())
+        runs, start = [], 0
+        for i in range(1, len(sorted_keys) + 1):
+            if i == len(sorted_keys) or sorted_keys[i] != sorted_keys[start]:
+                if i - start >= 2:
+                    runs.append((start, i))
+                start = i
+        return runs
+
+    def positions(self, pattern):
+        """
+        Sorted start positions of pattern, every one verified
+
+        Time: O(m + log n + occ * m) after the table for len(pattern) exists
+        """
+        k = len(pattern)
+        if not k or k > len(self.text):
+            return []
+        sorted_keys, starts = self._table(k)
+        lo, hi = self._key_range(sorted_keys, self._key(pattern))
+        text = self.text
+        return [p for p in starts[lo:hi].tolist() if text[p:p + k] == pattern]
+
+    def count(self, pattern):
+        """
+        Number of occurrences of pattern - two binary searches, no enumeration
+
+        Counts key matches without verifying them; with 63-bit keys a false
+        hit needs a collision of both hashes (~ n / 2^62). Use positions()
+        when exactness matters more than speed.
+
+        Time: O(m + log n) after the table for len(pattern) exists
+        """
+        k = len(pattern)
+        if not k or k > len(self.text):
+            return 0
+        lo, hi = self._key_range(self._table(k)[0], self._key(pattern))
+        return hi - lo
+
+    @staticmethod
+    def _key_range(sorted_keys, key):
+        if np is not None:
+            key = np.uint64(key)
+            return (int(np.searchsorted(sorted_keys, key, side="left")),
+                    int(np.searchsorted(sorted_keys, key, side="right")))
+        return bisect_left(sorted_keys, key), bisect_right(sorted_keys, key)
+
+    def repeated(self, k):
+        """
+        Every length-k substring occurring more than once (#187), in order
+        of first occurrence
+
+        A run of equal keys is reported once its first window matches some
+        later window of the run, so each substring is sliced O(1) times in
+        the common (collision-free) case.
+
+        Time: O(n log n) for the first call per k, cached afterwards
+        """
+        if k not in self._repeated:
+            result = []
+            if 0 < k <= len(self.text):
+                sorted_keys, starts = self._table(k)
+                text = self.text
+                for lo, hi in self._runs(sorted_keys):
+                    run = starts[lo:hi].tolist()
+                    first = text[run[0]:run[0] + k]
+                    if any(text[p:p + k] == first for p in run[1:]):
+                        result.append((run[0], first))
+                result.sort()
+            self._repeated[k] = [sub for _, sub in result]
+        return self._repeated[k]
+
+    def _duplicate_at(self, k):
+        """Start of some verified repeated length-k substring, or -1"""
+        keys = self._keys(k)
+        text = self.text
+        if np is not None:
+            sorted_keys = np.sort(keys)   # no argsort: positions only needed for the hits
+            dup_keys = np.unique(sorted_keys[1:][sorted_keys[1:] == sorted_keys[:-1]])
+            for key in dup_keys.tolist():
+                run = np.flatnonzero(keys == np.uint64(key)).tolist()
+                first = text[run[0]:run[0] + k]
+                if any(text[p:p + k] == first for p in run[1:]):
+                    return run[0]
+            return -1
+        seen = {}
+        for p, key in enumerate(keys):
+            if key in seen and text[seen[key]:seen[key] + k] == text[p:p + k]:
+                return seen[key]
+            seen.setdefault(key, p)
+        return -1
+
+    def longest_duplicate(self):
+        """
+        Longest substring that occurs at least twice (#1044), "" if none
+
+        Having a duplicate of length L implies one of length L - 1, so
+        binary search the length and test each probe with _duplicate_at().
+
+        Time: O(n log^2 n) with NumPy sorting, computed once
+        """
+        if self._longest is None:
+            lo, hi, best = 1, len(self.text) - 1, ""
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                start = self._duplicate_at(mid)
+                if start >= 0:
+                    best, lo = self.text[start:start + mid], mid + 1
+                else:
+                    hi = mid - 1
+            self._longest = best
+        return self._longest
+
+
+def benchmark(size_mb=2, seed=13):
+    """
+    Throughput and verification rate of default / 61-bit / double hash
+    on multi-megabyte texts
+
+    With prime=101 about 1 in 101 windows is a spurious hash hit that costs
+    an O(m) slice + compare, which is what hurts with long patterns.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(3, 9))) for _ in range(500)]
+    words = ' '.join(rng.choices(vocabulary, k=size_mb * 2**20 // 7))
+    dna = ''.join(rng.choices('ACGT', k=size_mb * 2**20))
+    scenarios = (
+        ("words, 8-char pattern", words, next(w for w in vocabulary if len(w) == 8)),
+        ("DNA, 2000-char pattern", dna, dna[12345:14345]),
+    )
+
+    for title, text, pattern in scenarios:
+        print(f"\nBenchmark: {title}, {len(text) / 2**20:.1f} MB text")
+        print(f"{'mode':<14} {'MB/s':>7} {'hash hits':>10} {'verified':>9} {'verif. rate':>12}")
+        expected = None
+        for name, algo in (("prime=101", RabinKarp()), ("mersenne61", RabinKarp.mersenne61()),
+                           ("double hash", RabinKarp.double_hash())):
+            start = time.perf_counter()
+            result = algo.search(text, pattern)
+            elapsed = time.perf_counter() - start
+            stats = algo.stats()
+            print(f"{name:<14} {len(text) / 2**20 / elapsed:>7.2f} {stats['hash_hits']:>10,} "
+                  f"{stats['verified_matches']:>9,} {stats['verification_rate']:>12.4f}")
+            expected = expected if expected is not None else result
+            assert result == expected
+
+
+def benchmark_window_hashes(size_mb=4, m=10, seed=31):
+    """
+    All k-mer hashes of a DNA string: vectorized window_hashes() vs the
+    pure-Python rolling loop (the Repeated DNA Sequences #187 workload)
+    """
+    import random
+    import time
+
+    if np is None:
+        print("\nBenchmark: window_hashes skipped (NumPy not installed)")
+        return
+    rng = random.Random(seed)
+    dna = bytes(rng.choices(b"ACGT", k=size_mb * 2**20))
+    print(f"\nBenchmark: all {m}-mer hashes of {size_mb} MB DNA")
+    timings = {}
+    for name, fn in (("python loop", _window_hashes_python), ("numpy", window_hashes)):
+        start = time.perf_counter()
+        hashes = fn(dna, m, 256, SECOND_PRIME)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:<12} {size_mb / timings[name]:>9.1f} MB/s")
+    assert list(hashes[:1000]) == _window_hashes_python(dna[:1000 + m - 1], m, 256, SECOND_PRIME)
+    print(f"speedup {timings['python loop'] / timings['numpy']:.0f}x")
+
+
+def benchmark_hash_index(size_mb=4, k=10, seed=37):
+    """
+    Build + first query vs cached query times of RollingHashIndex on random
+    DNA with one planted 5000-base repeat
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    dna = bytearray(rng.choices(b"ACGT", k=size_mb * 2**20))
+    dna[-6000:-1000] = dna[1000:6000]
+    dna = bytes(dna)
+    index = RollingHashIndex(dna)
+
+    print(f"\nBenchmark: RollingHashIndex on {size_mb} MB DNA ({'numpy' if np is not None else 'pure Python'})")
+    for label, query in ((f"repeated({k})", lambda: index.repeated(k)),
+                         (f"count({k}-mer)", lambda: index.count(dna[500:500 + k])),
+                         ("longest_duplicate()", index.longest_duplicate)):
+        start = time.perf_counter()
+        result = query()
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        query()
+        again = time.perf_counter() - start
+        size = len(result) if not isinstance(result, int) else result
+        print(f"{label:<20} first {first:>7.3f}s  cached {again * 1e3:>8.3f}ms  (result size {size:,})")
+    assert index.longest_duplicate() == dna[1000:6000]
+
+
+def benchmark_parallel(size_mb=4, seed=29, worker_counts=(1, 2, 4, 8, 16)):
+    """
+    Wall-clock scaling of search_parallel() over 1/2/4/8/16 workers, for an
+    in-memory str and for an mmap-ed file
+
+    Speedup flattens once workers exceed os.cpu_count(); with str input the
+    parent also pays for pickling each segment to its worker.
+    """
+    import os
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(seed)
+    text = ''.join(rng.choices('ACGT', k=size_mb * 2**20))
+    pattern = text[777_777:777_797]
+    path = os.path.join(tempfile.mkdtemp(), "corpus.bin")
+    with open(path, "w") as f:
+        f.write(text)
+
+    print(f"\nBenchmark: search_parallel, {size_mb} MB DNA, 20-char pattern, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'str s':>8} {'speedup':>8} {'file s':>8} {'speedup':>8}")
+    algo = RabinKarp.mersenne61()
+    expected = algo.search(text, pattern)
+    baseline = {}
+    for workers in worker_counts:
+        row = []
+        for mode, kwargs in (("str", {"text": text}), ("file", {"text": None, "path": path})):
+            start = time.perf_counter()
+            result = algo.search_parallel(pattern=pattern, workers=workers, **kwargs)
+            elapsed = time.perf_counter() - start
+            assert result == expected
+            baseline.setdefault(mode, elapsed)
+            row.append(f"{elapsed:>8.2f} {baseline[mode] / elapsed:>7.1f}x")
+        print(f"{workers:>7} " + " ".join(row))
+    os.remove(path)
+
+
 if __name__ == "__main__":
     # Test cases
     test_cases = [
@@ -189,4 +868,135 @@ if __name__ == "__main__":
         except AssertionError as e:
             print(f"✗ Test {i+1} failed: {e}")
             
-    print("\nAll tests completed!")
\ No newline at end of file
+    print("\nRunning the same tests with 61-bit and double hashing...")
+    for algo in (RabinKarp.mersenne61(), RabinKarp.double_hash()):
+        for test in test_cases:
+            text, pattern = test["input"]
+            brute_force = [i for i in range(len(text) - len(pattern) + 1) if pattern and text.startswith(pattern, i)]
+            assert algo.search(text, pattern) == brute_force, test["description"]
+            if all(ord(c) < 256 for c in text + pattern):
+                data, needle = text.encode("latin-1"), pattern.encode("latin-1")
+                assert algo.search(data, needle) == brute_force, test["description"] + " (bytes)"
+        stats = algo.stats()
+        assert stats["false_positives"] == 0 and stats["verification_rate"] == 1.0
+    assert RabinKarp.mersenne61().search(b"abcabc", b"abc") == [0, 3]
+    assert RabinKarp.double_hash().search(bytearray(b"abcabc"), b"abc") == [0, 3]
+    print("✓ 61-bit / double hash passed on str and bytes, no false positives")
+
+    import random
+    dna = ''.join(random.Random(0).choices("ACGT", k=20000))
+    algo = RabinKarp()
+    algo.search(dna, "GATTACAGATTACA")
+    assert algo.stats()["false_positives"] > 0
+    print(f"✓ prime=101 on random DNA: {algo.stats()['false_positives']} spurious hash hits counted")
+
+    print("\nRunning streaming search tests...")
+    import os
+    import tempfile
+    rng = random.Random(1)
+    algo = RabinKarp.mersenne61()
+    for _ in range(200):
+        data = bytes(rng.choices(b"ab", k=rng.randint(0, 60)))
+        pattern = bytes(rng.choices(b"ab", k=rng.randint(1, 5)))
+        expected = [i for i in range(len(data) - len(pattern) + 1) if data.startswith(pattern, i)]
+        cuts = sorted(rng.sample(range(len(data) + 1), min(len(data) + 1, rng.randint(0, 8))))
+        chunks = [data[a:b] for a, b in zip([0] + cuts, cuts + [len(data)])]
+        assert list(algo.search_stream(chunks, pattern)) == expected, (data, pattern, chunks)
+        assert list(algo.search_stream(data, pattern)) == expected
+    print("✓ Chunked iterables and bytes match brute force")
+
+    for _ in range(200):
+        data = bytes(rng.choices(b"abcd", k=rng.randint(0, 80)))
+        pattern = bytes(rng.choices(b"abcd", k=rng.randint(1, 6)))
+        cuts = sorted(rng.sample(range(len(data) + 1), min(len(data) + 1, rng.randint(0, 10))))
+        chunks = [data[a:b] for a, b in zip([0] + cuts, cuts + [len(data)])]
+        whole, chunked = RabinKarp(), RabinKarp()      # prime=101: plenty of spurious hits
+        assert list(whole.search_stream(data, pattern)) == list(chunked.search_stream(chunks, pattern))
+        assert chunked.stats() == whole.stats(), (data, pattern, chunks)
+    print("✓ Seam scans count each window's hash hit once")
+
+    data = bytes(rng.choices(b"ACGT", k=100_000))
+    pattern = data[54_321:54_341]
+    expected = [i for i in range(len(data)) if data.startswith(pattern, i)]
+    path = os.path.join(tempfile.mkdtemp(), "stream.bin")
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(path, "rb") as f:
+        assert list(algo.search_stream(f, pattern, chunk_size=4096)) == expected
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert list(algo.search_stream(mm, pattern)) == expected
+    os.remove(path)
+    assert list(algo.search_stream(["naïve ", "naï", "ve"], "naïve")) == [0, 7]
+    print("✓ File object, mmap and str chunks")
+
+    print("\nRunning parallel search tests...")
+    for algo in (RabinKarp(), RabinKarp.double_hash()):
+        for _ in range(20):
+            text = ''.join(rng.choices("ab", k=rng.randint(0, 80)))
+            pattern = ''.join(rng.choices("ab", k=rng.randint(1, 6)))
+            expected = RabinKarp().search(text, pattern)
+            for workers in (1, 3, 7):
+                assert algo.search_parallel(text, pattern, workers=workers) == expected, (text, pattern, workers)
+    for algo in (RabinKarp.mersenne61(), RabinKarp.double_hash()):
+        assert algo.search_parallel(b"abcabcabc", b"abc", workers=2) == [0, 3, 6]
+        segment = data[:5_000]
+        expected = [i for i in range(len(segment)) if segment.startswith(b"ACGTA", i)]
+        assert algo.search_parallel(segment, b"ACGTA", workers=3) == expected
+    algo, pattern = RabinKarp.mersenne61(), data[54_321:54_341]
+    path = os.path.join(tempfile.mkdtemp(), "parallel.bin")
+    with open(path, "wb") as f:
+        f.write(data)
+    expected = [i for i in range(len(data)) if data.startswith(pattern, i)]
+    assert algo.search_parallel(None, pattern, workers=4, path=path) == expected
+    assert algo.search_parallel(None, pattern.decode(), workers=1, path=path) == expected
+    assert algo.stats()["verified_matches"] == 2 * len(expected)
+    os.remove(path)
+    print("✓ Segment seams, str/bytes/file inputs and merged stats")
+
+    print("\nRunning window_hashes tests...")
+    for _ in range(100):
+        data = bytes(rng.choices(range(256), k=rng.randint(0, 50)))
+        m = rng.randint(0, 55)
+        expected = _window_hashes_python(data, m, 256, SECOND_PRIME)
+        assert list(window_hashes(data, m)) == expected, (data, m)
+        if np is not None:
+            assert list(window_hashes(np.frombuffer(data, dtype=np.uint8), m)) == expected
+    text = "naïve café → naïve"
+    assert list(window_hashes(text, 5, base=1 << 20, prime=101)) == _window_hashes_python(text, 5, 1 << 20, 101)
+    assert RabinKarp().search(text, "naïve") == [0, 13]
+    try:
+        window_hashes(b"abc", 2, prime=MERSENNE_61)
+        assert False, "61-bit prime must be rejected"
+    except ValueError:
+        pass
+    print(f"✓ Matches the rolling loop ({'numpy' if np is not None else 'pure Python fallback'})")
+
+    print("\nRunning RollingHashIndex tests...")
+    index = RollingHashIndex("AAAAACCCCCAAAAACCCCCCAAAAAGGGTTT")
+    assert index.repeated(10) == ["AAAAACCCCC", "CCCCCAAAAA"]
+    assert RollingHashIndex("AAAAAAAAAAAAA").repeated(10) == ["AAAAAAAAAA"]
+    assert RollingHashIndex("banana").longest_duplicate() == "ana"
+    assert RollingHashIndex("abcd").longest_duplicate() == ""
+    assert RollingHashIndex("").longest_duplicate() == ""
+    for _ in range(50):
+        text = ''.join(rng.choices("ab", k=rng.randint(1, 40)))
+        index = RollingHashIndex(text)
+        for k in range(1, 5):
+            windows = [text[i:i + k] for i in range(len(text) - k + 1)]
+            first_seen = list(dict.fromkeys(windows))
+            assert index.repeated(k) == [w for w in first_seen if windows.count(w) > 1]
+        sub = text[:3]
+        assert index.count(sub) == len(index.positions(sub)) == len(RabinKarp().search(text, sub))
+        occurrences = lambda w: sum(text.startswith(w, i) for i in range(len(text)))
+        dup = max((text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+                   if occurrences(text[i:j]) > 1), key=len, default="")
+        assert len(index.longest_duplicate()) == len(dup), (text, dup)
+    assert RollingHashIndex(b"ACGTACGT").positions(b"CGT") == [1, 5]
+    print("✓ repeated / count / positions / longest_duplicate match brute force")
+
+    print("\nAll tests completed!")
+
+    benchmark()
+    benchmark_window_hashes()
+    benchmark_hash_index()
+    benchmark_parallel()
\ No newline at end of file
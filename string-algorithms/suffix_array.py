@@ -0,0 +1,417 @@
+"""
+Algorithm: Suffix Array + LCP index (with an mmap-able on-disk format)
+Time Complexity:
+    - Build: O(n log^2 n) prefix doubling (NumPy sorts, pure Python fallback)
+    - LCP: O(n) Kasai
+    - find_all / count: O(m log n), count never enumerates the matches
+    - Open from disk: O(1) (mmap, no parsing)
+Category: String Algorithms
+
+Description:
+    RabinKarp.search rescans the whole text for every pattern. When the
+    corpus is static and queried many times, sort all its suffixes once:
+    every occurrence of a pattern is the start of a suffix having the pattern
+    as a prefix, and those suffixes form one contiguous block of the sorted
+    order. Two binary searches find the block, its size is the count.
+
+    Suffix array by prefix doubling: after round k every suffix is ranked
+    by its first 2^k bytes. The rank for 2^(k+1) bytes is the pair
+    (rank[i], rank[i + 2^k]), so each round is one sort of integer keys;
+    stop once all ranks are distinct.
+
+    LCP (Kasai): lcp[i] = longest common prefix of suffixes sa[i-1], sa[i].
+    Walking suffixes in text order, the LCP drops by at most 1 per step, so
+    the total work is O(n). max(lcp) is the longest repeated substring.
+
+    Text is indexed as bytes (str is UTF-8 encoded, byte order == code point
+    order), so offsets are byte offsets.
+
+    File layout (all little-endian):
+        b"SUFARR01" | n u64 | width u8 | pad | text (padded to 8) | sa | lcp
+    width is 4 (n < 2^32) or 8 bytes per entry.
+
+Use Cases:
+    - Many ad-hoc pattern queries against a large static corpus
+    - Genome / log archives shared read-only by several processes
+    - Longest repeated substring, distinct substring counting (via LCP)
+
+LeetCode Problems:
+    - Problem #1044: Longest Duplicate Substring
+    - Problem #28: Find the Index of the First Occurrence in a String
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:   # optional: falls back to a pure Python doubling sort
+    np = None
+
+MAGIC = b"SUFARR01"
+HEADER = struct.Struct("<8sQB7x")
+
+
+def build_suffix_array(text):
+    """
+    Suffix array of bytes by prefix doubling
+
+    Returns:
+        list of suffix start positions in lexicographic order
+
+    Time: O(n log^2 n)
+    Space: O(n)
+    """
+    n = len(text)
+    if n < 2:
+        return list(range(n))
+    if np is None:
+        return _build_suffix_array_python(text)
+
+    rank = np.frombuffer(text, dtype=np.uint8).astype(np.int64)
+    k = 1
+    while True:
+        # rank[i + k] + 1, or 0 past the end (a shorter suffix sorts first)
+        second = np.zeros(n, dtype=np.int64)
+        second[:n - k] = rank[k:] + 1
+        key = rank * (int(rank.max()) + 2) + second
+        sa = np.argsort(key, kind="stable")
+        sorted_key = key[sa]
+        rank = np.empty(n, dtype=np.int64)
+        rank[sa] = np.concatenate(([0], np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+        if rank[sa[-1]] == n - 1 or k >= n:   # all ranks distinct
+            return sa.tolist()
+        k *= 2
+
+
+def _build_suffix_array_python(text):
+    """Same doubling with list.sort on (rank, next rank) tuples"""
+    n = len(text)
+    rank = list(text)
+    sa = list(range(n))
+    k = 1
+    while True:
+        key = [(rank[i], rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        sa.sort(key=key.__getitem__)
+        new_rank = [0] * n
+        for j in range(1, n):
+            new_rank[sa[j]] = new_rank[sa[j - 1]] + (key[sa[j]] != key[sa[j - 1]])
+        rank = new_rank
+        if rank[sa[-1]] == n - 1 or k >= n:
+            return sa
+        k *= 2
+
+
+def build_lcp(text, sa):
+    """
+    Kasai: lcp[i] = common prefix length of suffixes sa[i-1] and sa[i], lcp[0] = 0
+
+    Time: O(n)
+    Space: O(n)
+    """
+    n = len(text)
+    rank = [0] * n
+    for i, start in enumerate(sa):
+        rank[start] = i
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        if rank[i] == 0:
+            h = 0
+            continue
+        j = sa[rank[i] - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[rank[i]] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+class SuffixArray:
+    """
+    Suffix array + LCP over a static text, built in memory or opened from disk
+    """
+    def __init__(self, text):
+        if isinstance(text, str):
+            text = text.encode("utf-8")
+        self.text = bytes(text)
+        typecode = "I" if len(self.text) < 2**32 else "Q"
+        self.sa = array(typecode, build_suffix_array(self.text))
+        self.lcp = array(typecode, build_lcp(self.text, self.sa))
+        self._mm = None
+
+    @classmethod
+    def load(cls, path):
+        """
+        Open a saved index read-only; text, sa and lcp stay in the mapping
+
+        Raises:
+            ValueError: If path is not a suffix array file
+        """
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, width = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a suffix array file")
+        self = cls.__new__(cls)
+        self._mm = mm
+        view = memoryview(mm)
+        text_start = HEADER.size
+        sa_start = text_start + _padded(n)
+        lcp_start = sa_start + n * width
+        typecode = "I" if width == 4 else "Q"
+        self.text = view[text_start:text_start + n]
+        self.sa = _load_little_endian(view[sa_start:lcp_start], typecode)
+        self.lcp = _load_little_endian(view[lcp_start:lcp_start + n * width], typecode)
+        return self
+
+    def save(self, path):
+        n = len(self.text)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, n, self.sa.itemsize))
+            f.write(self.text)
+            f.write(b"\0" * (_padded(n) - n))
+            f.write(_to_little_endian(self.sa))
+            f.write(_to_little_endian(self.lcp))
+
+    def close(self):
+        if self._mm is not None:
+            self.text.release()
+            for values in (self.sa, self.lcp):
+                if isinstance(values, memoryview):
+                    values.release()
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.text)
+
+    def _range(self, pattern):
+        """
+        [lo, hi) block of sa whose suffixes start with pattern
+
+        Time: O(m log n), each probe compares at most m bytes
+        """
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:   # first suffix whose m-byte prefix is >= pattern
+            mid = (lo + hi) // 2
+            if bytes(text[sa[mid]:sa[mid] + m]) < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first, hi = lo, len(sa)
+        while lo < hi:   # first suffix whose m-byte prefix is > pattern
+            mid = (lo + hi) // 2
+            if bytes(text[sa[mid]:sa[mid] + m]) <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def find_all(self, pattern):
+        """
+        Sorted start offsets of every occurrence of pattern
+
+        Time: O(m log n + occ log occ)
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        if not pattern:
+            return []
+        lo, hi = self._range(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def count(self, pattern):
+        """
+        Number of occurrences of pattern, from the size of its sa block
+
+        Time: O(m log n)
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        if not pattern:
+            return 0
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def longest_repeated(self):
+        """
+        Longest substring occurring at least twice (#1044), b"" if none
+
+        Two occurrences are two suffixes, and the pair sharing the longest
+        prefix is adjacent in sa - so it is just max(lcp).
+
+        Time: O(n)
+        """
+        if len(self.lcp) < 2:
+            return b""
+        best = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self.sa[best]
+        return bytes(self.text[start:start + self.lcp[best]])
+
+
+def _to_little_endian(values, byteorder=sys.byteorder):
+    """values (array / memoryview of ints) as little-endian bytes"""
+    if byteorder == "little":
+        return values
+    swapped = array(values.format if isinstance(values, memoryview) else values.typecode, values)
+    swapped.byteswap()
+    return swapped
+
+
+def _load_little_endian(view, typecode, byteorder=sys.byteorder):
+    """
+    Little-endian ints in view: a zero-copy cast on little-endian hosts,
+    a byteswapped in-memory copy on big-endian ones
+    """
+    if byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    view.release()
+    values.byteswap()
+    return values
+
+
+def _padded(n):
+    return (n + 7) & ~7
+
+
+def benchmark(size_mb=2, num_patterns=2000, seed=41):
+    """
+    One-off build + save vs per-query cost: SuffixArray.find_all / count
+    against rescanning the text with bytes.find for every pattern
+    """
+    import os
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(seed)
+    vocabulary = [bytes(rng.choices(b"abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 9))) for _ in range(2000)]
+    text = b" ".join(rng.choices(vocabulary, k=size_mb * 2**20 // 7))
+    patterns = [w + b" " + v for w, v in zip(rng.choices(vocabulary, k=num_patterns),
+                                            rng.choices(vocabulary, k=num_patterns))]
+    path = os.path.join(tempfile.mkdtemp(), "corpus.sa")
+
+    print(f"\nBenchmark: {len(text) / 2**20:.1f} MB text, {num_patterns:,} two-word patterns "
+          f"({'numpy' if np is not None else 'pure Python'} build)")
+    start = time.perf_counter()
+    index = SuffixArray(text)
+    print(f"  build SA + LCP:     {time.perf_counter() - start:>9.2f} s (once)")
+    index.save(path)
+    start = time.perf_counter()
+    mapped = SuffixArray.load(path)
+    print(f"  load (mmap):        {(time.perf_counter() - start) * 1000:>9.3f} ms, "
+          f"file {os.path.getsize(path) / 2**20:.1f} MB")
+
+    def rescan(pattern):
+        result, i = [], text.find(pattern)
+        while i != -1:
+            result.append(i)
+            i = text.find(pattern, i + 1)
+        return result
+
+    for name, query in (("bytes.find rescan", rescan), ("SA find_all", mapped.find_all),
+                        ("SA count", mapped.count)):
+        start = time.perf_counter()
+        for p in patterns:
+            query(p)
+        print(f"  {name:<18} {num_patterns / (time.perf_counter() - start):>9,.0f} queries/s")
+    assert all(mapped.find_all(p) == rescan(p) for p in patterns[:50])
+    mapped.close()
+    os.remove(path)
+
+
+# Test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "test.sa")
+
+    # Test 1: Classic example
+    print("Test 1: banana")
+    index = SuffixArray("banana")
+    assert list(index.sa) == [5, 3, 1, 0, 4, 2]
+    assert list(index.lcp) == [0, 1, 3, 0, 0, 2]
+    assert index.find_all("ana") == [1, 3]
+    assert index.count("an") == 2
+    assert index.count("nab") == 0
+    assert index.find_all("") == []
+    assert index.longest_repeated() == b"ana"
+    print("✓ Passed")
+
+    # Test 2: Edge cases
+    print("\nTest 2: Empty / single byte / all same")
+    assert SuffixArray("").find_all("a") == []
+    assert SuffixArray("").longest_repeated() == b""
+    assert SuffixArray("a").find_all("a") == [0]
+    index = SuffixArray("aaaaa")
+    assert list(index.sa) == [4, 3, 2, 1, 0]
+    assert index.count("aa") == 4
+    assert index.longest_repeated() == b"aaaa"
+    assert SuffixArray("naïve naïve").find_all("naïve") == [0, 7]   # byte offsets
+    print("✓ Passed")
+
+    # Test 3: Randomized against brute force (sorted suffixes, Kasai, find)
+    print("\nTest 3: Randomized against brute force")
+    rng = random.Random(0)
+    for _ in range(300):
+        text = bytes(rng.choices(b"abc" if rng.random() < 0.7 else range(256), k=rng.randint(1, 60)))
+        index = SuffixArray(text)
+        assert list(index.sa) == sorted(range(len(text)), key=lambda i: text[i:])
+        assert list(index.sa) == _build_suffix_array_python(text)
+        for _ in range(5):
+            p = bytes(rng.choices(b"abc", k=rng.randint(1, 4)))
+            expected = [i for i in range(len(text)) if text.startswith(p, i)]
+            assert index.find_all(p) == expected
+            assert index.count(p) == len(expected)
+    print("✓ Passed")
+
+    # Test 4: Save / mmap load round trip
+    print("\nTest 4: Save and load with mmap")
+    text = bytes(rng.choices(b"ACGT", k=20_000))
+    index = SuffixArray(text)
+    index.save(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    sa_start = HEADER.size + _padded(len(text))
+    for i in (0, 1, len(text) - 1):                    # entries on disk are little-endian
+        entry = raw[sa_start + 4 * i:sa_start + 4 * i + 4]
+        assert int.from_bytes(entry, "little") == index.sa[i]
+    values = array("I", [1, 2**24])                   # the big-endian path, on any host
+    swapped = _to_little_endian(values, "big")
+    assert list(swapped) == [2**24, 1] and list(values) == [1, 2**24]
+    assert list(_load_little_endian(memoryview(swapped.tobytes()), "I", "big")) == [1, 2**24]
+    with SuffixArray.load(path) as mapped:
+        assert len(mapped) == len(text)
+        assert list(mapped.sa) == list(index.sa)
+        assert list(mapped.lcp) == list(index.lcp)
+        for start in (0, 123, 19_990):
+            p = text[start:start + 10]
+            assert mapped.find_all(p) == index.find_all(p)
+        assert mapped.longest_repeated() == index.longest_repeated()
+    with open(path, "wb") as f:
+        f.write(b"not an index" * 4)
+    try:
+        SuffixArray.load(path)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    os.remove(path)
+    print("✓ Passed")
+
+    print("\nAll tests passed!")
+    benchmark()
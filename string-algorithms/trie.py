@@ -4,6 +4,8 @@ Time Complexity:
     - Insert: O(m) where m = length of word
     - Search: O(m)
     - StartsWith: O(m)
+    - FuzzySearch: O(nodes visited x m)
+    - CountPrefix / SumPrefix: O(p) where p = length of prefix
     - Space: O(ALPHABET_SIZE x N x M) worst case
 Category: Tree Data Structures / String Algorithms
 
@@ -11,6 +13,8 @@ Description:
     Tree-like data structure for efficient string prefix operations.
     Each node represents a character, paths represent words.
     Common prefixes share nodes, enabling fast prefix queries.
+    Every node also keeps a count and value sum of the words in its
+    subtree, so prefix aggregates never enumerate the subtree.
 
 Use Cases:
     - Autocomplete systems
@@ -33,32 +37,63 @@ class TrieNode:
     def __init__(self):
         self.children = {} 
         self.is_end_of_word = False
+        self.value = 0        # value of the word ending here (Map Sum)
+        self.word_count = 0   # words in this subtree (including this node)
+        self.value_sum = 0    # sum of values in this subtree
 
 class Trie:
     def __init__(self):
         self.root = TrieNode()
     
-    def insert(self, word):
-        self.insert_helper(self.root, word, 0)
+    def insert(self, word, value=0):
+        """
+        Insert word, or overwrite its value if already present
 
-    def insert_helper(self, node, word, i):
-        if i == len(word):
-            node.is_end_of_word = True
-            return
+        One iterative walk creates missing nodes and records the path;
+        whether the word already existed is only known at its end node, so
+        the subtree counters along the recorded path are adjusted after.
+        """
+        node = self.root
+        path = [node]
+        for char in word:
+            if char not in node.children:
+                node.children[char] = TrieNode()
+            node = node.children[char]
+            path.append(node)
 
-        if word[i] not in node.children:
-            node.children[word[i]] = TrieNode()
-        self.insert_helper(node.children[word[i]], word, i+1)
+        if node.is_end_of_word:
+            count_delta, value_delta = 0, value - node.value
+        else:
+            count_delta, value_delta = 1, value
+        node.is_end_of_word = True
+        node.value = value
+        for visited in path:
+            visited.word_count += count_delta
+            visited.value_sum += value_delta
+
+    def _find_node(self, prefix):
+        """
+        Iterative walk to the node for prefix
+
+        Returns: node, or None if no word starts with prefix
+        """
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
 
     def search(self, word):
         return self.search_helper(self.root, word, 0)
     
     def search_helper(self, node, word, i):
-        if i == len(word):
+        if i == len(word):  # Fixed: check this first
             return node.is_end_of_word
+            
         if word[i] not in node.children:
             return False
-
+        
         return self.search_helper(node.children[word[i]], word, i+1)
     
     def starts_with(self, prefix):
@@ -72,49 +107,189 @@ class Trie:
 
         return self.starts_with_helper(node.children[prefix[i]], prefix, i+1)
 
-class TrieNode:
-    def __init__(self):
-        self.children = {} 
-        self.is_end_of_word = False
+    def count_prefix(self, prefix):
+        """
+        Number of words starting with prefix
 
-class Trie:
-    def __init__(self):
-        self.root = TrieNode()
-    
-    def insert(self, word):
-        self.insert_helper(self.root, word, 0)
+        Time: O(len(prefix)) - read from the subtree counter, no enumeration
+        """
+        node = self._find_node(prefix)
+        return node.word_count if node is not None else 0
 
-    def insert_helper(self, node, word, i):
-        if i == len(word):
-            node.is_end_of_word = True
-            return
+    def sum_prefix(self, prefix):
+        """
+        Sum of values of words starting with prefix (#677 Map Sum Pairs)
 
-        if word[i] not in node.children:
-            node.children[word[i]] = TrieNode()
-        self.insert_helper(node.children[word[i]], word, i+1)
+        Time: O(len(prefix))
+        """
+        node = self._find_node(prefix)
+        return node.value_sum if node is not None else 0
 
-    def search(self, word):
-        return self.search_helper(self.root, word, 0)
-    
-    def search_helper(self, node, word, i):
-        if i == len(word):  # Fixed: check this first
-            return node.is_end_of_word
-            
-        if word[i] not in node.children:
-            return False
-        
-        return self.search_helper(node.children[word[i]], word, i+1)
-    
-    def starts_with(self, prefix):
-        return self.starts_with_helper(self.root, prefix, 0)
-    
-    def starts_with_helper(self, node, prefix, i):
-        if i == len(prefix):
-            return True
-        if prefix[i] not in node.children:
-            return False
+    def search_many(self, words):
+        """
+        search() for a batch of words, results in input order
 
-        return self.starts_with_helper(node.children[prefix[i]], prefix, i+1)
+        Time: O(k log k + characters not shared with the previous sorted word)
+        where k = number of distinct words
+        """
+        return self.batch_helper(words, exact=True)
+
+    def starts_with_many(self, prefixes):
+        """
+        starts_with() for a batch of prefixes, results in input order
+        """
+        return self.batch_helper(prefixes, exact=False)
+
+    def batch_helper(self, keys, exact):
+        """
+        Walk distinct keys in sorted order, keeping the node path of the
+        previous key
+
+        Duplicate keys in a batch are answered once. Neighbouring sorted keys
+        share their longest common prefix, so each walk resumes from the
+        deepest node the previous key already reached instead of from the root.
+        """
+        found = {}
+        path = [self.root]   # path[d] = node for prev[:d] (only as deep as prev got)
+        prev = ""
+        for key in sorted(set(keys)):
+            common, limit = 0, min(len(prev), len(key), len(path) - 1)
+            while common < limit and prev[common] == key[common]:
+                common += 1
+            del path[common + 1:]
+
+            node = path[-1]
+            for ch in key[common:]:
+                node = node.children.get(ch)
+                if node is None:
+                    break
+                path.append(node)
+            found[key] = node is not None and (node.is_end_of_word or not exact)
+            prev = key
+        return [found[key] for key in keys]
+
+    def fuzzy_search(self, word, max_distance):
+        """
+        Find all words within Levenshtein distance max_distance of word
+
+        Walks the trie once, carrying one row of the edit distance DP table
+        per node: row[j] = distance between the node's prefix and word[:j]
+        (capped at max_distance + 1).
+        A child's row only depends on its parent's row, so shared prefixes
+        share the work. If the smallest value in a row is already above
+        max_distance, no extension of that prefix can get back under it,
+        so the whole subtree is pruned.
+
+        Args:
+            word: Word to match
+            max_distance: Maximum number of insertions/deletions/substitutions
+
+        Returns:
+            list of (word, distance) sorted by distance, then word
+
+        Time: O(nodes visited x m) where m = len(word)
+        """
+        results = []
+        # cells further than max_distance from the diagonal can never be <= max_distance,
+        # so they are pinned at cap and only the 2*max_distance+1 band is computed
+        cap = max_distance + 1
+        first_row = [min(j, cap) for j in range(len(word) + 1)]
+        if self.root.is_end_of_word and first_row[-1] <= max_distance:
+            results.append(("", first_row[-1]))
+        for ch, child in self.root.children.items():
+            self.fuzzy_search_helper(child, ch, ch, first_row, word, max_distance, results)
+        results.sort(key=lambda item: (item[1], item[0]))
+        return results
+
+    def fuzzy_search_helper(self, node, ch, prefix, prev_row, word, max_distance, results):
+        depth = len(prefix)
+        cap = max_distance + 1
+        row = [cap] * len(prev_row)
+        if depth <= max_distance:
+            row[0] = depth
+        row_min = row[0]
+        for j in range(max(1, depth - max_distance), min(len(word), depth + max_distance) + 1):
+            cell = min(row[j-1] + 1,                          # insertion
+                       prev_row[j] + 1,                       # deletion
+                       prev_row[j-1] + (word[j-1] != ch),     # substitution / match
+                       cap)
+            row[j] = cell
+            if cell < row_min:
+                row_min = cell
+
+        if node.is_end_of_word and row[-1] <= max_distance:
+            results.append((prefix, row[-1]))
+
+        if row_min <= max_distance:
+            for next_ch, child in node.children.items():
+                self.fuzzy_search_helper(child, next_ch, prefix + next_ch, row, word, max_distance, results)
+
+
+def benchmark_fuzzy(num_words=50_000, num_queries=50, max_distance=2, seed=9):
+    """
+    Trie.fuzzy_search vs generating every candidate within max_distance
+    edits and calling Trie.search on each one
+    """
+    import random
+    import time
+
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+
+    def edits1(w):
+        splits = [(w[:i], w[i:]) for i in range(len(w) + 1)]
+        deletes = [a + b[1:] for a, b in splits if b]
+        replaces = [a + c + b[1:] for a, b in splits if b for c in alphabet]
+        inserts = [a + c + b for a, b in splits for c in alphabet]
+        return set(deletes + replaces + inserts)
+
+    def naive(trie, w):
+        candidates, frontier = {w}, {w}
+        for _ in range(max_distance):
+            frontier = {e for f in frontier for e in edits1(f)}
+            candidates |= frontier
+        return [c for c in candidates if trie.search(c)]
+
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(alphabet, k=rng.randint(4, 9))) for _ in range(num_words)]
+    trie = Trie()
+    for w in words:
+        trie.insert(w)
+    queries = [w[:-1] + rng.choice(alphabet) for w in rng.sample(words, num_queries)]
+
+    print(f"\nBenchmark: {num_words:,} words, {num_queries} queries, distance {max_distance}")
+    for name, fn in (("candidate generation", naive),
+                     ("fuzzy_search", lambda t, w: [x for x, _ in t.fuzzy_search(w, max_distance)])):
+        start = time.perf_counter()
+        found = sum(len(fn(trie, q)) for q in queries)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<21} {elapsed / num_queries * 1000:>8.2f} ms/query  ({found} matches)")
+
+
+def benchmark_batch(num_words=200_000, batch_size=5_000, seed=12):
+    """
+    One search() per word vs search_many() on the same batch
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    words = [''.join(rng.choices(alphabet, k=rng.randint(4, 12))) for _ in range(num_words)]
+    trie = Trie()
+    for w in words:
+        trie.insert(w)
+    # skewed like real traffic: a few hot keys repeat, a third of lookups miss
+    hot = rng.sample(words, batch_size // 5) + [w + 'x' for w in rng.sample(words, batch_size // 10)]
+    batch = rng.choices(hot, weights=[1 / rank for rank in range(1, len(hot) + 1)], k=batch_size)
+
+    print(f"\nBenchmark: batch of {batch_size:,} lookups on {num_words:,} words")
+    start = time.perf_counter()
+    single = [trie.search(w) for w in batch]
+    print(f"  search() loop  {(time.perf_counter() - start) * 1000:>8.1f} ms")
+    start = time.perf_counter()
+    batched = trie.search_many(batch)
+    print(f"  search_many()  {(time.perf_counter() - start) * 1000:>8.1f} ms")
+    assert single == batched
 
 
 # Test cases
@@ -204,4 +379,74 @@ if __name__ == "__main__":
     assert trie.search("test") == True
     print("✓ Passed")
     
-    print("\n✅ All tests passed!")
\ No newline at end of file
+    # Test 9: Fuzzy search
+    print("\nTest 9: Fuzzy search")
+    trie = Trie()
+    for word in ["cat", "cart", "care", "dog", "cut", "at", "scat"]:
+        trie.insert(word)
+    assert trie.fuzzy_search("cat", 0) == [("cat", 0)]
+    assert trie.fuzzy_search("cat", 1) == [("cat", 0), ("at", 1), ("cart", 1), ("cut", 1), ("scat", 1)]
+    assert [w for w, _ in trie.fuzzy_search("dgo", 2)] == ["dog"]
+    assert trie.fuzzy_search("xyz", 1) == []
+    assert trie.fuzzy_search("", 2) == [("at", 2)]
+
+    def levenshtein(a, b):
+        prev = list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            cur = [i]
+            for j, cb in enumerate(b, 1):
+                cur.append(min(cur[j-1] + 1, prev[j] + 1, prev[j-1] + (ca != cb)))
+            prev = cur
+        return prev[-1]
+
+    import random
+    rng = random.Random(2)
+    words = {''.join(rng.choices('abc', k=rng.randint(0, 7))) for _ in range(300)}
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    for _ in range(100):
+        query = ''.join(rng.choices('abcd', k=rng.randint(0, 7)))
+        d = rng.randint(0, 3)
+        expected = sorted(((w, levenshtein(query, w)) for w in words if levenshtein(query, w) <= d),
+                          key=lambda item: (item[1], item[0]))
+        assert trie.fuzzy_search(query, d) == expected
+    print("✓ Passed")
+
+    # Test 10: Prefix aggregates (Map Sum Pairs)
+    print("\nTest 10: count_prefix / sum_prefix")
+    trie = Trie()
+    trie.insert("apple", 3)
+    assert trie.sum_prefix("ap") == 3
+    trie.insert("app", 2)
+    assert trie.sum_prefix("ap") == 5
+    trie.insert("apple", 10)   # overwrite, not add
+    assert trie.sum_prefix("ap") == 12
+    assert trie.count_prefix("ap") == 2
+    assert trie.count_prefix("apple") == 1
+    assert trie.count_prefix("") == 2
+    assert trie.count_prefix("b") == 0
+    assert trie.sum_prefix("b") == 0
+    trie.insert("app")         # re-insert with default value 0
+    assert trie.count_prefix("ap") == 2
+    assert trie.sum_prefix("ap") == 10
+    print("✓ Passed")
+
+    # Test 11: Batch queries
+    print("\nTest 11: search_many / starts_with_many")
+    trie = Trie()
+    for word in ["the", "a", "there", "answer", "any", "by", "bye", "their"]:
+        trie.insert(word)
+    queries = ["there", "th", "zebra", "", "bye", "the", "answers", "a", "thei"]
+    assert trie.search_many(queries) == [trie.search(q) for q in queries]
+    assert trie.starts_with_many(queries) == [trie.starts_with(q) for q in queries]
+    rng = random.Random(4)
+    queries = [''.join(rng.choices('abehrty', k=rng.randint(0, 6))) for _ in range(2000)]
+    assert trie.search_many(queries) == [trie.search(q) for q in queries]
+    assert trie.starts_with_many(queries) == [trie.starts_with(q) for q in queries]
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark_fuzzy()
+    benchmark_batch()
\ No newline at end of file
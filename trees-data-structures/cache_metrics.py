@@ -0,0 +1,481 @@
+"""
+Algorithm: LRU cache instrumentation + SHARDS miss ratio curve estimation
+Time Complexity:
+    - Instrumented get / put: O(1) (+ one clock read every sample_every calls)
+    - SHARDS: O(log M) amortized per sampled reference, M = distinct sampled keys
+    - Recording off (metrics=None): get / put are the base class methods,
+      one attribute check per eviction (1.0-1.2x plain LRUCache time in
+      benchmark(), the rest is the instance __dict__ holding the bindings)
+Space Complexity: O(window + buckets) metrics, O(R x distinct keys) for SHARDS
+Category: Trees & Data Structures - Cache / Observability
+
+Description:
+    InstrumentedLRUCache is an LRUCache subclass (like WeightedLRUCache)
+    whose get / put / _remove_tail report to a CacheMetrics object in
+    self.metrics. Setting metrics to None switches recording off at run
+    time by binding the base class get / put on the instance, so calls
+    skip the instrumented wrappers entirely; only _remove_tail still
+    checks the flag, once per eviction. Setting metrics again removes the
+    bindings. instrumented(cls) builds the same subclass on top of any
+    other LRUCache subclass; extra arguments (e.g. WeightedLRUCache's
+    ttl=) are passed through unchanged. Evictions are counted in
+    _remove_tail, so subclasses that evict some other way only report
+    hits / misses / inserts / updates / latency.
+
+    Recorded:
+    - counters: hits, misses, inserts, updates, evictions
+    - hit ratio over the last `window` gets (ring buffer + running sum)
+    - age at eviction (seconds since insert) in an exponential histogram
+    - get / put latency in ns, timed for 1 in sample_every calls only
+    snapshot() returns all of it as a plain dict (e.g. for a /metrics page).
+
+    Miss ratio curve (what-if capacity planning) with SHARDS: an LRU cache
+    of size C hits a request iff its reuse (stack) distance - the number of
+    distinct keys touched since the previous request of the same key - is
+    < C. Computing distances for all keys is expensive, so only keys with
+    hash(key) mod P < R x P are tracked: a fixed random subset of keys
+    with all of their requests (int keys hash to themselves, so the hash is
+    mixed with a multiplicative constant first). Distances in the sample are
+    scaled by 1/R. SHARDS-adj correction: if the sample got more or fewer
+    than R x N of the N requests (one very hot key in or out of the sample
+    skews it), the difference is credited to distance 0, i.e. counted as
+    hits at every size.
+    Distances themselves come from a Fenwick tree over request timestamps
+    holding a 1 at each key's most recent request: the distance is the
+    number of 1s after the key's previous timestamp. When the timestamps
+    run out, the live ones are renumbered 1..M in order, so the tree holds
+    O(distinct sampled keys) entries no matter how long it runs.
+
+Use Cases:
+    - Sizing caches from production traffic instead of guessing
+    - Alerting on hit ratio drops, spotting churn (young evictions)
+    - Spotting slow paths (latency tail) without tracing every call
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (instrumented)
+"""
+
+import time
+from bisect import bisect_left
+from collections import deque
+
+from LRU_cache import LRUCache
+
+SHARDS_MODULUS = 1 << 24
+GOLDEN_64 = 0x9E3779B97F4A7C15   # multiplicative hash: spreads sequential int keys
+
+
+class Histogram:
+    """
+    Fixed exponential buckets: bounds[i] = first_bound x growth^i
+    """
+    def __init__(self, first_bound, growth=2.0, num_buckets=32):
+        self.bounds = [first_bound * growth ** i for i in range(num_buckets)]
+        self.counts = [0] * (num_buckets + 1)   # last bucket: above every bound
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1)"""
+        if not self.count:
+            return 0
+        rank, seen = q * self.count, 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            "buckets": {bound: c for bound, c in zip(self.bounds + [float("inf")], self.counts) if c},
+        }
+
+
+class ShardsMRC:
+    """
+    Spatially sampled reuse distances -> miss ratio curve of an LRU cache
+    """
+    def __init__(self, rate=0.01):
+        self.rate = rate
+        self.threshold = int(rate * SHARDS_MODULUS)
+        self.last_seen = {}   # sampled key -> timestamp of its latest request
+        self.tree = [0] * 1025   # Fenwick tree over timestamps 1..len-1
+        self.now = 0
+        self.distances = {}   # scaled distance -> count
+        self.cold = 0         # first requests (infinite distance)
+        self.sampled = 0
+        self.total = 0        # all requests, sampled or not
+
+    def _add(self, i, delta):
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i):
+        total, tree = 0, self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _rebuild(self):
+        """
+        Renumber the sampled keys' latest timestamps to 1..M (same order, so
+        every distance is unchanged) in a tree of size >= 2M, rebuilt in O(M)
+
+        Called when the timestamps run out: at least M requests have passed
+        since the last rebuild, so the O(M log M) sort is amortized O(log M)
+        and the tree stays O(distinct sampled keys) however long it runs.
+        """
+        order = sorted(self.last_seen, key=self.last_seen.__getitem__)
+        tree = [0] * (max(1024, 2 * len(order)) + 1)
+        for t, key in enumerate(order, 1):
+            self.last_seen[key] = t
+            tree[t] = 1
+        for i in range(1, len(tree)):   # O(n) in-place Fenwick build
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self.tree = tree
+        self.now = len(order)
+
+    def record(self, key):
+        self.total += 1
+        if ((hash(key) * GOLDEN_64) & 0xFFFFFFFFFFFFFFFF) >> 40 >= self.threshold:
+            return   # top 24 bits of the mixed hash: a fixed subset of keys
+        self.sampled += 1
+        if self.now + 1 >= len(self.tree):
+            self._rebuild()
+        self.now += 1
+        previous = self.last_seen.get(key)
+        if previous is None:
+            self.cold += 1
+        else:
+            distinct = self._prefix(self.now - 1) - self._prefix(previous)
+            scaled = int(distinct / self.rate)
+            self.distances[scaled] = self.distances.get(scaled, 0) + 1
+            self._add(previous, -1)
+        self.last_seen[key] = self.now
+        self._add(self.now, 1)
+
+    def miss_ratio_curve(self, sizes):
+        """
+        Estimated LRU miss ratio for each cache size
+
+        Returns:
+            list of (size, miss ratio); cold misses count at every size
+        """
+        if not self.sampled:
+            return [(size, 1.0) for size in sizes]
+        expected = self.total * self.rate
+        adjustment = expected - self.sampled   # SHARDS-adj: credited to distance 0
+        ordered = sorted(self.distances.items())
+        curve = []
+        for size in sizes:
+            hits = sum(c for d, c in ordered if d < size) + adjustment
+            curve.append((size, min(1.0, max(0.0, 1 - hits / expected))))
+        return curve
+
+
+class CacheMetrics:
+    def __init__(self, window=10_000, sample_every=64, mrc_rate=None, clock=time.monotonic):
+        """
+        Args:
+            window: Number of most recent gets in the windowed hit ratio
+            sample_every: Time 1 in this many get / put calls
+            mrc_rate: SHARDS sampling rate (e.g. 0.01), None = no MRC
+            clock: Time source for entry ages
+        """
+        self.window = deque(maxlen=window)
+        self.window_hits = 0
+        self.sample_every = sample_every
+        self.clock = clock
+        self.mrc = ShardsMRC(mrc_rate) if mrc_rate else None
+        self.counts = {"hits": 0, "misses": 0, "inserts": 0, "updates": 0, "evictions": 0}
+        self.age_at_eviction = Histogram(first_bound=0.001)        # seconds
+        self.get_latency = Histogram(first_bound=64, num_buckets=20)  # ns
+        self.put_latency = Histogram(first_bound=64, num_buckets=20)
+        self.calls = 0
+
+    def timed(self):
+        """True for 1 in sample_every calls: measure this one"""
+        self.calls += 1
+        return self.calls % self.sample_every == 0
+
+    def record_get(self, key, hit):
+        self.counts["hits" if hit else "misses"] += 1
+        window = self.window
+        if len(window) == window.maxlen:
+            self.window_hits -= window[0]
+        window.append(hit)
+        self.window_hits += hit
+        if self.mrc is not None:
+            self.mrc.record(key)
+
+    def record_eviction(self, node):
+        self.counts["evictions"] += 1
+        inserted_at = getattr(node, "inserted_at", None)   # None if put while recording was off
+        if inserted_at is not None:
+            self.age_at_eviction.record(self.clock() - inserted_at)
+
+    def hit_ratio(self):
+        lookups = self.counts["hits"] + self.counts["misses"]
+        return self.counts["hits"] / lookups if lookups else 0.0
+
+    def windowed_hit_ratio(self):
+        return self.window_hits / len(self.window) if self.window else 0.0
+
+    def snapshot(self, mrc_sizes=None):
+        """
+        All metrics as a plain dict
+
+        Args:
+            mrc_sizes: Cache sizes to estimate miss ratios for (SHARDS only)
+        """
+        snap = dict(self.counts)
+        snap.update({
+            "hit_ratio": self.hit_ratio(),
+            "windowed_hit_ratio": self.windowed_hit_ratio(),
+            "age_at_eviction_s": self.age_at_eviction.snapshot(),
+            "get_latency_ns": self.get_latency.snapshot(),
+            "put_latency_ns": self.put_latency.snapshot(),
+        })
+        if self.mrc is not None and mrc_sizes:
+            snap["miss_ratio_curve"] = self.mrc.miss_ratio_curve(mrc_sizes)
+        return snap
+
+
+class InstrumentedLRUCache(LRUCache):
+    def __init__(self, capacity, *args, metrics=None, **kwargs):
+        """
+        Args:
+            capacity, args, kwargs: Passed to the cache class
+            metrics: CacheMetrics to record into (None = recording off)
+        """
+        super().__init__(capacity, *args, **kwargs)
+        self.metrics = metrics
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics):
+        """None binds the base get / put on the instance, anything else unbinds them"""
+        self._metrics = metrics
+        if metrics is None:
+            base = super(InstrumentedLRUCache, self)
+            self.get, self.put = base.get, base.put
+        else:
+            self.__dict__.pop("get", None)
+            self.__dict__.pop("put", None)
+
+    def get(self, key, *args, **kwargs):
+        metrics = self._metrics
+        if metrics.timed():
+            start = time.perf_counter_ns()
+            value = super().get(key, *args, **kwargs)
+            metrics.get_latency.record(time.perf_counter_ns() - start)
+        else:
+            value = super().get(key, *args, **kwargs)
+        metrics.record_get(key, value != -1)
+        return value
+
+    def put(self, key, value, *args, **kwargs) -> None:
+        metrics = self._metrics
+        existed = key in self.cache
+        if metrics.timed():
+            start = time.perf_counter_ns()
+            super().put(key, value, *args, **kwargs)
+            metrics.put_latency.record(time.perf_counter_ns() - start)
+        else:
+            super().put(key, value, *args, **kwargs)
+        if existed:
+            metrics.counts["updates"] += 1
+        else:
+            metrics.counts["inserts"] += 1
+            node = self.cache.get(key)
+            if node is not None:
+                node.inserted_at = metrics.clock()
+
+    def _remove_tail(self):
+        node = super()._remove_tail()
+        if self._metrics is not None:
+            self._metrics.record_eviction(node)
+        return node
+
+    def snapshot(self, mrc_sizes=None):
+        """
+        metrics.snapshot() plus size and capacity; the miss ratio curve
+        defaults to 1/4x .. 4x the current capacity
+        """
+        if mrc_sizes is None:
+            mrc_sizes = [self.capacity // 4, self.capacity // 2, self.capacity,
+                         2 * self.capacity, 4 * self.capacity]
+        snap = self._metrics.snapshot(mrc_sizes) if self._metrics is not None else {}
+        snap.update({"size": len(self.cache), "capacity": self.capacity})
+        return snap
+
+
+_instrumented_classes = {LRUCache: InstrumentedLRUCache}
+
+
+def instrumented(cache_class):
+    """
+    InstrumentedLRUCache behaviour on top of another LRUCache subclass,
+    e.g. instrumented(WeightedLRUCache)(1 << 20, ttl=60, metrics=CacheMetrics())
+    """
+    if cache_class not in _instrumented_classes:
+        _instrumented_classes[cache_class] = type(
+            f"Instrumented{cache_class.__name__}", (InstrumentedLRUCache, cache_class), {})
+    return _instrumented_classes[cache_class]
+
+
+def benchmark(capacity=10_000, num_keys=200_000, requests=500_000, seed=31):
+    """
+    Overhead of recording (and of recording switched off), and SHARDS (1%) miss
+    ratio estimates against real LRU simulations at several capacities
+    """
+    import random
+
+    rng = random.Random(seed)
+    trace = [int(num_keys ** rng.random()) for _ in range(requests)]   # ~Zipf
+
+    def run(cache):
+        start = time.perf_counter()
+        misses = 0
+        for key in trace:
+            if cache.get(key) == -1:
+                misses += 1
+                cache.put(key, key)
+        return time.perf_counter() - start, misses / len(trace)
+
+    print(f"\nBenchmark: {requests:,} requests, capacity {capacity:,}")
+    baseline, _ = run(LRUCache(capacity))
+    recording, _ = run(InstrumentedLRUCache(capacity, metrics=CacheMetrics()))
+    with_mrc = InstrumentedLRUCache(capacity, metrics=CacheMetrics(mrc_rate=0.01))
+    sharded, _ = run(with_mrc)
+    switched_off, _ = run(InstrumentedLRUCache(capacity))
+    for name, elapsed in (("plain LRUCache", baseline), ("recording", recording),
+                          ("recording + SHARDS 1%", sharded), ("recording off", switched_off)):
+        print(f"  {name:<22} {len(trace) / elapsed:>12,.0f} req/s  ({elapsed / baseline:.2f}x)")
+
+    sizes = [capacity // 4, capacity, 4 * capacity]
+    print("  miss ratio: size, SHARDS 1% estimate, actual LRU")
+    for (size, estimate) in with_mrc.metrics.mrc.miss_ratio_curve(sizes):
+        _, actual = run(LRUCache(size))
+        print(f"    {size:>8,}  {estimate:.3f}  {actual:.3f}")
+    snap = with_mrc.snapshot()
+    print(f"  snapshot: hit ratio {snap['hit_ratio']:.3f}, evictions {snap['evictions']:,}, "
+          f"get p99 {snap['get_latency_ns']['p99']:,.0f} ns")
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    # Test 1: Counters, ratios and eviction ages
+    print("Test 1: Counters and age at eviction")
+    clock = FakeClock()
+    cache = InstrumentedLRUCache(2, metrics=CacheMetrics(window=3, sample_every=1, clock=clock))
+    cache.put(1, 1)
+    cache.put(2, 2)
+    clock.now = 5.0
+    cache.put(2, 20)               # update
+    assert cache.get(1) == 1       # hit, 2 is now LRU
+    assert cache.get(9) == -1      # miss
+    cache.put(3, 3)                # evicts 2, inserted at t=0
+    assert cache.get(2) == -1
+    assert cache.get(3) == 3
+    snap = cache.snapshot()
+    assert (snap["hits"], snap["misses"], snap["inserts"], snap["updates"], snap["evictions"]) == (2, 2, 3, 1, 1)
+    assert snap["hit_ratio"] == 0.5 and (snap["size"], snap["capacity"]) == (2, 2)
+    assert abs(snap["windowed_hit_ratio"] - 1 / 3) < 1e-9   # last 3 gets: miss, miss, hit
+    assert snap["age_at_eviction_s"]["count"] == 1 and snap["age_at_eviction_s"]["max"] == 5.0
+    assert snap["get_latency_ns"]["count"] == 4 and snap["put_latency_ns"]["count"] == 4
+    print("✓ Passed")
+
+    # Test 2: Switching recording off and on, other cache classes
+    print("\nTest 2: Recording off / on, instrumented(WeightedLRUCache)")
+    metrics, cache.metrics = cache.metrics, None
+    assert cache.get.__func__ is LRUCache.get and cache.put.__func__ is LRUCache.put
+    cache.get(3)
+    cache.put(4, 4)
+    assert metrics.counts["hits"] == 2 and cache.snapshot() == {"size": 2, "capacity": 2}
+    cache.metrics = metrics
+    assert cache.get.__func__ is InstrumentedLRUCache.get
+    cache.put(5, 5)                # evicts 3, which has an age
+    cache.put(6, 6)                # evicts 4, put while recording was off: no age
+    assert metrics.counts["evictions"] == 3 and metrics.age_at_eviction.count == 2
+
+    from weighted_lru_cache import WeightedLRUCache
+
+    InstrumentedWeighted = instrumented(WeightedLRUCache)
+    assert instrumented(WeightedLRUCache) is InstrumentedWeighted
+    assert instrumented(LRUCache) is InstrumentedLRUCache
+    weighted = InstrumentedWeighted(10, weigher=len, clock=clock, metrics=CacheMetrics(clock=clock))
+    weighted.put("a", "xxxx", ttl=1)   # extra arguments reach WeightedLRUCache.put
+    assert weighted.get("a") == "xxxx"
+    clock.now += 2
+    assert weighted.get("a") == -1
+    assert weighted.metrics.counts["hits"] == 1 and weighted.metrics.counts["misses"] == 1
+    weighted.metrics = None
+    assert weighted.get.__func__ is WeightedLRUCache.get
+    assert InstrumentedWeighted(10, weigher=len).put.__func__ is WeightedLRUCache.put
+    print("✓ Passed")
+
+    # Test 3: SHARDS at rate 1.0 is exact
+    print("\nTest 3: SHARDS with full sampling matches LRU simulation")
+    rng = random.Random(0)
+    trace = [int(2000 ** rng.random()) for _ in range(20_000)]
+    mrc = ShardsMRC(rate=1.0)
+    for key in trace:
+        mrc.record(key)
+    for size, estimate in mrc.miss_ratio_curve([1, 10, 100, 500]):
+        lru, misses = LRUCache(size), 0
+        for key in trace:
+            if lru.get(key) == -1:
+                misses += 1
+                lru.put(key, key)
+        assert abs(estimate - misses / len(trace)) < 1e-12, (size, estimate, misses / len(trace))
+    assert len(mrc.tree) <= 2 * len(mrc.last_seen) + 1   # renumbered, not grown per request
+    mrc = ShardsMRC(rate=1.0)
+    for i in range(100_000):
+        mrc.record(i % 300)
+    assert len(mrc.tree) == 1025 and mrc.distances == {299: 100_000 - 300}
+    print("✓ Passed")
+
+    # Test 4: Histogram percentiles
+    print("\nTest 4: Histogram")
+    h = Histogram(first_bound=1)
+    for v in range(1, 101):
+        h.record(v)
+    assert h.percentile(0.5) == 64 and h.percentile(1.0) == 128 and h.max == 100
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
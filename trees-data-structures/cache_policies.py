@@ -0,0 +1,491 @@
+"""
+Algorithm: Scan-resistant eviction policies - O(1) LFU, ARC, W-TinyLFU
+Time Complexity: O(1) for get and put in every policy
+Space Complexity: O(capacity) (+ O(capacity) ghost keys for ARC, a small sketch for W-TinyLFU)
+Category: Trees & Data Structures - Cache
+
+Description:
+    LRU keeps whatever was touched last, so one pass over a large table
+    (a scan) replaces the whole hot set with keys that are never used again.
+    The policies here also weigh *how often* a key is used. All of them
+    expose the LRUCache interface - get(key) -> value or -1, put(key, value)
+    - so make_cache(policy, capacity) can pick one per deployment.
+
+    LFU (O(1), LeetCode #460): keys live in one doubly linked list per use
+    count (same Node design as LRUCache, plus a freq field). A hit moves the
+    node from list f to list f + 1; min_freq tracks the lowest non-empty
+    list, whose tail (least recent among the least frequent) is evicted.
+    Weakness: old popular keys never age out.
+
+    ARC (Adaptive Replacement Cache): two LRU lists of cached entries,
+    T1 (seen once recently) and T2 (seen at least twice), plus ghost lists
+    B1 / B2 that remember only the keys recently evicted from each. A miss
+    that hits B1 means "T1 was too small", a B2 hit means the opposite, and
+    the target size p of T1 moves accordingly. A scan only flows through T1
+    and cannot touch T2.
+
+    W-TinyLFU (Caffeine): a small LRU window (1%) in front of a segmented
+    LRU main area (probation 20% / protected 80%). When the window evicts a
+    candidate and the main area is full, the candidate is admitted only if
+    it has been requested more often than the main area's victim. Request
+    counts come from a count-min sketch (4 bytearray rows of counters
+    capped at 15, all halved every 10 x capacity increments so history
+    ages), so frequency of keys that are not even cached is tracked in
+    4 bytes per cache slot.
+
+Use Cases:
+    - Database buffer pools and block caches exposed to table scans
+    - CDN / object caches with a stable popular set and long tails
+    - Picking a policy per deployment from a replayed access trace
+
+LeetCode Problems:
+    - Problem #460: LFU Cache
+    - Problem #146: LRU Cache
+"""
+
+from collections import OrderedDict
+from typing import Protocol, runtime_checkable
+
+from LRU_cache import LRUCache, Node
+
+
+@runtime_checkable
+class CachePolicy(Protocol):
+    """
+    Interface shared by every cache here; LRUCache (and anything else with
+    these two methods) satisfies it structurally, without subclassing
+    """
+    def get(self, key):
+        """Value for key (counts as a use), -1 if not cached"""
+        ...
+
+    def put(self, key, value) -> None:
+        """Insert or update key, evicting according to the policy"""
+        ...
+
+
+class FreqNode(Node):
+    """
+    LRUCache node plus its use count
+    """
+    def __init__(self, key=0, value=0):
+        super().__init__(key, value)
+        self.freq = 1
+
+
+class NodeList:
+    """
+    Doubly linked list with dummy head / tail, as in LRUCache
+    """
+    def __init__(self):
+        self.head = Node()   # most recently used
+        self.tail = Node()   # least recently used
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.size = 0
+
+    def add_to_head(self, node):
+        node.prev, node.next = self.head, self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+        self.size += 1
+
+    def remove(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.size -= 1
+
+    def pop_tail(self):
+        node = self.tail.prev
+        self.remove(node)
+        return node
+
+
+class LFUCache(CachePolicy):
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum number of key-value pairs
+        """
+        self.capacity = capacity
+        self.cache = {}   # key -> FreqNode
+        self.lists = {}   # freq -> NodeList, only non-empty ones
+        self.min_freq = 0
+
+    def __len__(self):
+        return len(self.cache)
+
+    def _touch(self, node):
+        """
+        Move node from its frequency list to the next one
+
+        Time: O(1)
+        """
+        old = self.lists[node.freq]
+        old.remove(node)
+        if not old.size:
+            del self.lists[node.freq]
+            if self.min_freq == node.freq:
+                self.min_freq += 1   # node itself is now in freq + 1
+        node.freq += 1
+        self.lists.setdefault(node.freq, NodeList()).add_to_head(node)
+
+    def get(self, key):
+        node = self.cache.get(key)
+        if node is None:
+            return -1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value) -> None:
+        if self.capacity <= 0:
+            return
+        node = self.cache.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(node)
+            return
+        if len(self.cache) == self.capacity:
+            victims = self.lists[self.min_freq]
+            del self.cache[victims.pop_tail().key]
+            if not victims.size:
+                del self.lists[self.min_freq]
+        node = FreqNode(key, value)
+        self.cache[key] = node
+        self.lists.setdefault(1, NodeList()).add_to_head(node)
+        self.min_freq = 1
+
+
+class ARCCache(CachePolicy):
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum number of cached key-value pairs (c); up to
+                      another c keys are remembered in the ghost lists
+        """
+        self.capacity = capacity
+        self.p = 0   # target size of t1
+        # OrderedDicts as LRU lists: first item = LRU, last = MRU
+        self.t1, self.t2 = OrderedDict(), OrderedDict()   # key -> value
+        self.b1, self.b2 = OrderedDict(), OrderedDict()   # key -> None (ghosts)
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+    def get(self, key):
+        if key in self.t1:
+            value = self.t1.pop(key)
+            self.t2[key] = value   # second use: now frequent
+            return value
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            return self.t2[key]
+        return -1
+
+    def _replace(self, key):
+        """Demote the LRU of t1 or t2 to its ghost list, steered by p"""
+        if self.t1 and (len(self.t1) > self.p or (key in self.b2 and len(self.t1) == self.p) or not self.t2):
+            old, _ = self.t1.popitem(last=False)
+            self.b1[old] = None
+        else:
+            old, _ = self.t2.popitem(last=False)
+            self.b2[old] = None
+
+    def put(self, key, value) -> None:
+        c = self.capacity
+        if c <= 0:
+            return
+        if key in self.t1 or key in self.t2:
+            self.t1.pop(key, None)
+            self.t2.pop(key, None)
+            self.t2[key] = value
+            return
+        if key in self.b1:   # evicted from t1 too early: grow t1
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(key)
+            del self.b1[key]
+            self.t2[key] = value
+            return
+        if key in self.b2:   # evicted from t2 too early: shrink t1
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(key)
+            del self.b2[key]
+            self.t2[key] = value
+            return
+
+        if len(self.t1) + len(self.b1) == c:
+            if len(self.t1) < c:
+                self.b1.popitem(last=False)
+                self._replace(key)
+            else:
+                self.t1.popitem(last=False)
+        else:
+            total = len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2)
+            if total >= c:
+                if total == 2 * c:
+                    self.b2.popitem(last=False)
+                self._replace(key)
+        self.t1[key] = value
+
+
+class CountMinSketch:
+    """
+    Approximate request counts with saturating (<= 15) byte counters and aging
+
+    estimate(key) never underestimates since the last reset; every
+    sample_size increments all counters are halved.
+    """
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    MAX_COUNT = 15
+    HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(capacity, 16):
+            width *= 2
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in self.SEEDS]
+        self.sample_size = 10 * max(capacity, 1)
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [((h * seed) & 0xFFFFFFFFFFFFFFFF) >> 40 & self.mask for seed in self.SEEDS]
+
+    def increment(self, key):
+        for row, i in zip(self.rows, self._indexes(key)):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.additions //= 2
+            for row in self.rows:
+                row[:] = row.translate(self.HALVE)
+
+    def estimate(self, key):
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+
+
+class WTinyLFUCache(CachePolicy):
+    def __init__(self, capacity: int, window_ratio=0.01, protected_ratio=0.8):
+        """
+        Args:
+            capacity: Maximum number of key-value pairs
+            window_ratio: Share of capacity for the admission window LRU
+            protected_ratio: Share of the main area for the protected segment
+        """
+        self.capacity = capacity
+        self.window_size = max(1, int(capacity * window_ratio)) if capacity > 1 else capacity
+        self.main_size = capacity - self.window_size
+        self.protected_size = int(self.main_size * protected_ratio)
+        self.window = OrderedDict()      # first item = LRU
+        self.probation = OrderedDict()   # main area, seen once in main
+        self.protected = OrderedDict()   # main area, hit again while in probation
+        self.sketch = CountMinSketch(capacity)
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    def get(self, key):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+            return self.window[key]
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return self.protected[key]
+        if key in self.probation:
+            value = self.probation.pop(key)
+            self._protect(key, value)
+            return value
+        return -1
+
+    def _protect(self, key, value):
+        """Promote a probation hit, demoting protected's LRU if it is full"""
+        self.protected[key] = value
+        if len(self.protected) > self.protected_size:
+            old, old_value = self.protected.popitem(last=False)
+            self.probation[old] = old_value
+
+    def put(self, key, value) -> None:
+        if self.capacity <= 0:
+            return
+        if key in self.window or key in self.probation or key in self.protected:
+            self.get(key)   # counts the use and moves / promotes the key
+            for segment in (self.window, self.protected, self.probation):
+                if key in segment:
+                    segment[key] = value
+                    break
+            return
+        self.sketch.increment(key)
+        self.window[key] = value
+        if len(self.window) <= self.window_size:
+            return
+
+        candidate, candidate_value = self.window.popitem(last=False)
+        if not self.main_size:
+            return          # the window is the whole cache: its LRU is simply evicted
+        if len(self.probation) + len(self.protected) < self.main_size:
+            self.probation[candidate] = candidate_value
+            return
+        victims = self.probation or self.protected
+        victim = next(iter(victims))
+        # admission: keep whichever has been requested more often
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del victims[victim]
+            self.probation[candidate] = candidate_value
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "lfu": LFUCache,
+    "arc": ARCCache,
+    "w-tinylfu": WTinyLFUCache,
+}
+
+
+def make_cache(policy: str, capacity: int):
+    """
+    Build a cache by policy name ("lru", "lfu", "arc", "w-tinylfu")
+
+    Raises:
+        ValueError: If policy is unknown
+    """
+    try:
+        return POLICIES[policy](capacity)
+    except KeyError:
+        raise ValueError(f"unknown cache policy {policy!r}, choose from {sorted(POLICIES)}") from None
+
+
+def benchmark(capacity=1000, num_keys=50_000, requests=300_000, seed=11):
+    """
+    Hit ratio per policy on a Zipf-like workload, without and with
+    periodic one-off scans mixed in
+    """
+    import random
+
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(num_keys)]
+    hot = rng.choices(range(num_keys), weights=weights, k=requests)
+    with_scans, scan_key = [], num_keys
+    for i, key in enumerate(hot):
+        with_scans.append(key)
+        if i % 10_000 == 9_999:   # a batch job reads 5x capacity never-again keys
+            with_scans.extend(range(scan_key, scan_key + 5 * capacity))
+            scan_key += 5 * capacity
+
+    print(f"\nBenchmark: hit ratio, capacity {capacity:,}, Zipf over {num_keys:,} keys")
+    print(f"{'policy':<11} {'zipf':>7} {'zipf + scans':>13}")
+    for name in POLICIES:
+        ratios = []
+        for trace in (hot, with_scans):
+            cache, hits = make_cache(name, capacity), 0
+            for key in trace:
+                if cache.get(key) == -1:
+                    cache.put(key, key)
+                else:
+                    hits += 1
+            ratios.append(hits / len(trace))
+        print(f"{name:<11} {ratios[0]:>7.3f} {ratios[1]:>13.3f}")
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    # Test 1: LeetCode #460 example
+    print("Test 1: LFU (LeetCode #460)")
+    lfu = LFUCache(2)
+    lfu.put(1, 1)
+    lfu.put(2, 2)
+    assert lfu.get(1) == 1
+    lfu.put(3, 3)                  # 2 has freq 1, 1 has freq 2: evict 2
+    assert lfu.get(2) == -1
+    assert lfu.get(3) == 3
+    lfu.put(4, 4)                  # 1 and 3 both freq 2: evict LRU one, 1
+    assert lfu.get(1) == -1
+    assert lfu.get(3) == 3
+    assert lfu.get(4) == 4
+    assert LFUCache(0).get(0) == -1
+    print("✓ Passed")
+
+    # Test 2: LFU against a brute-force model
+    print("\nTest 2: LFU randomized against a model")
+    rng = random.Random(0)
+    lfu, model, clock = LFUCache(5), {}, 0   # key -> [value, freq, last use]
+    for _ in range(20_000):
+        clock += 1
+        k = rng.randrange(12)
+        if rng.random() < 0.5:
+            assert lfu.get(k) == (model[k][0] if k in model else -1)
+            if k in model:
+                model[k][1] += 1
+                model[k][2] = clock
+        elif k in model:
+            lfu.put(k, clock)
+            model[k] = [clock, model[k][1] + 1, clock]
+        else:
+            if len(model) == 5:
+                del model[min(model, key=lambda key: (model[key][1], model[key][2]))]
+            lfu.put(k, clock)
+            model[k] = [clock, 1, clock]
+    print("✓ Passed")
+
+    # Test 3: Every policy keeps a hot set through a scan, LRU does not
+    print("\nTest 3: Scan resistance")
+    for name in POLICIES:
+        cache = make_cache(name, 100)
+        for _ in range(5):
+            for k in range(50):          # hot set, used repeatedly
+                if cache.get(k) == -1:
+                    cache.put(k, k)
+        for k in range(1000, 1500):      # one-off scan
+            if cache.get(k) == -1:
+                cache.put(k, k)
+        survived = sum(cache.get(k) != -1 for k in range(50))
+        assert (survived == 0) if name == "lru" else (survived >= 45), (name, survived)
+    print("✓ Passed")
+
+    # Test 4: Common interface, capacity and updates
+    print("\nTest 4: Interface, capacity and updates")
+    for name in POLICIES:
+        for capacity in (1, 2, 3, 10):
+            cache = make_cache(name, capacity)
+            assert isinstance(cache, CachePolicy)
+            for i in range(1000):
+                k = rng.randrange(4 * capacity)
+                if rng.random() < 0.5:
+                    v = cache.get(k)
+                    assert v == -1 or v == ("v", k)
+                else:
+                    cache.put(k, ("v", k))
+                assert len(cache.cache if name == "lru" else cache) <= capacity
+            cache.put("x", 1)
+            cache.put("x", 2)
+            assert cache.get("x") == 2
+    assert issubclass(LRUCache, CachePolicy) and not isinstance(object(), CachePolicy)
+    try:
+        make_cache("mru", 10)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    arc = ARCCache(4)
+    for k in range(8):
+        arc.put(k, k)
+    assert len(arc) == 4 and len(arc.b1) + len(arc.b2) <= 4
+    print("✓ Passed")
+
+    # Test 5: Count-min sketch never underestimates (before aging)
+    print("\nTest 5: Count-min sketch")
+    sketch = CountMinSketch(1000)
+    counts = {}
+    for _ in range(5000):
+        k = rng.randrange(2000)
+        sketch.increment(k)
+        counts[k] = counts.get(k, 0) + 1
+    assert all(sketch.estimate(k) >= min(c, CountMinSketch.MAX_COUNT) for k, c in counts.items())
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
@@ -0,0 +1,368 @@
+"""
+Algorithm: Cache trace replay simulator + synthetic workload generators
+Time Complexity: O(T) cache operations per (policy, capacity) point, T = trace length
+Space Complexity: O(capacity) for the cache, O(1) for the streamed trace
+                  (O(keys) for the Zipf table)
+Category: Trees & Data Structures - Cache / Benchmarking
+
+Description:
+    Picking a cache policy and size by intuition is guesswork. This tool
+    replays an access trace through any cache with the LRUCache interface
+    (get -> value or -1, put) and reports, for every (policy, capacity):
+
+        hit ratio        hits / requests
+        byte hit ratio   bytes served from cache / bytes requested
+        ops/s            get (+ put on a miss) per second, untraced run,
+                         timing only the cache calls (not trace generation /
+                         parsing, which can cost more than the cache itself)
+        peak memory      tracemalloc peak of a second, traced run
+
+    A trace is a stream of (key, size) pairs, read lazily from a text file
+    ("key" or "key size" per line, optionally .gz) or produced by a
+    generator, so traces never have to fit in memory. On a miss the
+    simulator puts the size as the value: count-based caches ignore it,
+    size-aware ones (weighted-lru) weigh by it.
+
+    Synthetic generators (seeded, so every run is reproducible):
+    - zipf: key rank r requested with probability ~ 1 / r^alpha
+    - scan-loop: Zipf traffic interleaved with a loop over more keys than
+      fit in the cache (LRU's worst case: it evicts each key just before
+      its reuse) and one-off sequential scans (pollute LRU / LFU)
+    - shifting: a hot set that moves to new keys every phase (punishes
+      policies that keep stale frequency counts)
+
+    Policies: the names in cache_policies.POLICIES plus "compact-lru",
+    "weighted-lru", or any "module:Class" taking the capacity.
+
+    Usage:
+        python cache_simulator.py --synthetic scan-loop --capacities 1000,10000
+        python cache_simulator.py --trace keys.txt.gz --policies lru,arc
+        python cache_simulator.py          (tests + built-in benchmark)
+
+Use Cases:
+    - Sizing caches from production access logs
+    - Comparing eviction policies on a workload before deploying one
+    - Regression-testing cache implementations for speed and footprint
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (evaluation harness)
+"""
+
+import argparse
+import gzip
+import importlib
+import random
+from itertools import islice
+import time
+import tracemalloc
+
+from cache_policies import POLICIES
+from compact_lru_cache import CompactLRUCache
+from weighted_lru_cache import WeightedLRUCache
+
+SIMULATOR_POLICIES = dict(POLICIES, **{
+    "compact-lru": CompactLRUCache,
+    "weighted-lru": lambda capacity: WeightedLRUCache(capacity, weigher=lambda size: size),
+})
+
+
+def load_factory(spec):
+    """
+    Cache constructor for a policy name or "module:Class"
+
+    Raises:
+        ValueError: If spec is neither
+    """
+    if spec in SIMULATOR_POLICIES:
+        return SIMULATOR_POLICIES[spec]
+    if ":" in spec:
+        module, _, name = spec.partition(":")
+        return getattr(importlib.import_module(module), name)
+    raise ValueError(f"unknown cache policy {spec!r}, choose from {sorted(SIMULATOR_POLICIES)} "
+                     f"or give module:Class")
+
+
+def read_trace(path):
+    """
+    Stream (key, size) pairs from a text trace: "key" or "key size" per
+    line, blank lines and # comments skipped, gzip if path ends in .gz
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            yield fields[0], int(fields[1]) if len(fields) > 1 else 1
+
+
+def zipf_trace(length, num_keys, alpha=1.0, seed=0):
+    """
+    (key, 1) pairs with key rank r drawn with probability ~ 1 / (r + 1)^alpha
+
+    The cumulative table is built here, before the first pair is drawn, so
+    it is not charged to the cache in the simulator's memory measurement.
+    """
+    cumulative, total = [], 0.0
+    for rank in range(num_keys):
+        total += 1 / (rank + 1) ** alpha
+        cumulative.append(total)
+    keys = range(num_keys)
+
+    def generate():
+        rng = random.Random(seed)
+        for _ in range(0, length, 4096):
+            for key in rng.choices(keys, cum_weights=cumulative, k=min(4096, length)):
+                yield key, 1
+    return _take(generate(), length)
+
+
+def scan_loop_trace(length, num_keys, loop_size, loop_fraction=0.3, scan_every=20_000,
+                    scan_length=5_000, alpha=1.0, seed=0):
+    """
+    Zipf traffic over num_keys keys, a fraction loop_fraction of requests
+    replaced by the next key of a cycle over loop_size keys, and a scan of
+    scan_length never-seen keys after every scan_every requests
+    """
+    hot = zipf_trace(length, num_keys, alpha, seed)
+
+    def generate():
+        rng = random.Random(seed + 1)
+        loop_position, scan_key = 0, 0
+        for i, pair in enumerate(hot, 1):
+            if rng.random() < loop_fraction:
+                yield ("loop", loop_position), 1
+                loop_position = (loop_position + 1) % loop_size
+            else:
+                yield pair
+            if i % scan_every == 0:
+                for _ in range(scan_length):
+                    yield ("scan", scan_key), 1
+                    scan_key += 1
+    return _take(generate(), length)
+
+
+def shifting_trace(length, num_keys, hot_size, phase_length, hot_fraction=0.9, seed=0):
+    """
+    hot_fraction of requests go uniformly to a hot set of hot_size keys
+    that moves to the next hot_size keys every phase_length requests, the
+    rest uniformly to all num_keys keys
+    """
+    def generate():
+        rng = random.Random(seed)
+        for i in range(length):
+            if rng.random() < hot_fraction:
+                start = (i // phase_length) * hot_size
+                yield (start + rng.randrange(hot_size)) % num_keys, 1
+            else:
+                yield rng.randrange(num_keys), 1
+    return generate()
+
+
+def _take(pairs, length):
+    for i, pair in enumerate(pairs):
+        if i == length:
+            return
+        yield pair
+
+
+SYNTHETIC = {
+    "zipf": lambda length, keys, seed: zipf_trace(length, keys, seed=seed),
+    "scan-loop": lambda length, keys, seed: scan_loop_trace(length, keys, loop_size=max(1, keys // 20), seed=seed),
+    "shifting": lambda length, keys, seed: shifting_trace(length, keys, max(1, keys // 50), max(1, length // 10),
+                                                          seed=seed),
+}
+
+
+def replay(cache, trace, batch_size=4096):
+    """
+    Run every (key, size) of trace through cache: get, and put on a miss
+
+    The trace is pulled batch_size pairs at a time and only the loop over
+    each ready batch is timed, so the time excludes producing the trace.
+    batch_size=None streams the trace pair by pair (no extra memory, but
+    the time then includes the trace).
+
+    Returns: dict with requests, hits, bytes, hit_bytes, seconds
+    """
+    get, put = cache.get, cache.put
+    requests = hits = total_bytes = hit_bytes = 0
+    seconds = 0.0
+    trace = iter(trace)
+    batches = [trace] if batch_size is None else iter(lambda: list(islice(trace, batch_size)), [])
+    for batch in batches:
+        start = time.perf_counter()
+        for key, size in batch:
+            requests += 1
+            total_bytes += size
+            if get(key) == -1:
+                put(key, size)
+            else:
+                hits += 1
+                hit_bytes += size
+        seconds += time.perf_counter() - start
+    return {"requests": requests, "hits": hits, "bytes": total_bytes, "hit_bytes": hit_bytes,
+            "seconds": seconds}
+
+
+def simulate(make_trace, policies, capacities, measure_memory=True):
+    """
+    Replay the trace for every policy and capacity
+
+    Args:
+        make_trace: Zero-argument callable returning a fresh (key, size) iterator
+        policies: Policy names / "module:Class" specs
+        capacities: Capacity points (entries, or bytes for size-aware caches)
+        measure_memory: Also replay under tracemalloc for the peak (second pass)
+
+    Returns: One result dict per point, in policies x capacities order
+    """
+    results = []
+    for policy in policies:
+        factory = load_factory(policy)
+        for capacity in capacities:
+            counts = replay(factory(capacity), make_trace())
+            elapsed = counts.pop("seconds")
+            peak = None
+            if measure_memory:
+                trace = make_trace()   # generator tables are built before tracing starts
+                tracemalloc.start()
+                replay(factory(capacity), trace, batch_size=None)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            requests = counts["requests"] or 1
+            results.append({
+                "policy": policy,
+                "capacity": capacity,
+                "hit_ratio": counts["hits"] / requests,
+                "byte_hit_ratio": counts["hit_bytes"] / (counts["bytes"] or 1),
+                "ops_per_s": counts["requests"] / elapsed if elapsed else 0.0,
+                "peak_bytes": peak,
+                **counts,
+            })
+    return results
+
+
+def print_results(results):
+    width = max([6] + [len(r["policy"]) for r in results])
+    print(f"  {'policy':<{width}} {'capacity':>10} {'hit ratio':>10} {'byte hits':>10} {'ops/s':>11} {'peak MB':>8}")
+    for r in results:
+        peak = f"{r['peak_bytes'] / 2**20:8.1f}" if r["peak_bytes"] is not None else f"{'-':>8}"
+        print(f"  {r['policy']:<{width}} {r['capacity']:>10,} {r['hit_ratio']:>10.3f} {r['byte_hit_ratio']:>10.3f} "
+              f"{r['ops_per_s']:>11,.0f} {peak}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a cache access trace through cache policies")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--trace", help='text file, "key" or "key size" per line (.gz ok)')
+    source.add_argument("--synthetic", choices=sorted(SYNTHETIC), default="zipf")
+    parser.add_argument("--length", type=int, default=1_000_000, help="synthetic requests")
+    parser.add_argument("--keys", type=int, default=100_000, help="synthetic key space")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policies", default="lru,lfu,arc,w-tinylfu")
+    parser.add_argument("--capacities", default="1000,10000")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args(argv)
+    if args.keys < 1 or args.length < 0:
+        parser.error("--keys must be >= 1 and --length >= 0")
+
+    if args.trace:
+        def make_trace():
+            return read_trace(args.trace)
+        label = args.trace
+    else:
+        def make_trace():
+            return SYNTHETIC[args.synthetic](args.length, args.keys, args.seed)
+        label = f"{args.synthetic}, {args.length:,} requests over {args.keys:,} keys, seed {args.seed}"
+    print(f"Trace: {label}")
+    print_results(simulate(make_trace, args.policies.split(","),
+                           [int(c) for c in args.capacities.split(",")],
+                           measure_memory=not args.no_memory))
+
+
+def benchmark(length=100_000, num_keys=50_000, capacities=(500, 5_000)):
+    """The count-based policies on every synthetic workload"""
+    policies = ["lru", "lfu", "arc", "w-tinylfu"]
+    for name, make in SYNTHETIC.items():
+        print(f"\nBenchmark: {name}, {length:,} requests over {num_keys:,} keys")
+        print_results(simulate(lambda: make(length, num_keys, 0), policies, capacities))
+
+
+# Test cases
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    if len(sys.argv) > 1:
+        main()
+        sys.exit()
+
+    from LRU_cache import LRUCache
+
+    # Test 1: Replay counts match a hand-driven LRUCache
+    print("Test 1: Replay statistics")
+    keys = [1, 2, 1, 3, 2, 4, 1, 1]
+    for batch_size in (None, 1, 3, 4096):
+        counts = replay(LRUCache(2), ((k, 10 * k) for k in keys), batch_size)
+        assert counts.pop("seconds") >= 0
+        # LRU(2): miss miss hit miss miss miss miss hit
+        assert counts == {"requests": 8, "hits": 2, "bytes": 150, "hit_bytes": 20}
+    print("✓ Passed")
+
+    # Test 2: Trace files, with and without sizes, gzip
+    print("\nTest 2: Reading trace files")
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "keys.txt")
+        with open(plain, "w") as f:
+            f.write("# key size\na 100\nb 5\n\na 100\nc\n")
+        packed = os.path.join(tmp, "keys.txt.gz")
+        with gzip.open(packed, "wt") as f:
+            f.write("a 100\nb 5\na 100\nc\n")
+        for path in (plain, packed):
+            assert list(read_trace(path)) == [("a", 100), ("b", 5), ("a", 100), ("c", 1)]
+        (row,) = simulate(lambda: read_trace(plain), ["weighted-lru"], [105], measure_memory=False)
+        assert row["hits"] == 1 and row["hit_bytes"] == 100 and abs(row["byte_hit_ratio"] - 100 / 206) < 1e-12
+        (row,) = simulate(lambda: read_trace(plain), ["weighted-lru"], [104], measure_memory=False)
+        assert row["hits"] == 0   # "b" pushes "a" out before its reuse
+    print("✓ Passed")
+
+    # Test 3: Generators are reproducible and shaped as described
+    print("\nTest 3: Synthetic generators")
+    for name, make in SYNTHETIC.items():
+        first = list(make(20_000, 1_000, 7))
+        assert len(first) == 20_000 and first == list(make(20_000, 1_000, 7))
+        assert first != list(make(20_000, 1_000, 8))
+        for keys in (1, 10):                    # tiny key spaces / traces still work
+            assert len(list(make(5, keys, 0))) == 5
+    ranks = [k for k, _ in zipf_trace(50_000, 1_000, seed=1)]
+    assert ranks.count(0) > ranks.count(1) > ranks.count(10) > ranks.count(500)
+    loop = [k for k, _ in scan_loop_trace(30_000, 1_000, loop_size=50, scan_every=10_000, scan_length=100)
+            if isinstance(k, tuple)]
+    assert [k[1] for k in loop if k[0] == "loop"][:60] == list(range(50)) + list(range(10))
+    assert sum(k[0] == "scan" for k in loop) == 200
+    phase = [k for k, _ in shifting_trace(10_000, 1_000, hot_size=20, phase_length=5_000)]
+    assert sum(0 <= k < 20 for k in phase[:5_000]) > 4_000
+    assert sum(20 <= k < 40 for k in phase[5_000:]) > 4_000
+    print("✓ Passed")
+
+    # Test 4: simulate covers every point; policies by name or module:Class
+    print("\nTest 4: simulate and policy loading")
+    results = simulate(lambda: zipf_trace(20_000, 5_000, seed=3),
+                       ["lru", "compact_lru_cache:CompactLRUCache"], [100, 2_000])
+    assert [(r["policy"], r["capacity"]) for r in results] == [
+        ("lru", 100), ("lru", 2_000),
+        ("compact_lru_cache:CompactLRUCache", 100), ("compact_lru_cache:CompactLRUCache", 2_000)]
+    assert results[0]["hit_ratio"] == results[2]["hit_ratio"] < results[1]["hit_ratio"] == results[3]["hit_ratio"]
+    assert 0 < results[0]["peak_bytes"] < results[1]["peak_bytes"]
+    try:
+        load_factory("nope")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
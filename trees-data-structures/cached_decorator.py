@@ -0,0 +1,351 @@
+"""
+Algorithm: Memoization decorator with single-flight loading (threads + asyncio)
+Time Complexity: O(1) per call on top of the wrapped function
+Space Complexity: O(capacity + keys currently loading)
+Category: Trees & Data Structures - Cache / Concurrency
+
+Description:
+    @cached(capacity=..., ttl=...) memoizes a function in a WeightedLRUCache
+    (every entry weighs 1, so capacity counts entries and TTL comes for free).
+
+    Cache stampede: when a hot key expires, every concurrent request misses
+    and recomputes it at the same time. Single-flight fixes that: the first
+    caller to miss becomes the *leader* and registers an in-flight future
+    for the key; everyone else who misses while it is loading waits on that
+    future instead of calling the function. The leader stores the result,
+    resolves the future and removes it, all under one lock so a caller sees
+    either the cached value, the in-flight future, or neither.
+
+    - Plain functions: concurrent.futures.Future, waiters block in result()
+    - async def functions: asyncio.Future, waiters await it (one event loop)
+    - Exceptions are not cached; the leader's exception is raised in every
+      waiter of that flight. If an async leader is cancelled, its waiters
+      start a new flight rather than inheriting the cancellation.
+
+    stats() reports hits, misses (= loads), coalesced (waited on another
+    caller's load) and errors.
+
+Use Cases:
+    - Expensive loaders (DB queries, RPCs, rendering) behind request handlers
+    - Protecting a backend from thundering herds after expiry / restarts
+    - Async web services memoizing coroutine results
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (as the storage)
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Future
+
+from weighted_lru_cache import WeightedLRUCache
+
+_KWARGS_MARK = object()   # separates positional from keyword arguments in keys
+
+
+def _make_key(args, kwargs):
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def cached(capacity=128, ttl=None, clock=time.monotonic):
+    """
+    Memoize a function or coroutine function with single-flight loading
+
+    Args:
+        capacity: Maximum number of cached results (LRU eviction)
+        ttl: Seconds a result stays valid (None = until evicted)
+        clock: Monotonic time source for TTLs (injectable for tests)
+
+    Returns:
+        Decorator; the wrapped function gains stats() and cache_clear()
+
+    Arguments must be hashable, as with functools.lru_cache.
+    """
+    def decorator(fn):
+        # values are stored as 1-tuples so a cached -1 is not mistaken for a miss
+        cache = WeightedLRUCache(capacity, weigher=lambda entry: 1, ttl=ttl, clock=clock)
+        lock = threading.Lock()
+        inflight = {}   # key -> future of the load in progress
+        counts = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+        def lookup(key, new_future):
+            """
+            Under the lock: (value tuple, None) on a hit, else (future, leader?)
+            """
+            with lock:
+                entry = cache.get(key)
+                if entry != -1:
+                    counts["hits"] += 1
+                    return entry, None
+                future = inflight.get(key)
+                if future is not None:
+                    counts["coalesced"] += 1
+                    return future, False
+                future = inflight[key] = new_future()
+                counts["misses"] += 1
+                return future, True
+
+        def finish(key, value=None, failed=False):
+            """Under the lock: store the leader's result (unless it failed) and end the flight"""
+            with lock:
+                del inflight[key]
+                if failed:
+                    counts["errors"] += 1
+                else:
+                    cache.put(key, (value,))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                while True:
+                    found, leader = lookup(key, lambda: asyncio.get_running_loop().create_future())
+                    if leader is None:
+                        return found[0]
+                    if not leader:
+                        try:
+                            return await asyncio.shield(found)
+                        except asyncio.CancelledError:
+                            if found.cancelled():
+                                continue   # leader was cancelled: try to lead a new flight
+                            raise
+                    try:
+                        value = await fn(*args, **kwargs)
+                    except asyncio.CancelledError:
+                        finish(key, failed=True)
+                        found.cancel()
+                        raise
+                    except BaseException as exc:
+                        finish(key, failed=True)
+                        found.set_exception(exc)
+                        found.exception()   # mark retrieved: no "never retrieved" warning without waiters
+                        raise
+                    finish(key, value)
+                    found.set_result(value)
+                    return value
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                found, leader = lookup(key, Future)
+                if leader is None:
+                    return found[0]
+                if not leader:
+                    return found.result()
+                try:
+                    value = fn(*args, **kwargs)
+                except BaseException as exc:
+                    finish(key, failed=True)
+                    found.set_exception(exc)
+                    raise
+                finish(key, value)
+                found.set_result(value)
+                return value
+
+        def stats():
+            with lock:
+                return dict(counts, size=len(cache), loading=len(inflight))
+
+        def cache_clear():
+            with lock:
+                cache.__init__(capacity, weigher=lambda entry: 1, ttl=ttl, clock=clock)
+                for name in counts:
+                    counts[name] = 0
+
+        wrapper.stats = stats
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def benchmark(num_threads=32, hot_keys=4, rounds=20, load_time=0.01):
+    """
+    Backend calls during a stampede: N threads missing the same few keys at
+    once, hand-rolled get/put around LRUCache vs @cached single-flight
+    """
+    from LRU_cache import LRUCache
+
+    calls = {"count": 0}
+    calls_lock = threading.Lock()
+
+    def load(k):
+        with calls_lock:
+            calls["count"] += 1
+        time.sleep(load_time)
+        return k * 2
+
+    plain, plain_lock = LRUCache(1000), threading.Lock()
+
+    def manual(k):
+        with plain_lock:
+            value = plain.get(k)
+        if value == -1:
+            value = load(k)
+            with plain_lock:
+                plain.put(k, value)
+        return value
+
+    single_flight = cached(capacity=1000)(load)
+
+    print(f"\nBenchmark: {num_threads} threads x {rounds} stampedes on {hot_keys} keys, {load_time * 1000:.0f} ms loads")
+    for name, fn, reset in (("manual get/put", manual, lambda: plain.__init__(1000)),
+                            ("@cached", single_flight, single_flight.cache_clear)):
+        calls["count"] = 0
+        start = time.perf_counter()
+        for r in range(rounds):
+            reset()   # everything expired at once
+            barrier = threading.Barrier(num_threads)
+
+            def worker(i):
+                barrier.wait()
+                fn(i % hot_keys)
+
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<15} backend calls {calls['count']:>5}  ({calls['count'] / rounds:.1f} per stampede), "
+              f"{elapsed:.2f}s")
+    print(f"  @cached stats: {single_flight.stats()}")
+
+
+# Test cases
+if __name__ == "__main__":
+    # Test 1: Memoizes, respects capacity, -1 and None are real values
+    print("Test 1: Basic memoization")
+    calls = []
+
+    @cached(capacity=2)
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset if x >= 0 else -1
+
+    assert square(3) == 9 and square(3) == 9
+    assert square(-5) == -1 and square(-5) == -1
+    assert calls == [3, -5]
+    assert square(3, offset=1) == 10          # keyword arguments are part of the key
+    assert square(3) == 9 and calls == [3, -5, 3, 3]   # capacity 2: plain square(3) was LRU
+    assert square.stats()["hits"] == 2 and square.stats()["misses"] == 4
+    assert square.__name__ == "square"
+    print("✓ Passed")
+
+    # Test 2: TTL
+    print("\nTest 2: TTL expiry")
+    now = [0.0]
+
+    @cached(capacity=10, ttl=5, clock=lambda: now[0])
+    def stamp(x):
+        calls.append(("stamp", x))
+        return now[0]
+
+    assert stamp(1) == 0.0
+    now[0] = 4.0
+    assert stamp(1) == 0.0
+    now[0] = 6.0
+    assert stamp(1) == 6.0
+    print("✓ Passed")
+
+    # Test 3: Thread stampede coalesces into one call
+    print("\nTest 3: Single flight across threads")
+    loads = []
+    release = threading.Event()
+
+    @cached(capacity=10)
+    def slow(x):
+        loads.append(x)
+        release.wait()
+        return x + 100
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(7))) for _ in range(16)]
+    for t in threads:
+        t.start()
+    while slow.stats()["coalesced"] < 15:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    assert loads == [7] and results == [107] * 16
+    assert slow.stats() == {"hits": 0, "misses": 1, "coalesced": 15, "errors": 0, "size": 1, "loading": 0}
+    print("✓ Passed")
+
+    # Test 4: Errors reach every waiter and are not cached
+    print("\nTest 4: Exceptions propagate, not cached")
+    attempts = []
+    gate = threading.Event()
+
+    @cached()
+    def flaky(x):
+        attempts.append(x)
+        gate.wait()
+        if len(attempts) == 1:
+            raise RuntimeError("backend down")
+        return "ok"
+
+    errors = []
+
+    def call():
+        try:
+            flaky(1)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    while flaky.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(errors) == 4 and attempts == [1]
+    assert flaky(1) == "ok" and attempts == [1, 1]
+    assert flaky.stats()["errors"] == 1
+    print("✓ Passed")
+
+    # Test 5: asyncio single flight, cancellation of the leader
+    print("\nTest 5: async def support")
+
+    async def main():
+        loads = []
+
+        @cached(capacity=10)
+        async def fetch(x):
+            loads.append(x)
+            await asyncio.sleep(0.01)
+            return x * 3
+
+        assert await asyncio.gather(*(fetch(5) for _ in range(50))) == [15] * 50
+        assert await fetch(5) == 15
+        assert loads == [5]
+        assert fetch.stats()["coalesced"] == 49 and fetch.stats()["hits"] == 1
+
+        leader = asyncio.ensure_future(fetch(6))
+        await asyncio.sleep(0)           # leader starts loading
+        follower = asyncio.ensure_future(fetch(6))
+        await asyncio.sleep(0)           # follower waits on the flight
+        leader.cancel()
+        assert await follower == 18      # follower reloads instead of failing
+        assert leader.cancelled()
+        assert loads == [5, 6, 6]
+
+        @cached()
+        async def broken(x):
+            raise ValueError(x)
+
+        results = await asyncio.gather(broken(1), broken(1), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+    asyncio.run(main())
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
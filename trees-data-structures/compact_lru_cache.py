@@ -0,0 +1,234 @@
+"""
+Algorithm: Compact LRU Cache (recency list in preallocated index arrays)
+Time Complexity: O(1) for both get and put
+Space Complexity: O(capacity), allocated up front
+Category: Trees & Data Structures - Cache
+
+Description:
+    Every LRUCache entry is a Node object with its own __dict__ holding
+    key, value, prev and next - roughly 150 bytes of bookkeeping before the
+    cached value itself, plus the dict slot that points at the node.
+
+    Here the nodes become *slots* 1..capacity in parallel arrays:
+
+        prev, next: array('i')  - 4 bytes each, the linked list as indices
+        keys, values: list       - one 8-byte reference each
+        index: dict key -> slot
+
+    Slot 0 is a sentinel that plays both dummy head and dummy tail
+    (next[0] = MRU, prev[0] = LRU), so the list is circular and no edge
+    cases appear. Unused slots form a free list threaded through next[];
+    an eviction pushes the LRU slot back on it and the insert that caused
+    the eviction pops it right off again - nothing is allocated per entry
+    except the dict slot.
+
+    Semantics match LRUCache exactly (get returns -1 on a miss).
+
+Use Cases:
+    - Caches with millions of small entries where bookkeeping dominates
+    - Memory-constrained processes, predictable footprint (allocated once)
+
+LeetCode Problems:
+    - Problem #146: LRU Cache
+"""
+
+from array import array
+
+
+class CompactLRUCache:
+    def __init__(self, capacity: int):
+        """
+        Initialize cache with given capacity
+
+        Args:
+            capacity: Maximum number of key-value pairs (< 2^31)
+        """
+        self.capacity = max(capacity, 0)
+        n = self.capacity + 1
+        self.prev = array("i", bytes(4 * n))   # all zeros: empty circular list around slot 0
+        self.next = array("i", bytes(4 * n))
+        self.keys = [None] * n
+        self.values = [None] * n
+        self.index = {}   # key -> slot
+
+        # free list: 1 -> 2 -> ... -> capacity -> 0 (end)
+        for slot in range(1, self.capacity):
+            self.next[slot] = slot + 1
+        self.free = 1 if self.capacity else 0
+
+    def __len__(self):
+        return len(self.index)
+
+    def _unlink(self, slot):
+        """
+        Remove slot from the recency list
+
+        Time: O(1)
+        """
+        prev, nxt = self.prev, self.next
+        before, after = prev[slot], nxt[slot]
+        nxt[before] = after
+        prev[after] = before
+
+    def _push_front(self, slot):
+        """
+        Insert slot right after the sentinel (most recently used)
+
+        Time: O(1)
+        """
+        prev, nxt = self.prev, self.next
+        first = nxt[0]
+        prev[slot] = 0
+        nxt[slot] = first
+        prev[first] = slot
+        nxt[0] = slot
+
+    def get(self, key):
+        """
+        Get value for key if it exists
+
+        Returns:
+            Value if key exists, -1 otherwise
+
+        Time: O(1)
+        """
+        slot = self.index.get(key)
+        if slot is None:
+            return -1
+        if self.next[0] != slot:
+            self._unlink(slot)
+            self._push_front(slot)
+        return self.values[slot]
+
+    def put(self, key, value) -> None:
+        """
+        Add or update key-value pair, evicting the LRU entry when full
+
+        Time: O(1)
+        """
+        slot = self.index.get(key)
+        if slot is not None:
+            self.values[slot] = value
+            if self.next[0] != slot:
+                self._unlink(slot)
+                self._push_front(slot)
+            return
+        if not self.capacity:
+            return
+
+        if not self.free:   # full: recycle the LRU slot through the free list
+            lru = self.prev[0]
+            self._unlink(lru)
+            del self.index[self.keys[lru]]
+            self.keys[lru] = self.values[lru] = None
+            self.next[lru] = 0
+            self.free = lru
+
+        slot = self.free
+        self.free = self.next[slot]
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.index[key] = slot
+        self._push_front(slot)
+
+
+def benchmark(entries=1_000_000, ops=1_000_000, seed=29):
+    """
+    tracemalloc bytes per entry and get/put ops/s, LRUCache vs CompactLRUCache
+
+    Keys and values are created before tracing starts, so only the cache's
+    own bookkeeping is measured.
+    """
+    import random
+    import time
+    import tracemalloc
+
+    from LRU_cache import LRUCache
+
+    rng = random.Random(seed)
+    keys = list(range(entries))
+    workload = [rng.randrange(2 * entries) for _ in range(ops)]
+    extra = list(range(entries, 2 * entries))   # keep missed keys alive too
+
+    print(f"\nBenchmark: {entries:,} int entries, {ops:,} mixed get/put ops")
+    for cls in (LRUCache, CompactLRUCache):
+        tracemalloc.start()
+        cache = cls(entries)
+        for k in keys:
+            cache.put(k, k)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for i, k in enumerate(workload):
+            if i & 1:
+                cache.get(k)
+            else:
+                cache.put(k, k)
+        elapsed = time.perf_counter() - start
+        print(f"  {cls.__name__:<16} {current / entries:>7.1f} B/entry  "
+              f"(peak {peak / 2**20:>6.1f} MB)  {ops / elapsed:>11,.0f} ops/s")
+        del cache
+    del extra
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    from LRU_cache import LRUCache
+
+    # Test 1: LeetCode #146 example
+    print("Test 1: Basic operations")
+    lru = CompactLRUCache(2)
+    lru.put(1, 1)
+    lru.put(2, 2)
+    assert lru.get(1) == 1
+    lru.put(3, 3)      # evicts 2
+    assert lru.get(2) == -1
+    lru.put(4, 4)      # evicts 1
+    assert lru.get(1) == -1
+    assert lru.get(3) == 3
+    assert lru.get(4) == 4
+    lru.put(4, 40)
+    assert lru.get(4) == 40 and len(lru) == 2
+    print("✓ Passed")
+
+    # Test 2: Tiny capacities
+    print("\nTest 2: Capacity 0 and 1")
+    lru = CompactLRUCache(0)
+    lru.put(1, 1)
+    assert lru.get(1) == -1 and len(lru) == 0
+    lru = CompactLRUCache(1)
+    lru.put(1, 1)
+    lru.put(2, 2)
+    assert lru.get(1) == -1 and lru.get(2) == 2
+    print("✓ Passed")
+
+    # Test 3: Same results as LRUCache on random workloads
+    print("\nTest 3: Randomized against LRUCache")
+    rng = random.Random(0)
+    for capacity in (1, 2, 7, 50):
+        reference, compact = LRUCache(capacity), CompactLRUCache(capacity)
+        for _ in range(20_000):
+            k = rng.randrange(3 * capacity + 1)
+            if rng.random() < 0.5:
+                assert compact.get(k) == reference.get(k)
+            else:
+                v = rng.random()
+                compact.put(k, v)
+                reference.put(k, v)
+        order, slot = [], compact.next[0]
+        while slot:
+            order.append(compact.keys[slot])
+            slot = compact.next[slot]
+        expected, node = [], reference.head.next
+        while node is not reference.tail:
+            expected.append(node.key)
+            node = node.next
+        assert order == expected
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
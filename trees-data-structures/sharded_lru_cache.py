@@ -0,0 +1,248 @@
+"""
+Algorithm: Sharded LRU Cache (lock striping + batched recency updates)
+Time Complexity: O(1) for both get and put
+Space Complexity: O(capacity)
+Category: Trees & Data Structures - Cache / Concurrency
+
+Description:
+    LRUCache mutates its dict and linked list on every get (move to head),
+    so threads sharing one instance need a lock around every call - and
+    that single lock serializes the whole server.
+
+    Lock striping: hash(key) picks one of N independent LRUCache shards,
+    each with its own lock and capacity // N entries. Threads touching
+    different shards never wait for each other. Eviction becomes LRU per
+    shard instead of global LRU, which is indistinguishable in practice
+    once keys are spread over the shards.
+
+    Optional read buffer (read_buffer > 0), the Caffeine trick: a hit does
+    not take the lock at all. It reads the node from the shard's dict
+    (a single dict lookup is atomic in CPython) and appends the node to the
+    shard's buffer (deque.append is thread-safe). When the buffer fills, the
+    thread that notices tries the lock *without blocking* and replays the
+    buffered hits as move-to-head operations in one batch. Recency is
+    slightly stale between drains, which only affects eviction order.
+
+Use Cases:
+    - Threaded web / RPC servers sharing one in-process cache
+    - Connection, session and metadata caches with mostly reads
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (thread-safe variation)
+"""
+
+import threading
+from collections import deque
+
+from LRU_cache import LRUCache
+
+
+class ShardedLRUCache:
+    def __init__(self, capacity: int, shards: int = 16, read_buffer: int = 0):
+        """
+        Args:
+            capacity: Total key-value pairs across all shards
+            shards: Number of independently locked LRUCache segments
+            read_buffer: Hits buffered per shard before recency is applied
+                         (0 = every get takes the shard lock, exact LRU per shard)
+        """
+        shards = max(1, min(shards, capacity))
+        # spread the remainder so the shard capacities add up to capacity
+        self.shards = [LRUCache(capacity // shards + (i < capacity % shards)) for i in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+        self.read_buffer = read_buffer
+        self.buffers = [deque() for _ in range(shards)]
+
+    def _shard(self, key):
+        return hash(key) % len(self.shards)
+
+    def get(self, key):
+        """
+        Value for key, -1 if absent (same contract as LRUCache.get)
+
+        Time: O(1), amortized O(1) lock acquisitions per read_buffer hits
+        """
+        i = self._shard(key)
+        if not self.read_buffer:
+            with self.locks[i]:
+                return self.shards[i].get(key)
+
+        node = self.shards[i].cache.get(key)
+        if node is None:
+            return -1
+        buffer = self.buffers[i]
+        buffer.append(node)
+        if len(buffer) >= self.read_buffer and self.locks[i].acquire(blocking=False):
+            try:
+                self._drain(i)
+            finally:
+                self.locks[i].release()
+        return node.value
+
+    def _drain(self, i):
+        """Apply buffered hits to shard i's recency list (lock held)"""
+        shard, buffer = self.shards[i], self.buffers[i]
+        for _ in range(len(buffer)):
+            node = buffer.popleft()
+            if shard.cache.get(node.key) is node:   # skip nodes evicted meanwhile
+                shard._move_to_head(node)
+
+    def put(self, key, value) -> None:
+        """
+        Add or update key-value pair in its shard
+
+        Time: O(1)
+        """
+        i = self._shard(key)
+        with self.locks[i]:
+            if self.read_buffer:
+                self._drain(i)   # recent hits count before picking a victim
+            self.shards[i].put(key, value)
+
+    def __len__(self):
+        return sum(len(shard.cache) for shard in self.shards)
+
+
+class LockedLRUCache:
+    """
+    Baseline: one LRUCache behind one global lock
+    """
+    def __init__(self, capacity: int):
+        self._cache = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._cache.put(key, value)
+
+    def __len__(self):
+        return len(self._cache.cache)
+
+
+def benchmark(num_threads=8, duration=2.0, capacity=10_000, num_keys=50_000, read_ratio=0.9, seed=23):
+    """
+    Multi-threaded ops/s: single-lock LRUCache vs ShardedLRUCache (with and
+    without the read buffer) on a skewed key distribution
+
+    Under the GIL only one thread runs Python at a time, so the gain comes
+    from fewer lock hand-offs and convoys, not from parallel execution.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    # ~Zipf: a few hot keys get most traffic
+    keys = [int(num_keys ** rng.random()) for _ in range(100_000)]
+
+    print(f"\nBenchmark: {num_threads} threads, {read_ratio:.0%} get, capacity {capacity:,}, {duration}s each")
+    for name, make in (("single lock", lambda: LockedLRUCache(capacity)),
+                       ("sharded x16", lambda: ShardedLRUCache(capacity, shards=16)),
+                       ("sharded x16 + read buffer", lambda: ShardedLRUCache(capacity, shards=16, read_buffer=32))):
+        cache = make()
+        for k in keys[:capacity]:
+            cache.put(k, k)
+        go, stop = threading.Event(), threading.Event()
+        ops, hits = [0] * num_threads, [0] * num_threads
+
+        def worker(idx):
+            local = random.Random(idx)
+            count = hit = 0
+            go.wait()
+            while not stop.is_set():
+                for _ in range(100):
+                    k = keys[local.randrange(len(keys))]
+                    if local.random() < read_ratio:
+                        hit += cache.get(k) != -1
+                    else:
+                        cache.put(k, k)
+                count += 100
+            ops[idx], hits[idx] = count, hit
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+        for t in threads:
+            t.start()
+        go.set()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        total = sum(ops)
+        print(f"  {name:<26} {total / duration:>12,.0f} ops/s  hit ratio {sum(hits) / (total * read_ratio):.3f}")
+
+
+# Test cases
+if __name__ == "__main__":
+    # Test 1: Same behaviour as LRUCache with a single shard
+    print("Test 1: One shard behaves like LRUCache")
+    cache = ShardedLRUCache(2, shards=1)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    assert cache.get(1) == 1
+    cache.put(3, 3)   # evicts 2
+    assert cache.get(2) == -1
+    cache.put(4, 4)   # evicts 1
+    assert cache.get(1) == -1
+    assert cache.get(3) == 3
+    assert cache.get(4) == 4
+    cache.put(4, 40)
+    assert cache.get(4) == 40
+    print("✓ Passed")
+
+    # Test 2: Capacity split across shards
+    print("\nTest 2: Total capacity respected")
+    cache = ShardedLRUCache(100, shards=7)
+    assert sum(s.capacity for s in cache.shards) == 100
+    for k in range(1000):
+        cache.put(k, k)
+    assert len(cache) <= 100
+    assert len(ShardedLRUCache(3, shards=16).shards) == 3
+    print("✓ Passed")
+
+    # Test 3: Read buffer still protects hot keys from eviction
+    print("\nTest 3: Buffered hits are applied before eviction")
+    cache = ShardedLRUCache(4, shards=1, read_buffer=8)
+    for k in range(4):
+        cache.put(k, k)
+    assert cache.get(0) == 0   # buffered, list order unchanged yet
+    cache.put(4, 4)            # drains first: 0 becomes MRU, 1 is evicted
+    assert cache.get(0) == 0
+    assert cache.get(1) == -1
+    print("✓ Passed")
+
+    # Test 4: Concurrent use keeps every shard's dict and list in sync
+    print("\nTest 4: Threads hammering the same cache")
+    import random
+    for read_buffer in (0, 16):
+        cache = ShardedLRUCache(500, shards=8, read_buffer=read_buffer)
+
+        def hammer(seed):
+            rng = random.Random(seed)
+            for _ in range(20_000):
+                k = rng.randrange(2000)
+                if rng.random() < 0.7:
+                    v = cache.get(k)
+                    assert v == -1 or v == k * 10
+                else:
+                    cache.put(k, k * 10)
+
+        threads = [threading.Thread(target=hammer, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for shard in cache.shards:
+            seen, node = [], shard.head.next
+            while node is not shard.tail:
+                seen.append(node.key)
+                node = node.next
+            assert len(seen) == len(set(seen)) == len(shard.cache) <= shard.capacity
+            assert set(seen) == set(shard.cache)
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
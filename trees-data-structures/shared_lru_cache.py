@@ -0,0 +1,461 @@
+"""
+Algorithm: Cross-process LRU Cache in shared memory (fixed slots, index links)
+Time Complexity: O(1) expected for both get and put
+Space Complexity: O(capacity x (max_key_size + max_value_size)), allocated up front
+Category: Trees & Data Structures - Cache / Concurrency
+
+Description:
+    Pre-forked worker processes each holding an LRUCache cache every hot key
+    once per worker, and each worker only sees its own share of the traffic.
+    SharedLRUCache puts one cache in a multiprocessing.shared_memory block
+    that all workers on the host attach to.
+
+    Pointers do not survive between processes, so everything is an index
+    into the shared block (the CompactLRUCache layout, in shared memory):
+
+        per shard, int32 arrays over slots 0..n (slot 0 = sentinel):
+            prev, next      recency list, next[0] = MRU, prev[0] = LRU
+            chain           next slot in the same hash bucket (0 = end)
+            hash, klen, vlen
+        buckets[b]          first slot of the bucket's chain
+        free, count         free list head (threaded through next[]), size
+        data                slot i -> max_key_size + max_value_size bytes
+
+    Keys and values are pickled; keys are found by crc32 of their pickled
+    bytes (stable across processes, unlike hash() of a str) and compared
+    byte-wise. That only matches keys that pickle the same way in every
+    process, so keys are restricted to str, bytes, int and tuples of those,
+    converted to the exact base types first (True is stored as 1, like it
+    is in a dict); floats, frozensets (whose pickle follows the per-process
+    hash order) and other types raise TypeError. A value that pickles to more than max_value_size bytes is not
+    cached, just like an over-budget value in WeightedLRUCache.
+
+    Fine-grained locking: as in ShardedLRUCache, the hash picks one of N
+    shards, each a complete LRU with its own multiprocessing.Lock. Workers
+    only contend when they touch the same shard, and pickling happens
+    outside the lock. Eviction is LRU per shard.
+
+    Sharing: create the cache in the parent before starting the workers and
+    pass it to them (inherited on fork, pickled by name on spawn). Call
+    close() in every process and unlink() once in the creator. A worker
+    killed while holding a shard lock leaves that shard locked.
+
+Use Cases:
+    - Pre-fork web servers (gunicorn, uWSGI) and multiprocessing pools
+    - Sharing expensive lookups between CPU-bound worker processes
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (multi-process variation)
+"""
+
+import multiprocessing
+import os
+import pickle
+import zlib
+from multiprocessing.shared_memory import SharedMemory
+
+FREE, COUNT, HEADER = 0, 1, 2   # per-shard header ints
+
+
+class SharedLRUCache:
+    def __init__(self, capacity, max_value_size=1024, max_key_size=64, shards=16, name=None,
+                 context=None):
+        """
+        Create the shared block (the creating process owns it)
+
+        Args:
+            capacity: Total key-value pairs across all shards
+            max_value_size: Largest pickled value that is cached, in bytes
+            max_key_size: Largest pickled key, in bytes (larger keys raise ValueError)
+            shards: Number of independently locked segments
+            name: Shared memory name (None = generated)
+            context: multiprocessing context the workers are started with
+                     (its locks must match; None = the default context)
+        """
+        self.capacity = max(capacity, 0)
+        self.num_shards = max(1, min(shards, self.capacity))
+        self.max_value_size = max_value_size
+        self.max_key_size = max_key_size
+        self.slots = -(-self.capacity // self.num_shards)   # per shard, ceil
+        context = context or multiprocessing.get_context()
+        self.locks = [context.Lock() for _ in range(self.num_shards)]
+        self._layout()
+        self.shm = SharedMemory(name=name, create=True, size=self.size)
+        self._map()
+
+        for s in range(self.num_shards):
+            # spread the remainder so the shard capacities add up to capacity
+            shard_capacity = self.capacity // self.num_shards + (s < self.capacity % self.num_shards)
+            base = s * self.shard_ints
+            nxt = base + self.NEXT
+            for slot in range(1, shard_capacity):
+                self.ints[nxt + slot] = slot + 1
+            self.ints[base + FREE] = 1 if shard_capacity else 0
+
+    def _layout(self):
+        """Offsets of every array in the shared block"""
+        n = self.slots + 1
+        self.buckets = 1 << (2 * n - 1).bit_length()   # load factor <= 0.5
+        self.PREV = HEADER
+        self.NEXT = self.PREV + n
+        self.CHAIN = self.NEXT + n
+        self.HASH = self.CHAIN + n
+        self.KLEN = self.HASH + n
+        self.VLEN = self.KLEN + n
+        self.BUCKETS = self.VLEN + n
+        self.shard_ints = self.BUCKETS + self.buckets
+        self.slot_bytes = self.max_key_size + self.max_value_size
+        self.data_start = 4 * self.shard_ints * self.num_shards
+        self.shard_bytes = n * self.slot_bytes
+        self.size = self.data_start + self.num_shards * self.shard_bytes
+
+    def _map(self):
+        self.header = self.shm.buf[:self.data_start]
+        self.ints = self.header.cast("i")
+        self.data = self.shm.buf
+
+    def __getstate__(self):
+        """Picklable by name (for multiprocessing spawn): the block is not copied"""
+        state = self.__dict__.copy()
+        state["shm"] = self.shm.name
+        del state["header"], state["ints"], state["data"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.shm = SharedMemory(name=state["shm"])
+        self._map()
+
+    def __len__(self):
+        return sum(self.ints[s * self.shard_ints + COUNT] for s in range(self.num_shards))
+
+    def _locate(self, key):
+        """(pickled key, hash, shard) for key"""
+        kbytes = pickle.dumps(_canonical_key(key))
+        if len(kbytes) > self.max_key_size:
+            raise ValueError(f"key pickles to {len(kbytes)} bytes > max_key_size={self.max_key_size}")
+        h = zlib.crc32(kbytes) & 0x7FFFFFFF
+        return kbytes, h, h % self.num_shards
+
+    def _bucket(self, base, h):
+        return base + self.BUCKETS + (h // self.num_shards) % self.buckets
+
+    def _find(self, base, dbase, h, kbytes):
+        """Slot holding kbytes in this shard, 0 if none. Caller holds the lock"""
+        ints, data = self.ints, self.data
+        slot = ints[self._bucket(base, h)]
+        while slot:
+            if ints[base + self.HASH + slot] == h and ints[base + self.KLEN + slot] == len(kbytes):
+                offset = dbase + slot * self.slot_bytes
+                if data[offset:offset + len(kbytes)] == kbytes:
+                    return slot
+            slot = ints[base + self.CHAIN + slot]
+        return 0
+
+    def _unlink(self, base, slot):
+        """Remove slot from the recency list"""
+        ints = self.ints
+        before, after = ints[base + self.PREV + slot], ints[base + self.NEXT + slot]
+        ints[base + self.NEXT + before] = after
+        ints[base + self.PREV + after] = before
+
+    def _push_front(self, base, slot):
+        """Insert slot right after the sentinel (most recently used)"""
+        ints = self.ints
+        first = ints[base + self.NEXT]
+        ints[base + self.PREV + slot] = 0
+        ints[base + self.NEXT + slot] = first
+        ints[base + self.PREV + first] = slot
+        ints[base + self.NEXT] = slot
+
+    def _remove(self, base, slot):
+        """Drop slot from list and bucket chain, return it to the free list"""
+        ints = self.ints
+        self._unlink(base, slot)
+        link = self._bucket(base, ints[base + self.HASH + slot])
+        while ints[link] != slot:
+            link = base + self.CHAIN + ints[link]
+        ints[link] = ints[base + self.CHAIN + slot]
+        ints[base + self.NEXT + slot] = ints[base + FREE]
+        ints[base + FREE] = slot
+        ints[base + COUNT] -= 1
+
+    def get(self, key):
+        """
+        Value for key, -1 if absent (same contract as LRUCache.get)
+
+        Time: O(1) expected
+        """
+        kbytes, h, s = self._locate(key)
+        base, dbase = s * self.shard_ints, self.data_start + s * self.shard_bytes
+        with self.locks[s]:
+            slot = self._find(base, dbase, h, kbytes)
+            if not slot:
+                return -1
+            if self.ints[base + self.NEXT] != slot:
+                self._unlink(base, slot)
+                self._push_front(base, slot)
+            offset = dbase + slot * self.slot_bytes + self.max_key_size
+            value = bytes(self.data[offset:offset + self.ints[base + self.VLEN + slot]])
+        return pickle.loads(value)
+
+    def put(self, key, value) -> None:
+        """
+        Add or update key-value pair, evicting the shard's LRU entry when full
+
+        Time: O(1) expected
+        """
+        kbytes, h, s = self._locate(key)
+        vbytes = pickle.dumps(value)
+        if not self.capacity:
+            return
+        ints, data = self.ints, self.data
+        base, dbase = s * self.shard_ints, self.data_start + s * self.shard_bytes
+        with self.locks[s]:
+            slot = self._find(base, dbase, h, kbytes)
+            if len(vbytes) > self.max_value_size:
+                if slot:
+                    self._remove(base, slot)   # the stale old value is gone too
+                return
+            if not slot:
+                if not ints[base + FREE]:   # full: recycle the LRU slot
+                    self._remove(base, ints[base + self.PREV])
+                slot = ints[base + FREE]
+                ints[base + FREE] = ints[base + self.NEXT + slot]
+                ints[base + self.HASH + slot] = h
+                ints[base + self.KLEN + slot] = len(kbytes)
+                offset = dbase + slot * self.slot_bytes
+                data[offset:offset + len(kbytes)] = kbytes
+                bucket = self._bucket(base, h)
+                ints[base + self.CHAIN + slot] = ints[bucket]
+                ints[bucket] = slot
+                ints[base + COUNT] += 1
+                self._push_front(base, slot)
+            elif ints[base + self.NEXT] != slot:
+                self._unlink(base, slot)
+                self._push_front(base, slot)
+            offset = dbase + slot * self.slot_bytes + self.max_key_size
+            data[offset:offset + len(vbytes)] = vbytes
+            ints[base + self.VLEN + slot] = len(vbytes)
+
+    def close(self):
+        """Detach this process from the block"""
+        self.ints.release()
+        self.header.release()
+        self.data = None
+        self.shm.close()
+
+    def unlink(self):
+        """Free the block (creator only, after every process has closed it)"""
+        self.shm.unlink()
+
+
+def _canonical_key(key):
+    """
+    key as plain str / bytes / int / tuples of those, so that equal keys
+    pickle to the same bytes in every process
+
+    Raises:
+        TypeError: For any other key type
+    """
+    kind = type(key)
+    if kind is str or kind is bytes or kind is int:
+        return key
+    if isinstance(key, str):
+        return str.__str__(key)
+    if isinstance(key, bytes):
+        return bytes(key)
+    if isinstance(key, int):          # bool, IntEnum
+        return int(key)
+    if isinstance(key, tuple):
+        return tuple(_canonical_key(k) for k in key)
+    raise TypeError(f"SharedLRUCache keys must be str, bytes, int or tuples of those, not {kind.__name__}")
+
+
+def _compute(key, value_size):
+    """Stand-in for an expensive miss: ~0.1 ms of iterated SHA-256"""
+    import hashlib
+
+    digest = key.to_bytes(8, "little")
+    for _ in range(300):
+        digest = hashlib.sha256(digest).digest()
+    return digest * (value_size // len(digest))
+
+
+def _worker(cache, capacity, trace, value_size, hits, i):
+    from LRU_cache import LRUCache
+
+    if cache is None:   # private cache per worker
+        cache = LRUCache(capacity)
+    count = 0
+    for key in trace:
+        if cache.get(key) != -1:
+            count += 1
+        else:
+            cache.put(key, _compute(key, value_size))
+    hits[i] = count
+    if isinstance(cache, SharedLRUCache):
+        cache.close()
+
+
+def benchmark(workers=8, capacity=8_000, num_keys=100_000, requests=10_000, value_size=192, seed=41):
+    """
+    Hit ratio, recomputes and wall time of `workers` processes with private
+    LRUCaches of capacity // workers each (same total memory) vs one
+    SharedLRUCache(capacity), when a miss costs a real computation
+    """
+    import random
+    import time
+
+    print(f"\nBenchmark: {workers} processes x {requests:,} Zipf-like requests over {num_keys:,} keys, "
+          f"{capacity:,} entries in total, {os.cpu_count()} CPUs")
+    rng = random.Random(seed)
+    traces = [[int(num_keys ** rng.random()) for _ in range(requests)] for _ in range(workers)]
+    for name in ("private LRUCache", "SharedLRUCache"):
+        cache = SharedLRUCache(capacity, max_value_size=value_size + 64) if name == "SharedLRUCache" else None
+        hits = multiprocessing.Array("i", workers)
+        start = time.perf_counter()
+        procs = [multiprocessing.Process(target=_worker,
+                                         args=(cache, capacity // workers, traces[i], value_size, hits, i))
+                 for i in range(workers)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+        total = workers * requests
+        print(f"  {name:<17} hit ratio {sum(hits) / total:.3f}  recomputes {total - sum(hits):>7,}  "
+              f"{total / elapsed:>8,.0f} req/s  ({elapsed:.2f}s)")
+        if cache is not None:
+            cache.close()
+            cache.unlink()
+
+
+def _hammer(cache, seed, rounds):
+    import random
+
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        k = rng.randrange(200)
+        if rng.random() < 0.5:
+            got = cache.get(k)
+            assert got == -1 or got == ("v", k), got
+        else:
+            cache.put(k, ("v", k))
+    cache.close()
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    from LRU_cache import LRUCache
+
+    def check_structure(cache):
+        """Recency lists, bucket chains, free lists and counts all agree"""
+        ints = cache.ints
+        for s in range(cache.num_shards):
+            base = s * cache.shard_ints
+            listed, slot = [], ints[base + cache.NEXT]
+            while slot:
+                listed.append(slot)
+                slot = ints[base + cache.NEXT + slot]
+            chained = []
+            for b in range(cache.buckets):
+                slot = ints[base + cache.BUCKETS + b]
+                while slot:
+                    chained.append(slot)
+                    slot = ints[base + cache.CHAIN + slot]
+            free, slot = [], ints[base + FREE]
+            while slot:
+                free.append(slot)
+                slot = ints[base + cache.NEXT + slot]
+            assert sorted(listed) == sorted(chained) and len(listed) == ints[base + COUNT]
+            assert not set(listed) & set(free)
+
+    # Test 1: LeetCode #146 example
+    print("Test 1: Basic operations")
+    lru = SharedLRUCache(2, shards=1)
+    lru.put(1, 1)
+    lru.put(2, 2)
+    assert lru.get(1) == 1
+    lru.put(3, 3)      # evicts 2
+    assert lru.get(2) == -1
+    lru.put(4, 4)      # evicts 1
+    assert lru.get(1) == -1
+    assert lru.get(3) == 3
+    assert lru.get(4) == 4
+    lru.put(4, "forty")
+    assert lru.get(4) == "forty" and len(lru) == 2
+    lru.close()
+    lru.unlink()
+    print("✓ Passed")
+
+    # Test 2: Size limits
+    print("\nTest 2: Oversized values and keys")
+    lru = SharedLRUCache(4, max_value_size=64, max_key_size=32, shards=1)
+    lru.put("a", b"x" * 10)
+    lru.put("a", b"x" * 100)          # too big: not cached, old value dropped
+    assert lru.get("a") == -1 and len(lru) == 0
+    try:
+        lru.put("k" * 100, 1)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    lru.put(("tuple", 1), [1, 2, 3])
+    assert lru.get(("tuple", 1)) == [1, 2, 3]
+    lru.put(1, "one")
+    assert lru.get(True) == "one" and lru.get(("tuple", True)) == [1, 2, 3]   # as in a dict
+    for bad in (1.0, frozenset({1}), None, ("ok", 2.5)):
+        try:
+            lru.put(bad, 1)
+            assert False, "expected TypeError"
+        except TypeError:
+            pass
+    check_structure(lru)
+    lru.close()
+    lru.unlink()
+    print("✓ Passed")
+
+    # Test 3: One shard is exactly LRUCache
+    print("\nTest 3: Randomized against LRUCache")
+    rng = random.Random(0)
+    for capacity in (1, 3, 50):
+        reference, shared = LRUCache(capacity), SharedLRUCache(capacity, shards=1)
+        for _ in range(10_000):
+            k = rng.randrange(3 * capacity + 1)
+            if rng.random() < 0.5:
+                assert shared.get(k) == reference.get(k)
+            else:
+                v = rng.random()
+                shared.put(k, v)
+                reference.put(k, v)
+        check_structure(shared)
+        shared.close()
+        shared.unlink()
+    print("✓ Passed")
+
+    # Test 4: Several processes hammering the same cache
+    print("\nTest 4: Concurrent processes")
+    for method in ("fork", "spawn"):
+        if method not in multiprocessing.get_all_start_methods():
+            continue
+        context = multiprocessing.get_context(method)
+        shared = SharedLRUCache(100, shards=4, context=context)
+        procs = [context.Process(target=_hammer, args=(shared, seed, 5_000)) for seed in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        assert all(p.exitcode == 0 for p in procs)
+        assert len(shared) == 100
+        check_structure(shared)
+        for k in range(200):
+            assert shared.get(k) in (-1, ("v", k))
+        shared.close()
+        shared.unlink()
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
@@ -0,0 +1,326 @@
+"""
+Algorithm: Two-tier LRU Cache (memory LRU + append-only disk spill log)
+Time Complexity: O(1) per get / put (+ one disk read or append on a
+                 memory miss / eviction, compaction amortized O(1) per byte)
+Space Complexity: O(capacity) values in memory, O(disk entries) index in memory
+Category: Trees & Data Structures - Cache
+
+Description:
+    LRUCache drops whatever _remove_tail evicts, so a working set larger
+    than memory is recomputed over and over. TieredLRUCache demotes evicted
+    entries to a local disk tier instead:
+
+        get(key):  memory hit -> as LRUCache
+                   disk hit   -> read, remove from disk, insert in memory
+                                 (which demotes the memory LRU entry)
+                   else -1
+        evict:     append (pickled) value to the log, index key -> offset
+
+    SpillLog is the disk tier: one append-only file plus an in-memory index
+    key -> (offset, length). Overwriting or promoting an entry only leaves
+    its old bytes behind as garbage; when garbage exceeds compact_ratio of
+    the file, compaction copies the live records to a new file and swaps it
+    in. Every compaction reclaims at least half the file at the default
+    ratio, so its cost is amortized O(1) per appended byte.
+
+    Disk entries are kept in demotion order (dict insertion order) and a
+    promotion removes the entry, so when max_entries is exceeded dropping
+    the oldest demotion drops the least recently used entry: together the
+    two tiers behave exactly like one LRUCache(capacity + max_entries),
+    with only `capacity` values in RAM. Values must be picklable (or pass
+    dumps / loads).
+
+    The log is a cache, not a database: it is truncated when opened and
+    nothing is fsync'ed.
+
+Use Cases:
+    - Working sets several times larger than RAM with expensive misses
+      (rendered pages, model outputs, query results)
+    - Local disk in front of a slow remote store
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (two-level variation)
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+from LRU_cache import LRUCache
+
+_MISSING = object()
+
+
+class SpillLog:
+    def __init__(self, path, max_entries=None, compact_ratio=0.5, min_compact_bytes=1 << 20,
+                 dumps=pickle.dumps, loads=pickle.loads):
+        """
+        Args:
+            path: Log file (created / truncated)
+            max_entries: Drop the oldest entries beyond this many (None = no limit)
+            compact_ratio: Compact when garbage bytes exceed this fraction of the file
+            min_compact_bytes: Never compact files smaller than this
+            dumps, loads: Value serialization
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.compact_ratio = compact_ratio
+        self.min_compact_bytes = min_compact_bytes
+        self.dumps = dumps
+        self.loads = loads
+        self.file = open(path, "w+b")
+        self.index = {}   # key -> (offset, length), oldest write first
+        self.size = 0     # bytes in the file
+        self.garbage = 0  # bytes no index entry points at
+        self.compactions = 0
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def write(self, key, value):
+        """
+        Append value for key, replacing any older copy
+
+        Time: O(len(serialized value)) amortized
+        """
+        self.discard(key)
+        data = self.dumps(value)
+        self.file.seek(self.size)
+        self.file.write(data)
+        self.index[key] = (self.size, len(data))
+        self.size += len(data)
+        if self.max_entries is not None and len(self.index) > self.max_entries:
+            self.discard(next(iter(self.index)))   # oldest demotion
+        self._maybe_compact()
+
+    def pop(self, key, default=None):
+        """
+        Read and remove the value for key
+
+        Returns: The value, default if key is not on disk
+        """
+        entry = self.index.pop(key, None)
+        if entry is None:
+            return default
+        offset, length = entry
+        self.garbage += length
+        self.file.seek(offset)
+        value = self.loads(self.file.read(length))
+        self._maybe_compact()
+        return value
+
+    def discard(self, key):
+        """Forget key's record (its bytes become garbage)"""
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self.garbage += entry[1]
+
+    def _maybe_compact(self):
+        if self.size >= self.min_compact_bytes and self.garbage > self.compact_ratio * self.size:
+            self.compact()
+
+    def compact(self):
+        """
+        Copy live records to a fresh file in index order and swap it in
+
+        Time: O(live bytes)
+        """
+        tmp_path = self.path + ".compact"
+        offset = 0
+        with open(tmp_path, "wb") as out:
+            for key, (old_offset, length) in self.index.items():
+                self.file.seek(old_offset)
+                out.write(self.file.read(length))
+                self.index[key] = (offset, length)   # same keys: safe while iterating
+                offset += length
+        self.file.close()
+        os.replace(tmp_path, self.path)
+        self.file = open(self.path, "r+b")
+        self.size, self.garbage = offset, 0
+        self.compactions += 1
+
+    def close(self):
+        self.file.close()
+
+
+class TieredLRUCache(LRUCache):
+    def __init__(self, capacity, path=None, disk_capacity=None, **log_options):
+        """
+        Args:
+            capacity: Entries kept in memory (>= 1)
+            path: Spill log file (None = a temporary file removed by close())
+            disk_capacity: Entries kept on disk (None = unbounded)
+            log_options: Passed to SpillLog (compact_ratio, dumps, loads, ...)
+        """
+        super().__init__(capacity)
+        self.tmp_dir = None
+        if path is None:
+            self.tmp_dir = tempfile.mkdtemp(prefix="tiered-lru-")
+            path = os.path.join(self.tmp_dir, "spill.log")
+        self.disk = SpillLog(path, max_entries=disk_capacity, **log_options)
+        self.counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "demotions": 0}
+
+    def __len__(self):
+        return len(self.cache) + len(self.disk)
+
+    def _remove_tail(self):
+        """Evict the memory LRU entry to disk instead of dropping it"""
+        node = super()._remove_tail()
+        self.disk.write(node.key, node.value)
+        self.counts["demotions"] += 1
+        return node
+
+    def get(self, key):
+        """
+        Value for key from memory or disk (promoting it), -1 if absent
+
+        Time: O(1) + one disk read on a disk hit
+        """
+        if key in self.cache:
+            self.counts["memory_hits"] += 1
+            return super().get(key)
+        value = self.disk.pop(key, _MISSING)
+        if value is _MISSING:
+            self.counts["misses"] += 1
+            return -1
+        self.counts["disk_hits"] += 1
+        super().put(key, value)
+        return value
+
+    def put(self, key, value) -> None:
+        """
+        Add or update key-value pair in memory (a disk copy is now stale)
+
+        Time: O(1) + one disk append if an entry is demoted
+        """
+        if key not in self.cache:
+            self.disk.discard(key)
+        super().put(key, value)
+
+    def close(self):
+        """Close the log; a temporary log is deleted"""
+        self.disk.close()
+        if self.tmp_dir is not None:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark(num_keys=20_000, capacity=2_000, requests=100_000, value_size=4096, seed=37):
+    """
+    Zipf-like trace over a working set 10x the memory tier: recomputes and
+    wall time of LRUCache vs TieredLRUCache when a miss costs a real
+    computation (iterated SHA-256 producing a value_size value)
+    """
+    import hashlib
+    import random
+    import time
+
+    rng = random.Random(seed)
+    trace = [int(num_keys ** rng.random() ** 1.3) for _ in range(requests)]
+
+    def compute(key):
+        digest = key.to_bytes(8, "little")
+        for _ in range(300):
+            digest = hashlib.sha256(digest).digest()
+        return digest * (value_size // len(digest))
+
+    print(f"\nBenchmark: {requests:,} Zipf-like requests over {num_keys:,} keys, "
+          f"{capacity:,} in memory, {value_size:,} B values")
+    for name, cache in (("LRUCache", LRUCache(capacity)),
+                        ("TieredLRUCache", TieredLRUCache(capacity))):
+        recomputes = 0
+        start = time.perf_counter()
+        for key in trace:
+            if cache.get(key) == -1:
+                recomputes += 1
+                cache.put(key, compute(key))
+        elapsed = time.perf_counter() - start
+        line = f"  {name:<15} recomputes {recomputes:>7,}  {elapsed:6.2f}s"
+        if isinstance(cache, TieredLRUCache):
+            line += (f"  (disk hits {cache.counts['disk_hits']:,}, log {cache.disk.size / 2**20:.0f} MB, "
+                     f"{cache.disk.compactions} compactions)")
+            cache.close()
+        print(line)
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    # Test 1: Evicted entries are demoted and promoted back
+    print("Test 1: Demotion and promotion")
+    with TieredLRUCache(2) as cache:
+        cache.put(1, "one")
+        cache.put(2, "two")
+        cache.put(3, "three")                  # demotes 1
+        assert 1 not in cache.cache and 1 in cache.disk
+        assert cache.get(1) == "one"           # promoted, demotes 2
+        assert 1 in cache.cache and 1 not in cache.disk and 2 in cache.disk
+        assert cache.get(2) == "two" and cache.get(4) == -1
+        assert len(cache) == 3
+        assert cache.counts == {"memory_hits": 0, "disk_hits": 2, "misses": 1, "demotions": 3}
+    print("✓ Passed")
+
+    # Test 2: Updates never resurrect a stale disk copy
+    print("\nTest 2: Stale disk copies")
+    with TieredLRUCache(1) as cache:
+        cache.put("k", [1])
+        cache.put("x", 0)                      # "k" -> disk
+        cache.put("k", [2])                    # new value in memory, disk copy dropped
+        assert "k" not in cache.disk
+        cache.put("y", 0)                      # "k" -> disk again, with [2]
+        assert cache.get("k") == [2]
+        cache.put("z", -1)                     # values are stored as-is, even -1
+        assert cache.get("z") == -1 and "z" in cache.cache
+    print("✓ Passed")
+
+    # Test 3: Both tiers together are exactly LRUCache(capacity + disk_capacity)
+    print("\nTest 3: Randomized against one big LRUCache")
+    rng = random.Random(0)
+    for capacity, disk_capacity in ((1, 1), (3, 5), (10, 40)):
+        reference = LRUCache(capacity + disk_capacity)
+        with TieredLRUCache(capacity, disk_capacity=disk_capacity, min_compact_bytes=256) as tiered:
+            for _ in range(20_000):
+                k = rng.randrange(2 * (capacity + disk_capacity))
+                if rng.random() < 0.5:
+                    assert tiered.get(k) == reference.get(k)
+                else:
+                    v = rng.random()
+                    tiered.put(k, v)
+                    reference.put(k, v)
+                assert len(tiered.cache) <= capacity and len(tiered.disk) <= disk_capacity
+            assert tiered.disk.compactions > 0
+    print("✓ Passed")
+
+    # Test 4: Compaction bounds the file and keeps values
+    print("\nTest 4: Compaction")
+    with TieredLRUCache(10, min_compact_bytes=4096) as cache:
+        for i in range(20_000):
+            k = i % 100
+            if cache.get(k) == -1 or i % 7 == 0:
+                cache.put(k, (k, i, "x" * 50))
+        log = cache.disk
+        assert log.compactions > 0
+        log.file.flush()
+        assert log.size == os.path.getsize(log.path)
+        assert log.garbage <= log.compact_ratio * log.size or log.size < log.min_compact_bytes
+        live = sum(length for _, length in log.index.values())
+        assert log.size - log.garbage == live
+        for k in range(100):
+            assert cache.get(k)[0] == k
+        path = log.path
+    assert not os.path.exists(path)            # temporary log removed
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()
@@ -0,0 +1,319 @@
+"""
+Algorithm: Weighted LRU Cache with TTL (byte budget + timing wheel expiry)
+Time Complexity: O(1) for get and put (amortized for evictions / sweeping)
+Space Complexity: O(entries)
+Category: Trees & Data Structures - Cache
+
+Description:
+    LRUCache limits the number of entries. When values range from 100 bytes
+    to 10 MB that limit says nothing about memory. Here every entry has a
+    weight = weigher(value) and the cache evicts from the LRU tail until the
+    total weight fits max_weight again. A value heavier than the whole budget
+    is not cached at all (it would flush everything and still not fit).
+
+    TTL: an entry put with ttl=t expires t seconds later.
+    - Lazy: get() of an expired entry removes it and reports a miss.
+    - Sweeping: entries nobody asks for again would sit in the budget until
+      LRU pushes them out, so expired entries are also collected in the
+      background. Entries are filed in a timing wheel: bucket
+      floor(expires_at / tick) -> set of nodes. Every bucket strictly before
+      the current one holds only expired entries, so sweeping is a cursor
+      walking buckets in order and dropping their nodes - no heap, no scan.
+      Each get/put does at most sweep_budget units of that work, which keeps
+      both O(1) amortized; sweep() runs it to completion (e.g. from a timer).
+
+Use Cases:
+    - HTTP / object caches with very different response sizes
+    - Caches of query results that must not be served stale
+    - Memory-bounded memoization of large values
+
+LeetCode Problems:
+    - Problem #146: LRU Cache (weighted + TTL variation)
+"""
+
+import sys
+import time
+
+from LRU_cache import LRUCache, Node
+
+
+class WeightedNode(Node):
+    """
+    Node that also carries its weight and absolute expiry time (None = never)
+    """
+    def __init__(self, key=0, value=0, weight=0, expires_at=None):
+        super().__init__(key, value)
+        self.weight = weight
+        self.expires_at = expires_at
+
+
+class WeightedLRUCache(LRUCache):
+    def __init__(self, max_weight, weigher=sys.getsizeof, ttl=None, tick=1.0,
+                 sweep_budget=8, clock=time.monotonic):
+        """
+        Args:
+            max_weight: Budget for the sum of weigher(value) over all entries
+            weigher: value -> non-negative weight (bytes by default)
+            ttl: Default time to live in seconds (None = entries never expire)
+            tick: Width of one timing wheel bucket in seconds
+            sweep_budget: Max sweep steps piggybacked on each get / put
+            clock: Monotonic time source (injectable for tests)
+        """
+        super().__init__(max_weight)   # capacity now means total weight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.tick = tick
+        self.sweep_budget = sweep_budget
+        self.clock = clock
+        self.total_weight = 0
+        self.wheel = {}       # bucket -> set of nodes expiring in it
+        self.cursor = None    # next bucket the sweeper looks at
+
+    def __len__(self):
+        return len(self.cache)
+
+    def _bucket(self, t):
+        return int(t // self.tick)
+
+    def _unlink(self, node):
+        """Remove node from list, dict, weight total and timing wheel"""
+        self._remove_node(node)
+        del self.cache[node.key]
+        self.total_weight -= node.weight
+        if node.expires_at is not None:
+            bucket = self.wheel.get(self._bucket(node.expires_at))
+            if bucket is not None:
+                bucket.discard(node)
+
+    def get(self, key):
+        """
+        Value for key, -1 if absent or expired
+
+        Time: O(1) amortized
+        """
+        now = self.clock()
+        self._sweep(now, self.sweep_budget)
+        node = self.cache.get(key)
+        if node is None:
+            return -1
+        if node.expires_at is not None and node.expires_at <= now:
+            self._unlink(node)
+            return -1
+        self._move_to_head(node)
+        return node.value
+
+    def put(self, key, value, ttl=None) -> None:
+        """
+        Add or update key-value pair, then evict LRU entries until the
+        total weight fits max_weight
+
+        Args:
+            ttl: Seconds to live for this entry (default: the cache's ttl)
+
+        Time: O(1) amortized - each entry is evicted at most once
+        """
+        now = self.clock()
+        self._sweep(now, self.sweep_budget)
+        if key in self.cache:
+            self._unlink(self.cache[key])
+
+        weight = self.weigher(value)
+        if weight > self.capacity:
+            return   # can never fit; the stale old value is gone too
+        ttl = self.ttl if ttl is None else ttl
+        node = WeightedNode(key, value, weight, now + ttl if ttl is not None else None)
+        self._add_to_head(node)
+        self.cache[key] = node
+        self.total_weight += weight
+        if node.expires_at is not None:
+            bucket = self._bucket(node.expires_at)
+            self.wheel.setdefault(bucket, set()).add(node)
+            if self.cursor is None or bucket < self.cursor:
+                self.cursor = bucket
+
+        while self.total_weight > self.capacity:
+            self._unlink(self.tail.prev)
+
+    def sweep(self):
+        """
+        Drop every entry whose bucket is entirely in the past
+
+        Returns: Number of entries removed
+        """
+        return self._sweep(self.clock(), None)
+
+    def _sweep(self, now, budget):
+        """
+        Advance the wheel cursor up to the current bucket, spending at most
+        budget steps (one per removed node or visited bucket)
+
+        Returns: Number of entries removed
+        """
+        if self.cursor is None:
+            return 0
+        current = self._bucket(now)
+        removed = 0
+        while self.cursor < current and (budget is None or budget > 0):
+            if budget is not None:
+                budget -= 1
+            bucket = self.wheel.get(self.cursor)
+            if not bucket:
+                self.wheel.pop(self.cursor, None)
+                if not self.wheel:
+                    self.cursor = None   # nothing scheduled, skip the gap
+                    break
+                self.cursor += 1
+                continue
+            node = bucket.pop()
+            if self.cache.get(node.key) is node:
+                node.expires_at = None   # already leaving its bucket
+                self._unlink(node)
+                removed += 1
+        return removed
+
+
+def benchmark(ops=200_000, seed=19):
+    """
+    get/put ops/s of LRUCache vs WeightedLRUCache (with and without TTL) at
+    two cache sizes: flat numbers show both stay O(1)
+    """
+    import random
+
+    rng = random.Random(seed)
+    print(f"\nBenchmark: {ops:,} mixed get/put ops")
+    for entries in (10_000, 500_000):
+        keys = [rng.randrange(entries * 2) for _ in range(ops)]
+        for name, make in (("LRUCache", lambda: LRUCache(entries)),
+                           ("WeightedLRUCache", lambda: WeightedLRUCache(entries, weigher=lambda v: 1)),
+                           ("WeightedLRUCache + ttl", lambda: WeightedLRUCache(entries, weigher=lambda v: 1, ttl=0.05))):
+            cache = make()
+            for k in range(entries):
+                cache.put(k, k)
+            start = time.perf_counter()
+            for i, k in enumerate(keys):
+                if i & 1:
+                    cache.get(k)
+                else:
+                    cache.put(k, k)
+            elapsed = time.perf_counter() - start
+            print(f"  {entries:>8,} entries  {name:<24} {ops / elapsed:>12,.0f} ops/s")
+
+
+# Test cases
+if __name__ == "__main__":
+    class FakeClock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    # Test 1: Evicts by weight, not by count
+    print("Test 1: Weight budget")
+    cache = WeightedLRUCache(100, weigher=len)
+    cache.put("a", "x" * 40)
+    cache.put("b", "x" * 40)
+    assert cache.get("a") == "x" * 40          # a is now MRU
+    cache.put("c", "x" * 30)                   # 110 > 100: evict b
+    assert cache.get("b") == -1
+    assert cache.total_weight == 70
+    cache.put("d", "x" * 5)
+    assert len(cache) == 3 and cache.total_weight == 75
+    print("✓ Passed")
+
+    # Test 2: Updates re-weigh, oversized values are not cached
+    print("\nTest 2: Updates and oversized values")
+    cache.put("a", "x" * 10)
+    assert cache.total_weight == 45
+    cache.put("huge", "x" * 101)
+    assert cache.get("huge") == -1 and cache.total_weight == 45
+    cache.put("a", "x" * 500)                  # replacement too big: old value dropped
+    assert cache.get("a") == -1 and cache.total_weight == 35
+    cache.put("e", "x" * 100)                  # exactly the budget: flushes everything else
+    assert len(cache) == 1 and cache.total_weight == 100
+    print("✓ Passed")
+
+    # Test 3: Lazy TTL expiry on get
+    print("\nTest 3: TTL expiry on get")
+    clock = FakeClock()
+    cache = WeightedLRUCache(10, weigher=lambda v: 1, ttl=5, clock=clock)
+    cache.put(1, "one")
+    cache.put(2, "two", ttl=100)
+    cache.put(3, "three", ttl=0.5)
+    clock.now = 4.9
+    assert cache.get(1) == "one"
+    clock.now = 5.0
+    assert cache.get(1) == -1
+    assert cache.get(2) == "two"
+    assert cache.get(3) == -1
+    print("✓ Passed")
+
+    # Test 4: Sweeping frees the budget without anybody calling get
+    print("\nTest 4: Background sweeping")
+    clock = FakeClock()
+    cache = WeightedLRUCache(1000, weigher=lambda v: 1, tick=1.0, sweep_budget=4, clock=clock)
+    for k in range(300):
+        cache.put(k, k, ttl=1 + k % 10)
+    cache.put("forever", 1)
+    clock.now = 20
+    for _ in range(100):                       # piggybacked sweeping, 4 steps per op
+        cache.get("forever")
+    assert len(cache) == 1 and cache.total_weight == 1
+    assert cache.wheel == {} and cache.cursor is None
+    cache.put("x", 1, ttl=3)
+    clock.now = 30
+    assert cache.sweep() == 1
+    assert len(cache) == 1
+    print("✓ Passed")
+
+    # Test 5: Without TTL it is exactly a weighted LRU
+    print("\nTest 5: Randomized against a weighted LRU model")
+    import random
+    rng = random.Random(0)
+    cache = WeightedLRUCache(50, weigher=lambda v: v)
+    model = []   # [key, value] ordered MRU first
+    for _ in range(20_000):
+        k = rng.randrange(30)
+        if rng.random() < 0.5:
+            hit = next((e for e in model if e[0] == k), None)
+            assert cache.get(k) == (hit[1] if hit else -1)
+            if hit:
+                model.remove(hit)
+                model.insert(0, hit)
+        else:
+            v = rng.randint(1, 20)
+            cache.put(k, v)
+            model = [e for e in model if e[0] != k]
+            model.insert(0, [k, v])
+            while sum(e[1] for e in model) > 50:
+                model.pop()
+        order, node = [], cache.head.next
+        while node is not cache.tail:
+            order.append(node.key)
+            node = node.next
+        assert order == [e[0] for e in model]
+    print("✓ Passed")
+
+    # Test 6: With TTL, never serve an expired or stale value
+    print("\nTest 6: Randomized TTL safety")
+    clock = FakeClock()
+    cache = WeightedLRUCache(50, weigher=lambda v: v[1], tick=0.5, sweep_budget=2, clock=clock)
+    latest = {}
+    for i in range(20_000):
+        clock.now += rng.random() * 0.1
+        k = rng.randrange(30)
+        if rng.random() < 0.5:
+            got = cache.get(k)
+            if got != -1:
+                assert got == latest[k][0] and (latest[k][1] is None or latest[k][1] > clock.now)
+        else:
+            ttl = rng.choice([None, 0.3, 2.0])
+            value = (i, rng.randint(1, 20))
+            cache.put(k, value, ttl=ttl)
+            latest[k] = (value, clock.now + ttl if ttl is not None else None)
+        assert cache.total_weight == sum(n.weight for n in cache.cache.values()) <= 50
+    print("✓ Passed")
+
+    print("\n✅ All tests passed!")
+
+    benchmark()